@@ -1,10 +1,19 @@
-import pygame
+import os
+
+# Project root (the directory containing src/)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 # Screen Configuration
 SCREEN_WIDTH = 480
 SCREEN_HEIGHT = 320
 FPS = 60
 
+# Power Saving
+IDLE_WAIT_MS = 1000        # Max sleep between frames on static screens
+IDLE_DIM_TIMEOUT = 120     # Seconds without input before dimming (0 = never)
+IDLE_BLANK_TIMEOUT = 300   # Seconds without input before blanking (0 = never)
+IDLE_DIM_LEVEL = 20        # Backlight percent while dimmed
+
 # Colors (Military/Terminal Palette)
 BLACK = (10, 10, 10)          # Deep black
 MILITARY_GREEN = (50, 205, 50) # Standard terminal green
@@ -15,13 +24,82 @@ WHITE = (240, 240, 240)       # High contrast white
 GRAY = (100, 100, 100)        # Disabled/Inactive
 
 # Fonts
-FONT_MAIN = None # Default system font for now, can load custom TTF later
+FONT_MAIN = None # Path to a custom TTF file, or None for the default pygame font
 FONT_SIZE_HEADER = 40
 FONT_SIZE_NORMAL = 24
 FONT_SIZE_SMALL = 18
 
+# Settings file (override with the AIRSOFT_BOMB_SETTINGS environment variable)
+SETTINGS_FILE = os.environ.get('AIRSOFT_BOMB_SETTINGS', os.path.join(BASE_DIR, 'bomb_settings.json'))
+SETTINGS_SAVE_DELAY = 1.0  # Seconds without changes before a save hits the disk
+
+# Match results database (override with the AIRSOFT_BOMB_RESULTS environment variable)
+RESULTS_DB = os.environ.get('AIRSOFT_BOMB_RESULTS', os.path.join(BASE_DIR, 'bomb_results.db'))
+RESULTS_MAX_ROWS = 10000    # Oldest games are dropped beyond this many
+RESULTS_WRITE_DELAY = 2.0   # Seconds games are batched before being written
+
+# Countdown beep curve: 'stepped' (1s, 0.5s below 20s, 0.2s below 10s),
+# 'accelerating' (continuously from 1s down to 0.1s) or 'constant'
+COUNTDOWN_BEEP_CURVE = 'stepped'
+
+# Sound
+SOUND_FREQUENCY = 22050
+SOUND_BUFFER = 256  # Samples per mixer buffer (~12 ms at 22 kHz)
+SOUNDS_DIR = os.path.join(BASE_DIR, 'assets', 'sounds')
+# Sound files loaded at startup: name -> (file in SOUNDS_DIR, channel),
+# e.g. {'ambience': ('ambience.ogg', 2)}. Beeps and alarms are synthesized.
+SOUND_FILES = {}
+
 # Hardware Configuration
 PIN_BUTTON_UP = 17
 PIN_BUTTON_DOWN = 27
 PIN_BUTTON_SELECT = 22
 PIN_BUTTON_BACK = 23
+GPIO_BOUNCE_TIME = 0.02  # Seconds
+
+# Physical key name of each GPIO button (mapped to actions by the keymaps)
+GPIO_BUTTONS = {
+    'BTN_UP': PIN_BUTTON_UP,
+    'BTN_DOWN': PIN_BUTTON_DOWN,
+    'BTN_SELECT': PIN_BUTTON_SELECT,
+    'BTN_BACK': PIN_BUTTON_BACK,
+}
+
+# NFC Reader (RC522 on SPI)
+NFC_POLL_INTERVAL = 0.1  # Seconds between reads
+NFC_REMOVE_TIME = 0.5    # A card must be absent this long before it can tap again
+NFC_VALID_CARDS = ['1234', '5678']
+
+# Input Timing (seconds)
+LONG_PRESS_TIME = 1.0
+KEY_REPEAT_DELAY = 0.5
+KEY_REPEAT_INTERVAL = 0.1
+
+# Multi-bomb sync (UDP multicast, enabled with --sync)
+SYNC_GROUP = '239.255.42.99'
+SYNC_PORT = 5007
+SYNC_INTERFACE = '0.0.0.0'  # Local address of the interface to use (0.0.0.0 = default route)
+SYNC_TTL = 1                # Multicast hops; 1 keeps packets on the local network
+SYNC_RATE = 10              # State packets per second while something changes
+SYNC_KEYFRAME_INTERVAL = 1.0  # Seconds between full-state packets
+SYNC_PEER_TIMEOUT = 3.0     # A bomb not heard from this long is dropped
+SYNC_BOMB_ID = None         # Number this bomb is shown as on the others (None = random per start)
+SYNC_MAX_PEERS_SHOWN = 3
+
+# Referee dashboard (HTTP + Server-Sent Events, enabled with --dashboard)
+DASHBOARD_HOST = '0.0.0.0'
+DASHBOARD_PORT = 8080
+DASHBOARD_PUSH_INTERVAL = 0.25  # Seconds between pushed updates
+DASHBOARD_MAX_CLIENTS = 8
+
+# Direct framebuffer output without X (enabled with --framebuffer)
+FRAMEBUFFER_DEVICE = '/dev/fb0'
+
+# ILI9486 SPI panel (enabled with --spi-display)
+SPI_DISPLAY_BUS = 0
+SPI_DISPLAY_DEVICE = 1          # CE1; the NFC reader is on CE0
+SPI_DISPLAY_SPEED_HZ = 32000000
+SPI_DISPLAY_PIN_DC = 24
+SPI_DISPLAY_PIN_RESET = 25      # None if the reset line is not wired
+SPI_DISPLAY_MADCTL = 0x28       # Landscape (row/column exchange), BGR panel
+SPI_DISPLAY_MAX_TRANSFER = 65536  # Bytes per SPI transfer (see spidev bufsiz)
@@ -0,0 +1,80 @@
+"""
+Display backlight control.
+Uses the Linux backlight class (/sys/class/backlight) when the panel
+exposes one; otherwise blanking falls back to painting the screen black
+and presenting it on `display` (pygame.display or a FramebufferDisplay).
+"""
+import glob
+import os
+import pygame
+from src import config
+
+BACKLIGHT_GLOB = "/sys/class/backlight/*"
+
+
+class Backlight:
+    def __init__(self, screen, path=None, display=None):
+        self.screen = screen
+        self.display = display if display is not None else pygame.display
+        self.path = path if path is not None else self._find_backlight()
+        self.max_brightness = self._read_int("max_brightness") if self.path else None
+        self.level = 100  # percent
+        self.blanked = False
+        if self.path is None:
+            print("[BACKLIGHT] No backlight device found, using software blanking")
+
+    def _find_backlight(self):
+        devices = sorted(glob.glob(BACKLIGHT_GLOB))
+        return devices[0] if devices else None
+
+    def _read_int(self, name):
+        try:
+            with open(os.path.join(self.path, name), 'r') as f:
+                return int(f.read().strip())
+        except (OSError, ValueError) as e:
+            print(f"[BACKLIGHT] Error reading {name}: {e}")
+            return None
+
+    def _write(self, name, value):
+        try:
+            with open(os.path.join(self.path, name), 'w') as f:
+                f.write(str(value))
+            return True
+        except OSError as e:
+            print(f"[BACKLIGHT] Error writing {name}: {e}")
+            return False
+
+    @property
+    def available(self):
+        return self.path is not None and self.max_brightness
+
+    def set_level(self, percent):
+        """Set the backlight level in percent (0-100)"""
+        self.level = max(0, min(100, percent))
+        if self.available:
+            self._write("brightness", int(self.max_brightness * self.level / 100))
+
+    def dim(self, percent=None):
+        """Lower the backlight while idle"""
+        if percent is None:
+            percent = config.IDLE_DIM_LEVEL
+        if self.available:
+            self._write("brightness", int(self.max_brightness * min(percent, self.level) / 100))
+
+    def blank(self):
+        """Turn the display off"""
+        self.blanked = True
+        if self.available:
+            self._write("bl_power", 4)  # FB_BLANK_POWERDOWN
+            self._write("brightness", 0)
+        else:
+            self.screen.fill((0, 0, 0))
+            self.display.flip()
+
+    def restore(self):
+        """Return to the normal level after dimming or blanking"""
+        if self.available:
+            if self.blanked:
+                self._write("bl_power", 0)  # FB_BLANK_UNBLANK
+            self._write("brightness", int(self.max_brightness * self.level / 100))
+        self.blanked = False
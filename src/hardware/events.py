@@ -0,0 +1,48 @@
+"""
+Input events passed from the hardware layer to the views.
+"""
+import time
+import pygame
+
+# Event kinds
+PRESS = "PRESS"
+RELEASE = "RELEASE"
+
+# Posted to the pygame queue by background input threads so a main loop
+# blocked in pygame.event.wait wakes up immediately
+HARDWARE_EVENT = pygame.event.custom_type()
+
+
+class Action(str):
+    """
+    An abstract input action ('UP', 'SELECT', '5', ...).
+
+    Compares equal to its name, so views keep matching plain strings, and
+    additionally carries the monotonic time it was captured at, its kind
+    (press or release) and its source ('keyboard', 'gpio', ...).
+    """
+    def __new__(cls, name, timestamp=None, kind=PRESS, source="keyboard", data=None):
+        action = super().__new__(cls, name)
+        action.timestamp = time.monotonic() if timestamp is None else timestamp
+        action.kind = kind
+        action.source = source
+        action.data = data
+        return action
+
+    @property
+    def name(self):
+        return str(self)
+
+
+def release_name(name):
+    """Name of the action sent when the key or button bound to name is released"""
+    return f"{name}_RELEASED"
+
+
+def wake_main_loop():
+    """Wake a main loop blocked in pygame.event.wait (safe from any thread)"""
+    try:
+        pygame.event.post(pygame.event.Event(HARDWARE_EVENT))
+    except pygame.error:
+        # Display not initialized (headless runs); nothing is waiting
+        pass
@@ -0,0 +1,162 @@
+"""
+Direct Linux framebuffer output.
+Replaces pygame.display on the Pi when running without X: frames are
+composed on an ordinary pygame surface as usual, and update()/flip()
+convert the damaged rectangles to the framebuffer's native pixel format
+(read from the device with the FBIOGET_*SCREENINFO ioctls) and write
+them into the mmap'd /dev/fbN. Only rows whose pixels actually changed
+are written to the device.
+
+    display = FramebufferDisplay(screen, "/dev/fb1")
+    display.update(dirty_rects)   # same interface as pygame.display
+
+Any regular file of the right size works in place of the device (its
+geometry is given explicitly), so the output can be checked without a
+framebuffer:
+
+    display = FramebufferDisplay(screen, "/tmp/fb.raw", bits_per_pixel=16)
+"""
+import fcntl
+import mmap
+import os
+import stat
+import struct
+
+import pygame
+from src import config
+
+FBIOGET_VSCREENINFO = 0x4600
+FBIOGET_FSCREENINFO = 0x4602
+
+# struct fb_var_screeninfo up to the transp bitfield: xres, yres,
+# xres_virtual, yres_virtual, xoffset, yoffset, bits_per_pixel,
+# grayscale, then (offset, length, msb_right) for red, green, blue, transp
+_VAR_INFO = struct.Struct("=8I12I")
+_VAR_INFO_SIZE = 160
+# struct fb_fix_screeninfo up to line_length (native alignment: smem_start
+# is an unsigned long)
+_FIX_INFO = struct.Struct("@16sLIIIIHHHI")
+_FIX_INFO_SIZE = 128
+
+# Channel masks of a regular file with no device to ask
+DEFAULT_MASKS = {
+    16: (0xF800, 0x07E0, 0x001F, 0),
+    24: (0xFF0000, 0x00FF00, 0x0000FF, 0),
+    32: (0xFF0000, 0x00FF00, 0x0000FF, 0),
+}
+
+
+def _mask(offset, length):
+    return ((1 << length) - 1) << offset
+
+
+def read_screen_info(fd):
+    """(xres, yres, bits_per_pixel, line_length, xoffset, yoffset, masks) of a framebuffer device"""
+    var = bytearray(_VAR_INFO_SIZE)
+    fcntl.ioctl(fd, FBIOGET_VSCREENINFO, var)
+    fix = bytearray(_FIX_INFO_SIZE)
+    fcntl.ioctl(fd, FBIOGET_FSCREENINFO, fix)
+    values = _VAR_INFO.unpack_from(var)
+    xres, yres, _, _, xoffset, yoffset, bpp, _ = values[:8]
+    fields = values[8:]
+    masks = tuple(_mask(fields[i], fields[i + 1]) for i in range(0, 12, 3))
+    line_length = _FIX_INFO.unpack_from(fix)[-1]
+    return xres, yres, bpp, line_length, xoffset, yoffset, masks
+
+
+class FramebufferDisplay:
+    def __init__(self, screen, device=None, bits_per_pixel=None, stride=None, masks=None):
+        self.screen = screen
+        self.device = device if device is not None else config.FRAMEBUFFER_DEVICE
+        width, height = screen.get_size()
+
+        fd = os.open(self.device, os.O_RDWR)
+        try:
+            if stat.S_ISCHR(os.fstat(fd).st_mode):
+                xres, yres, bpp, line_length, xoffset, yoffset, fb_masks = read_screen_info(fd)
+                if xres < width or yres < height:
+                    raise ValueError(f"{self.device} is {xres}x{yres}, "
+                                     f"smaller than the {width}x{height} screen")
+                bits_per_pixel = bits_per_pixel or bpp
+                stride = stride or line_length
+                masks = masks or fb_masks
+            else:
+                # Plain file standing in for a device: the screen's size
+                # in the given (or 16-bit) format, no panning
+                bits_per_pixel = bits_per_pixel or 16
+                xoffset = yoffset = 0
+            if bits_per_pixel not in DEFAULT_MASKS:
+                raise ValueError(f"{self.device}: unsupported {bits_per_pixel} bits per pixel")
+            self.bytes_per_pixel = bits_per_pixel // 8
+            self.stride = stride or width * self.bytes_per_pixel
+            masks = masks or DEFAULT_MASKS[bits_per_pixel]
+            # Top-left corner of the visible area
+            self.origin = yoffset * self.stride + xoffset * self.bytes_per_pixel
+            size = self.origin + (height - 1) * self.stride + width * self.bytes_per_pixel
+            if not stat.S_ISCHR(os.fstat(fd).st_mode) and os.fstat(fd).st_size < size:
+                raise ValueError(f"{self.device} is smaller than a {width}x{height} frame")
+            self.map = mmap.mmap(fd, size, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+        finally:
+            os.close(fd)
+
+        # The frame being written, converted to the native format, and a
+        # copy of what the framebuffer shows, to skip unchanged rows
+        flags = pygame.SRCALPHA if masks[3] else 0
+        self.native = pygame.Surface((width, height), flags, bits_per_pixel, masks)
+        self.pitch = self.native.get_pitch()
+        self._shown = bytearray(self.pitch * height)
+        self._shown_valid = False
+        self.rows_written = 0
+
+        print(f"[FRAMEBUFFER] {self.device}: {width}x{height}, {bits_per_pixel} bpp, "
+              f"stride {self.stride}")
+
+    def update(self, rects=None):
+        """Write the given rectangles of the screen (all of it if None) to the framebuffer"""
+        if self.map is None:
+            return
+        bounds = self.native.get_rect()
+        if rects is None or not self._shown_valid:
+            # The first frame replaces whatever the console left behind
+            rects = [bounds]
+        elif isinstance(rects, pygame.Rect):
+            rects = [rects]
+        for rect in rects:
+            if rect is None:
+                continue
+            rect = bounds.clip(rect)
+            if rect.width and rect.height:
+                self._write(rect)
+        self._shown_valid = True
+
+    def flip(self):
+        self.update()
+
+    def _write(self, rect):
+        self.native.blit(self.screen, rect, rect)
+        shown = self._shown
+        fb = self.map
+        left = rect.x * self.bytes_per_pixel
+        length = rect.width * self.bytes_per_pixel
+        # The buffer locks the surface, so it is only held while copying
+        with memoryview(self.native.get_buffer()) as pixels:
+            for y in range(rect.top, rect.bottom):
+                start = y * self.pitch + left
+                end = start + length
+                with pixels[start:end] as row:
+                    if self._shown_valid and shown[start:end] == row:
+                        continue
+                    shown[start:end] = row
+                    target = self.origin + y * self.stride + left
+                    fb[target:target + length] = row
+                self.rows_written += 1
+
+    def invalidate(self):
+        """Forget what the framebuffer shows (something else drew on it)"""
+        self._shown_valid = False
+
+    def close(self):
+        if self.map is None:
+            return
+        self.map.close()
+        self.map = None
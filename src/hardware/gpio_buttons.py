@@ -0,0 +1,75 @@
+"""
+Interrupt-driven GPIO button backend.
+Buttons are read with gpiozero edge callbacks (with debounce) on
+gpiozero's own thread. Every press and release is pushed, with the
+monotonic time of the edge, into a thread-safe queue that
+HardwareInterface.get_events drains once per frame and maps to actions
+like any other key, so input latency does not depend on the frame rate.
+
+Without a Raspberry Pi, pass mock=True (or set GPIOZERO_PIN_FACTORY=mock)
+and drive the pins from a test:
+
+    backend = GPIOButtonBackend(mock=True)
+    backend.pin_factory.pin(config.PIN_BUTTON_SELECT).drive_low()   # press
+    backend.pin_factory.pin(config.PIN_BUTTON_SELECT).drive_high()  # release
+"""
+import queue
+import time
+from functools import partial
+
+try:
+    from gpiozero import Button
+    GPIO_AVAILABLE = True
+except ImportError:
+    GPIO_AVAILABLE = False
+
+from src import config
+from src.hardware.events import PRESS, RELEASE, wake_main_loop
+
+
+class GPIOButtonBackend:
+    def __init__(self, pins=None, bounce_time=None, pin_factory=None, mock=False):
+        if not GPIO_AVAILABLE:
+            raise RuntimeError("gpiozero is not installed")
+        if pins is None:
+            pins = config.GPIO_BUTTONS
+        if bounce_time is None:
+            bounce_time = config.GPIO_BOUNCE_TIME
+        if mock and pin_factory is None:
+            from gpiozero.pins.mock import MockFactory
+            pin_factory = MockFactory()
+
+        self.pin_factory = pin_factory
+        self.queue = queue.Queue()
+        self.buttons = {}
+        try:
+            for name, pin in pins.items():
+                button = Button(pin, pull_up=True, bounce_time=bounce_time,
+                                pin_factory=pin_factory)
+                button.when_pressed = partial(self._on_edge, name, PRESS)
+                button.when_released = partial(self._on_edge, name, RELEASE)
+                self.buttons[name] = button
+        except Exception:
+            self.close()
+            raise
+
+    def _on_edge(self, name, kind):
+        # Runs on the gpiozero callback thread
+        self.queue.put((time.monotonic(), name, kind))
+        wake_main_loop()
+
+    def get_events(self):
+        """Drain the queued edges as (timestamp, key, kind, source), oldest first"""
+        events = []
+        while True:
+            try:
+                timestamp, name, kind = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            events.append((timestamp, name, kind, "gpio"))
+        return events
+
+    def close(self):
+        for button in self.buttons.values():
+            button.close()
+        self.buttons = {}
@@ -1,19 +1,39 @@
 import pygame
-try:
-    from gpiozero import Button
-    GPIO_AVAILABLE = True
-except ImportError:
-    GPIO_AVAILABLE = False
-    print("GPIO not available, running in MOCK mode.")
-
+import time
 from src import config
+from src.hardware.events import HARDWARE_EVENT, PRESS, RELEASE
+from src.hardware.keymap import ALLOWED_EVENTS, DEFAULT_KEYMAP, KEY_NAMES, InputMapper
+from src.hardware.gpio_buttons import GPIOButtonBackend, GPIO_AVAILABLE
+from src.hardware.nfc_reader import NFCReaderBackend, NFC_AVAILABLE
+
+if not GPIO_AVAILABLE:
+    print("GPIO not available, running in MOCK mode.")
+if not NFC_AVAILABLE:
+    print("NFC reader not available, cards can be simulated with keys.")
 
 class HardwareInterface:
-    def __init__(self):
-        self.buttons = {}
-        if GPIO_AVAILABLE:
-            # Initialize real buttons here if needed, or keep it simple for now
-            pass
+    def __init__(self, gpio_backend=None, nfc_backend=None):
+        self.gpio = gpio_backend
+        if self.gpio is None and GPIO_AVAILABLE:
+            try:
+                self.gpio = GPIOButtonBackend()
+            except Exception as e:
+                # gpiozero is installed but there is no usable pin factory
+                # (e.g. not running on a Pi)
+                print(f"[GPIO] Buttons unavailable ({e}), using keyboard only")
+        self.nfc = nfc_backend
+        if self.nfc is None and NFC_AVAILABLE:
+            try:
+                self.nfc = NFCReaderBackend()
+            except Exception as e:
+                # No SPI device or GPIO access
+                print(f"[NFC] Reader unavailable ({e})")
+        self.mapper = InputMapper()
+
+        # Keep mouse, window and other events out of the queue entirely
+        if pygame.display.get_init():
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(list(ALLOWED_EVENTS) + [HARDWARE_EVENT])
             
     def update(self):
         """
@@ -21,52 +41,44 @@ class HardwareInterface:
         """
         pass
 
-    def get_events(self, pygame_events):
+    def get_events(self, pygame_events, keymap=None):
         """
         Process pygame events and return abstract hardware events.
-        Returns a list of strings: 'UP', 'DOWN', 'SELECT', 'BACK', etc.
+        Keyboard keys and GPIO buttons are translated through keymap (the
+        keymap of the current view, DEFAULT_KEYMAP if None). Returns a list
+        of Actions (compare equal to strings: 'UP', 'DOWN', 'SELECT',
+        'BACK', '0'-'9', '<action>_RELEASED', ...), plus a 'CARD' Action
+        carrying the UID in .data for every NFC card tap, in time order.
         """
-        actions = []
-        
+        if keymap is None:
+            keymap = DEFAULT_KEYMAP
+
+        # Keyboard events are stamped when they are pumped
+        now = time.monotonic()
+        key_events = []
         for event in pygame_events:
-            if event.type == pygame.KEYDOWN:
-                # Navigation (Numpad 8/2/4/6)
-                if event.key == pygame.K_KP8 or event.key == pygame.K_UP:
-                    actions.append('UP')
-                elif event.key == pygame.K_KP2 or event.key == pygame.K_DOWN:
-                    actions.append('DOWN')
-                
-                # Select (Numpad 5, Enter)
-                elif event.key == pygame.K_KP5 or event.key == pygame.K_KP_ENTER or event.key == pygame.K_RETURN:
-                    actions.append('SELECT')
-                
-                # Back (Numpad -, ., or *)
-                elif event.key == pygame.K_KP_MINUS or event.key == pygame.K_KP_PERIOD or event.key == pygame.K_KP_MULTIPLY or event.key == pygame.K_BACKSPACE:
-                    actions.append('BACK')
-                
-                # Numeric Input (Numpad 0-9)
-                elif event.key == pygame.K_KP0: actions.append('0')
-                elif event.key == pygame.K_KP1: actions.append('1')
-                elif event.key == pygame.K_KP2: actions.append('2') # Note: 2 is also DOWN, context matters in UI
-                elif event.key == pygame.K_KP3: actions.append('3')
-                elif event.key == pygame.K_KP4: actions.append('4')
-                elif event.key == pygame.K_KP5: actions.append('5') # Note: 5 is also SELECT
-                elif event.key == pygame.K_KP6: actions.append('6')
-                elif event.key == pygame.K_KP7: actions.append('7')
-                elif event.key == pygame.K_KP8: actions.append('8') # Note: 8 is also UP
-                elif event.key == pygame.K_KP9: actions.append('9')
-                
-                # Standard Number keys (Fallback/Debug)
-                elif event.key == pygame.K_1: actions.append('1')
-                elif event.key == pygame.K_2: actions.append('2')
-                elif event.key == pygame.K_3: actions.append('3')
-                elif event.key == pygame.K_4: actions.append('4')
-                elif event.key == pygame.K_5: actions.append('5')
-                elif event.key == pygame.K_6: actions.append('6')
-                elif event.key == pygame.K_MINUS: actions.append('BACK')
+            if event.type == pygame.KEYDOWN or event.type == pygame.KEYUP:
+                key = KEY_NAMES.get(event.key)
+                if key is not None:
+                    kind = PRESS if event.type == pygame.KEYDOWN else RELEASE
+                    key_events.append((now, key, kind, "keyboard"))
 
+        if self.gpio:
+            key_events.extend(self.gpio.get_events())
+
+        actions = self.mapper.process(key_events, keymap)
+        actions.extend(self.mapper.poll(now, keymap))
+        if self.nfc:
+            actions.extend(self.nfc.get_events())
+            actions.sort(key=lambda action: action.timestamp)
         return actions
 
+    def has_held_keys(self):
+        """True while a held key may still produce long-press or repeat actions"""
+        return self.mapper.has_timers()
+
     def cleanup(self):
-        if GPIO_AVAILABLE:
-            pass
+        if self.gpio:
+            self.gpio.close()
+        if self.nfc:
+            self.nfc.close()
@@ -0,0 +1,167 @@
+"""
+Table-driven input mapping.
+Physical keys (keyboard keys and GPIO buttons) are translated to abstract
+actions through a Keymap declared by the current view, so the same key
+can mean different things in different contexts (numpad 5 is the digit
+'5' while typing a code but SELECT on a configuration screen).
+
+Keymaps support long-press actions, auto-repeat while a key is held,
+chords (several keys pressed together) and release events.
+"""
+import pygame
+from src import config
+from src.hardware.events import Action, PRESS, RELEASE, release_name
+
+# pygame key -> physical key name
+KEY_NAMES = {
+    pygame.K_KP0: 'KP0', pygame.K_KP1: 'KP1', pygame.K_KP2: 'KP2',
+    pygame.K_KP3: 'KP3', pygame.K_KP4: 'KP4', pygame.K_KP5: 'KP5',
+    pygame.K_KP6: 'KP6', pygame.K_KP7: 'KP7', pygame.K_KP8: 'KP8',
+    pygame.K_KP9: 'KP9',
+    pygame.K_KP_ENTER: 'KP_ENTER', pygame.K_KP_MINUS: 'KP_MINUS',
+    pygame.K_KP_PERIOD: 'KP_PERIOD', pygame.K_KP_MULTIPLY: 'KP_MULTIPLY',
+    pygame.K_0: '0', pygame.K_1: '1', pygame.K_2: '2', pygame.K_3: '3',
+    pygame.K_4: '4', pygame.K_5: '5', pygame.K_6: '6', pygame.K_7: '7',
+    pygame.K_8: '8', pygame.K_9: '9',
+    pygame.K_UP: 'ARROW_UP', pygame.K_DOWN: 'ARROW_DOWN',
+    pygame.K_RETURN: 'RETURN', pygame.K_BACKSPACE: 'BACKSPACE',
+    pygame.K_MINUS: 'MINUS',
+}
+
+# Only these pygame events can reach the input dispatch path
+ALLOWED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP)
+
+
+class Keymap:
+    """
+    Immutable key -> action table.
+
+    bindings: physical key -> action sent on press (and '<action>_RELEASED'
+              on release)
+    hold:     physical key -> action sent once the key has been held for
+              config.LONG_PRESS_TIME
+    chords:   tuple of physical keys -> action sent when all of them are down
+    repeat:   actions re-sent every config.KEY_REPEAT_INTERVAL while held
+    """
+    def __init__(self, bindings, hold=None, chords=None, repeat=()):
+        self.bindings = dict(bindings)
+        self.hold = dict(hold or {})
+        self.chords = {frozenset(keys): action for keys, action in (chords or {}).items()}
+        self.repeat = frozenset(repeat)
+
+    def extend(self, bindings=None, hold=None, chords=None, repeat=()):
+        """Return a new keymap with extra or overridden entries"""
+        keymap = Keymap(self.bindings, self.hold, repeat=self.repeat | frozenset(repeat))
+        keymap.chords = dict(self.chords)
+        keymap.bindings.update(bindings or {})
+        keymap.hold.update(hold or {})
+        for keys, action in (chords or {}).items():
+            keymap.chords[frozenset(keys)] = action
+        return keymap
+
+
+# Digits type digits, Enter selects, minus/period/star/backspace go back
+DEFAULT_KEYMAP = Keymap({
+    **{f'KP{d}': str(d) for d in range(10)},
+    **{str(d): str(d) for d in range(10)},
+    'KP_ENTER': 'SELECT', 'RETURN': 'SELECT',
+    'KP_MINUS': 'BACK', 'KP_PERIOD': 'BACK', 'KP_MULTIPLY': 'BACK',
+    'BACKSPACE': 'BACK', 'MINUS': 'BACK',
+    'ARROW_UP': 'UP', 'ARROW_DOWN': 'DOWN',
+    'BTN_UP': 'UP', 'BTN_DOWN': 'DOWN', 'BTN_SELECT': 'SELECT', 'BTN_BACK': 'BACK',
+})
+
+# Screens with a start/confirm button: 5 also means SELECT
+CONFIRM_KEYMAP = DEFAULT_KEYMAP.extend({'KP5': 'SELECT', '5': 'SELECT'})
+
+# Text entry: holding BACK keeps deleting
+EDIT_KEYMAP = DEFAULT_KEYMAP.extend(repeat=('BACK',))
+
+
+class _HeldKey:
+    __slots__ = ('action', 'pressed_at', 'hold_sent', 'next_repeat', 'consumed', 'source',
+                 'has_hold', 'repeats')
+
+    def __init__(self, action, pressed_at, next_repeat, source, has_hold=False, repeats=False):
+        self.action = action
+        self.pressed_at = pressed_at
+        self.hold_sent = False
+        self.next_repeat = next_repeat
+        self.consumed = False
+        self.source = source
+        # Whether the keymap it was pressed under gives it a long-press
+        # or repeat action
+        self.has_hold = has_hold
+        self.repeats = repeats
+
+
+class InputMapper:
+    """
+    Turns timestamped physical key events into Actions using the keymap of
+    the current context. Keeps track of held keys for long-press, repeat,
+    chord and release handling.
+    """
+    def __init__(self, long_press_time=None, repeat_delay=None, repeat_interval=None):
+        self.long_press_time = long_press_time if long_press_time is not None else config.LONG_PRESS_TIME
+        self.repeat_delay = repeat_delay if repeat_delay is not None else config.KEY_REPEAT_DELAY
+        self.repeat_interval = repeat_interval if repeat_interval is not None else config.KEY_REPEAT_INTERVAL
+        self.held = {}
+
+    def process(self, key_events, keymap):
+        """key_events: iterable of (timestamp, key, kind, source)"""
+        actions = []
+        for timestamp, key, kind, source in key_events:
+            if kind == PRESS:
+                self._press(timestamp, key, source, keymap, actions)
+            else:
+                self._release(timestamp, key, actions)
+        return actions
+
+    def _press(self, timestamp, key, source, keymap, actions):
+        if key in self.held:
+            return
+        action = keymap.bindings.get(key)
+        state = _HeldKey(action, timestamp, timestamp + self.repeat_delay, source,
+                         key in keymap.hold, action in keymap.repeat)
+        self.held[key] = state
+
+        if keymap.chords and len(self.held) > 1:
+            chord_action = keymap.chords.get(frozenset(self.held))
+            if chord_action:
+                # The keys of a chord do not produce their own releases
+                for held in self.held.values():
+                    held.consumed = True
+                actions.append(Action(chord_action, timestamp, PRESS, source))
+                return
+
+        if action:
+            actions.append(Action(action, timestamp, PRESS, source))
+
+    def _release(self, timestamp, key, actions):
+        state = self.held.pop(key, None)
+        if state and state.action and not state.consumed:
+            actions.append(Action(release_name(state.action), timestamp, RELEASE, state.source))
+
+    def poll(self, now, keymap):
+        """Long-press and repeat actions that became due by `now`"""
+        actions = []
+        for key, state in self.held.items():
+            if state.consumed:
+                continue
+            hold_action = keymap.hold.get(key)
+            if hold_action and not state.hold_sent and now - state.pressed_at >= self.long_press_time:
+                state.hold_sent = True
+                actions.append(Action(hold_action, state.pressed_at + self.long_press_time, PRESS, state.source))
+            if state.action in keymap.repeat and now >= state.next_repeat:
+                # At most one repeat per poll, so a stalled frame does not
+                # deliver a burst of them
+                actions.append(Action(state.action, state.next_repeat, PRESS, state.source))
+                state.next_repeat += self.repeat_interval
+                if state.next_repeat <= now:
+                    state.next_repeat = now + self.repeat_interval
+        return actions
+
+    def has_timers(self):
+        """True while a held key may still produce long-press or repeat actions"""
+        return any(not state.consumed and (state.repeats or (state.has_hold and not state.hold_sent))
+                   for state in self.held.values())
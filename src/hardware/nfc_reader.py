@@ -0,0 +1,111 @@
+"""
+Background NFC reader.
+The RC522 is polled over SPI on its own thread, so the render loop never
+blocks on a read. A card lying on the reader is reported once: it only
+counts as a new tap after it has been absent for config.NFC_REMOVE_TIME.
+Taps are queued with the monotonic time they were read and drained by
+HardwareInterface.get_events as 'CARD' Actions (the UID is in
+action.data), next to the button events.
+
+Without a reader, MockNFCReader replays scripted card presences through
+the same polling thread:
+
+    reader = MockNFCReader([(1.0, 2.0, '1234')])  # card 1234 on the reader from 1s to 2s
+    backend = NFCReaderBackend(reader)
+"""
+import queue
+import threading
+import time
+
+try:
+    from mfrc522 import SimpleMFRC522
+    NFC_AVAILABLE = True
+except (ImportError, RuntimeError):
+    # RPi.GPIO raises RuntimeError when imported off a Raspberry Pi
+    NFC_AVAILABLE = False
+
+from src import config
+from src.hardware.events import Action, wake_main_loop
+
+CARD = "CARD"
+
+
+class MockNFCReader:
+    """
+    Stand-in for SimpleMFRC522 that replays a script of
+    (start, end, uid) card presences, in seconds after creation.
+    """
+    def __init__(self, script, time_source=time.monotonic):
+        self.script = list(script)
+        self.time_source = time_source
+        self.start = time_source()
+
+    def read_id_no_block(self):
+        t = self.time_source() - self.start
+        for start, end, uid in self.script:
+            if start <= t < end:
+                return uid
+        return None
+
+    def finished(self):
+        """True once every scripted card has been removed"""
+        t = self.time_source() - self.start
+        return all(end <= t for start, end, uid in self.script)
+
+
+class NFCReaderBackend:
+    def __init__(self, reader=None, poll_interval=None, remove_time=None):
+        if reader is None:
+            if not NFC_AVAILABLE:
+                raise RuntimeError("mfrc522 is not installed")
+            reader = SimpleMFRC522()
+        self.reader = reader
+        self.poll_interval = poll_interval if poll_interval is not None else config.NFC_POLL_INTERVAL
+        self.remove_time = remove_time if remove_time is not None else config.NFC_REMOVE_TIME
+
+        self.queue = queue.Queue()
+        self.current_uid = None
+        self.last_seen = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="nfc-reader", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                uid = self.reader.read_id_no_block()
+            except Exception as e:
+                print(f"[NFC] Read error: {e}")
+                uid = None
+            self._on_read(time.monotonic(), uid)
+            self._stop.wait(self.poll_interval)
+
+    def _on_read(self, now, uid):
+        # The RC522 does not answer every poll while a card stays in the
+        # field, so a card is only gone after remove_time without a read
+        if uid is None:
+            if self.current_uid is not None and now - self.last_seen >= self.remove_time:
+                self.current_uid = None
+            return
+        uid = str(uid)
+        self.last_seen = now
+        if uid != self.current_uid:
+            self.current_uid = uid
+            self.queue.put((now, uid))
+            wake_main_loop()
+
+    def get_events(self):
+        """Drain the queued card taps as Actions, oldest first"""
+        actions = []
+        while True:
+            try:
+                timestamp, uid = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            actions.append(Action(CARD, timestamp, source="nfc", data=uid))
+        return actions
+
+    def close(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=1.0)
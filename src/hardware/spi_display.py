@@ -0,0 +1,235 @@
+"""
+ILI9486 SPI panel output.
+Pushes frames to an ILI9486-class TFT on SPI, where the bus is the
+bottleneck (a full 480x320 RGB565 frame is 300 KB, ~75 ms at 32 MHz).
+update() takes the damaged rectangles of the render pass, merges the
+ones that overlap, converts only those regions to big-endian RGB565
+(pygame does the conversion and array the byte swap, both in C) and
+sends each as one column/page address window followed by a bulk RAMWR
+transfer.
+
+    display = ILI9486Display(screen)
+    display.update(dirty_rects)   # same interface as pygame.display
+
+Without a panel, MockSPIDevice records every transaction instead:
+
+    display = ILI9486Display(screen, mock=True)
+    display.update([pygame.Rect(0, 0, 10, 10)])
+    display.spi.bytes_sent, display.spi.bus_time()
+"""
+import sys
+import time
+from array import array
+
+try:
+    import spidev
+    SPI_AVAILABLE = True
+except ImportError:
+    SPI_AVAILABLE = False
+
+try:
+    from gpiozero import DigitalOutputDevice
+    GPIO_AVAILABLE = True
+except ImportError:
+    GPIO_AVAILABLE = False
+
+import pygame
+from src import config
+
+# ILI9486 commands
+SWRESET = 0x01
+SLPOUT = 0x11
+DISPON = 0x29
+CASET = 0x2A  # Column address window
+PASET = 0x2B  # Page (row) address window
+RAMWR = 0x2C
+MADCTL = 0x36
+COLMOD = 0x3A
+
+COLMOD_RGB565 = 0x55
+RGB565_MASKS = (0xF800, 0x07E0, 0x001F, 0)
+
+# Cost of an extra address window in pixels, when deciding whether to
+# merge two rectangles: the 11 CASET/PASET/RAMWR bytes plus the setup of
+# its six transfers
+WINDOW_OVERHEAD = 64
+
+
+class MockSPIDevice:
+    """
+    Stand-in for spidev.SpiDev (with the D/C line) that records every
+    transfer as (is_data, bytes).
+    """
+    def __init__(self, max_speed_hz=None):
+        self.max_speed_hz = max_speed_hz if max_speed_hz is not None else config.SPI_DISPLAY_SPEED_HZ
+        self.transactions = []
+        self.bytes_sent = 0
+        self.dc = _MockPin()
+
+    def writebytes2(self, data):
+        data = bytes(data)
+        self.transactions.append((bool(self.dc.value), data))
+        self.bytes_sent += len(data)
+
+    def commands(self):
+        """Command bytes sent so far, in order"""
+        return [data[0] for is_data, data in self.transactions if not is_data]
+
+    def bus_time(self):
+        """Seconds the transfers so far take on the bus at max_speed_hz"""
+        return self.bytes_sent * 8 / self.max_speed_hz
+
+    def reset(self):
+        self.transactions = []
+        self.bytes_sent = 0
+
+    def close(self):
+        pass
+
+
+class _MockPin:
+    def __init__(self):
+        self.value = 0
+
+    def on(self):
+        self.value = 1
+
+    def off(self):
+        self.value = 0
+
+    def close(self):
+        pass
+
+
+def merge_rects(rects):
+    """
+    Merge rectangles that overlap or lie close together when one window
+    over both costs fewer pixels than two windows. A rectangle that grew
+    is checked against all the others again, so merges chain and no two
+    windows returned are worth merging.
+    """
+    merged = []
+    for rect in sorted(rects, key=lambda r: (r.y, r.x)):
+        i = 0
+        while i < len(merged):
+            other = merged[i]
+            union = other.union(rect)
+            separate = other.width * other.height + rect.width * rect.height + WINDOW_OVERHEAD
+            if union.width * union.height <= separate:
+                # Absorb it and start over with the grown rectangle
+                del merged[i]
+                rect = union
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+    return merged
+
+
+class ILI9486Display:
+    def __init__(self, screen, spi=None, dc=None, reset=None, mock=False,
+                 bus=None, device=None, speed_hz=None, max_transfer=None):
+        self.screen = screen
+        self.max_transfer = max_transfer if max_transfer is not None else config.SPI_DISPLAY_MAX_TRANSFER
+        speed_hz = speed_hz if speed_hz is not None else config.SPI_DISPLAY_SPEED_HZ
+
+        if spi is None:
+            if mock:
+                spi = MockSPIDevice(speed_hz)
+            else:
+                if not SPI_AVAILABLE or not GPIO_AVAILABLE:
+                    raise RuntimeError("spidev and gpiozero are needed for the SPI display")
+                spi = spidev.SpiDev()
+                spi.open(bus if bus is not None else config.SPI_DISPLAY_BUS,
+                         device if device is not None else config.SPI_DISPLAY_DEVICE)
+                spi.max_speed_hz = speed_hz
+                spi.mode = 0
+        if dc is None:
+            dc = spi.dc if isinstance(spi, MockSPIDevice) else DigitalOutputDevice(config.SPI_DISPLAY_PIN_DC)
+        if reset is None and not isinstance(spi, MockSPIDevice) and config.SPI_DISPLAY_PIN_RESET is not None:
+            reset = DigitalOutputDevice(config.SPI_DISPLAY_PIN_RESET, initial_value=True)
+        self.spi = spi
+        self.dc = dc
+        self.reset_pin = reset
+        # The mock needs no time to wake up
+        self._wake_delay = 0 if isinstance(spi, MockSPIDevice) else 0.12
+
+        # Region being sent, converted to RGB565; reallocated when a
+        # rectangle of another size comes along
+        self._scratch = None
+        self.windows_sent = 0
+        self._init_panel()
+        print(f"[SPI DISPLAY] ILI9486 {screen.get_width()}x{screen.get_height()} "
+              f"at {speed_hz / 1e6:g} MHz")
+
+    def _command(self, command, data=None):
+        self.dc.off()
+        self.spi.writebytes2(bytes((command,)))
+        if data:
+            self.dc.on()
+            self.spi.writebytes2(bytes(data))
+
+    def _init_panel(self):
+        if self.reset_pin is not None:
+            self.reset_pin.off()
+            time.sleep(0.01)
+            self.reset_pin.on()
+            time.sleep(self._wake_delay)
+        self._command(SWRESET)
+        time.sleep(self._wake_delay)
+        self._command(SLPOUT)
+        time.sleep(self._wake_delay)
+        self._command(COLMOD, (COLMOD_RGB565,))
+        self._command(MADCTL, (config.SPI_DISPLAY_MADCTL,))
+        self._command(DISPON)
+
+    def _convert(self, rect):
+        """Big-endian RGB565 bytes of a region of the screen"""
+        size = rect.size
+        if self._scratch is None or self._scratch.get_size() != size:
+            self._scratch = pygame.Surface(size, 0, 16, RGB565_MASKS)
+        self._scratch.blit(self.screen, (0, 0), rect)
+        row_bytes = rect.width * 2
+        pitch = self._scratch.get_pitch()
+        pixels = array('H')
+        with memoryview(self._scratch.get_buffer()) as raw:
+            if pitch == row_bytes:
+                pixels.frombytes(raw[:row_bytes * rect.height])
+            else:
+                # Rows are padded to 4 bytes
+                for y in range(rect.height):
+                    pixels.frombytes(raw[y * pitch:y * pitch + row_bytes])
+        if sys.byteorder == 'little':
+            pixels.byteswap()
+        return memoryview(pixels).cast('B')
+
+    def _send_window(self, rect):
+        x1, y1 = rect.right - 1, rect.bottom - 1
+        self._command(CASET, (rect.x >> 8, rect.x & 0xFF, x1 >> 8, x1 & 0xFF))
+        self._command(PASET, (rect.y >> 8, rect.y & 0xFF, y1 >> 8, y1 & 0xFF))
+        self._command(RAMWR)
+        data = self._convert(rect)
+        self.dc.on()
+        for start in range(0, len(data), self.max_transfer):
+            self.spi.writebytes2(data[start:start + self.max_transfer])
+        self.windows_sent += 1
+
+    def update(self, rects=None):
+        """Send the given rectangles of the screen (all of it if None) to the panel"""
+        bounds = self.screen.get_rect()
+        if rects is None:
+            rects = [bounds]
+        elif isinstance(rects, pygame.Rect):
+            rects = [rects]
+        clipped = [bounds.clip(rect) for rect in rects if rect is not None]
+        for rect in merge_rects([rect for rect in clipped if rect.width and rect.height]):
+            self._send_window(rect)
+
+    def flip(self):
+        self.update()
+
+    def close(self):
+        self.spi.close()
+        self.dc.close()
+        if self.reset_pin is not None:
+            self.reset_pin.close()
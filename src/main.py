@@ -1,58 +1,258 @@
 #!/usr/bin/env python3
-import pygame
+# Imported first: the boot timeline starts here
+from src.utils.boot import PRELOAD_MODULES, get_boot_profiler
+import argparse
+import os
 import sys
+import threading
 from src import config
-from src.hardware.interface import HardwareInterface
-from src.ui.manager import UIManager
-from src.ui.menu import MainMenuView
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Airsoft Bomb")
+    parser.add_argument("--profile", action="store_true",
+                        help="time every loop phase (F12/SIGUSR1 dumps a report)")
+    parser.add_argument("--overlay", action="store_true",
+                        help="show the profiler overlay (F11/SIGUSR2 toggles it)")
+    parser.add_argument("--boot-profile", action="store_true",
+                        help="print the per-import/per-init startup timeline")
+    parser.add_argument("--sync", action="store_true",
+                        help="share game state with the other bombs over UDP multicast")
+    parser.add_argument("--dashboard", action="store_true",
+                        help="serve the game state to browsers (config.DASHBOARD_PORT)")
+    parser.add_argument("--framebuffer", nargs="?", const=config.FRAMEBUFFER_DEVICE, metavar="DEVICE",
+                        help="draw straight to a Linux framebuffer instead of a window "
+                             f"(default {config.FRAMEBUFFER_DEVICE})")
+    parser.add_argument("--spi-display", action="store_true",
+                        help="drive an ILI9486 panel on SPI instead of a window (config.SPI_DISPLAY_*)")
+    parser.add_argument("--record", metavar="FILE",
+                        help="record every input to FILE (replay with python -m src.utils.replay)")
+    return parser.parse_args()
+
+def draw_splash(screen, display, fonts):
+    """Drawn before anything else is loaded, so the display is never left blank"""
+    screen.fill(config.BLACK)
+    text = fonts.get(config.FONT_SIZE_HEADER).render("AIRSOFT BOMB", True, config.MILITARY_GREEN)
+    screen.blit(text, text.get_rect(center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2 - 15)))
+    text = fonts.get(config.FONT_SIZE_SMALL).render("LOADING...", True, config.DARK_GREEN)
+    screen.blit(text, text.get_rect(center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2 + 25)))
+    display.flip()
+
+def preload(boot):
+    """
+    Runs on a background thread behind the splash: imports every mode so
+    the first selection does not stall, loads the fonts and synthesizes
+    the sounds.
+    """
+    try:
+        for name in PRELOAD_MODULES:
+            boot.import_module(name)
+        with boot.stage("fonts"):
+            from src.ui.fonts import get_fonts
+            get_fonts().prewarm()
+        with boot.stage("sounds"):
+            from src.utils.sound import get_sound_manager
+            get_sound_manager()
+    except Exception as e:
+        # Not fatal: whatever is missing loads on first use
+        print(f"[BOOT] Preload failed: {e}")
 
 def main():
     """
     Main entry point for the Airsoft Bomb application.
     """
+    args = parse_args()
     print("Airsoft Bomb System Starting...")
+    boot = get_boot_profiler()
+    if args.framebuffer or args.spi_display:
+        # Frames are composed off-screen and written to the panel; SDL
+        # only provides the event queue
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
     
     # Initialize Pygame
-    pygame.init()
+    pygame = boot.import_module("pygame")
+    sound = boot.import_module("src.utils.sound")
+    with boot.stage("pygame.init"):
+        sound.init_mixer()
+        pygame.init()
+    
+    # Setup Screen and show the splash right away
+    with boot.stage("display"):
+        screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+        pygame.display.set_caption("Airsoft Bomb")
+        display = pygame.display
+        if args.framebuffer:
+            from src.hardware.framebuffer import FramebufferDisplay
+            try:
+                display = FramebufferDisplay(screen, args.framebuffer)
+            except (OSError, ValueError) as e:
+                print(f"[FRAMEBUFFER] Unavailable ({e}), nothing will be shown")
+        elif args.spi_display:
+            from src.hardware.spi_display import ILI9486Display
+            try:
+                display = ILI9486Display(screen)
+            except Exception as e:
+                # Missing spidev/gpiozero, no SPI device or no GPIO access
+                print(f"[SPI DISPLAY] Unavailable ({e}), nothing will be shown")
+    fonts = boot.import_module("src.ui.fonts")
+    with boot.stage("splash"):
+        draw_splash(screen, display, fonts.get_fonts())
+    boot.splash()
     
-    # Setup Screen
-    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
-    pygame.display.set_caption("Airsoft Bomb")
+    # Settings are loaded before the preload thread, which reads them
+    with boot.stage("settings"):
+        from src.utils.settings import get_settings
+        settings = get_settings()
+    
+    # Modes, fonts and sounds load in the background while the main
+    # thread brings up the hardware
+    preloader = threading.Thread(target=preload, args=(boot,), name="boot-preload", daemon=True)
+    preloader.start()
     
     # Initialize Subsystems
-    hardware = HardwareInterface()
-    ui_manager = UIManager(screen)
+    with boot.stage("hardware"):
+        from src.hardware.backlight import Backlight
+        from src.hardware.interface import HardwareInterface
+        hardware = HardwareInterface()
+        backlight = Backlight(screen, display=display)
+        backlight.set_level(settings.get('brightness'))
+        settings.subscribe(lambda key, value: backlight.set_level(value), ('brightness',))
+    with boot.stage("scheduler"):
+        from src.utils.profiler import FrameProfiler, NullProfiler
+        from src.utils.scheduler import FrameScheduler
+        scheduler = FrameScheduler(backlight)
+    
+    with boot.stage("wait for preload"):
+        preloader.join()
+    with boot.stage("ui"):
+        from src.ui.manager import UIManager
+        from src.ui.menu import MainMenuView
+        from src.utils.results import get_results_store
+        results = get_results_store()
+        ui_manager = UIManager(screen, results=results)
+    
+    if args.profile or args.overlay:
+        profiler = FrameProfiler(overlay=args.overlay)
+        profiler.install_signal_handlers()
+    else:
+        profiler = NullProfiler()
+    overlay_shown = profiler.overlay
+    
+    recorder = None
+    if args.record:
+        from src.utils.replay import InputRecorder
+        recorder = InputRecorder(args.record, MainMenuView, ui_manager.clock.step)
+        ui_manager.recorder = recorder
+    
+    sync = None
+    sync_version = 0
+    if args.sync:
+        try:
+            from src.net.sync import BombSync
+            sync = BombSync()
+            ui_manager.sync = sync
+        except OSError as e:
+            print(f"[SYNC] Unavailable ({e}), running standalone")
+    
+    dashboard = None
+    if args.dashboard:
+        try:
+            from src.net.dashboard import DashboardServer
+            dashboard = DashboardServer(lambda: ui_manager.snapshot)
+        except OSError as e:
+            print(f"[DASHBOARD] Unavailable ({e})")
     
     # Set Initial View
     ui_manager.set_view(MainMenuView)
     
-    clock = pygame.time.Clock()
     running = True
     
     while running and ui_manager.running:
-        # 1. Event Handling (Pygame + Hardware)
-        pygame_events = pygame.event.get()
-        for event in pygame_events:
-            if event.type == pygame.QUIT:
-                running = False
-        
-        # Get abstract hardware actions
-        actions = hardware.get_events(pygame_events)
-        
-        # Pass actions to UI
-        ui_manager.handle_input(actions)
-        
-        # 2. Update
-        hardware.update()
-        ui_manager.update()
-        
-        # 3. Draw
-        ui_manager.draw()
-        
-        pygame.display.flip()
-        clock.tick(config.FPS)
+        profiler.begin_frame()
+        # Frames cut short below (wake key, blank display) are still closed
+        # and a requested dump is still written
+        try:
+            # Full rate while something is moving (or a held key may still
+            # long-press/repeat, or a full redraw such as the first frame is
+            # due), otherwise sleep until input
+            animating = (ui_manager.is_animating() or hardware.has_held_keys()
+                         or profiler.overlay or ui_manager.full_redraw)
+            
+            # 1. Event Handling (Pygame + Hardware)
+            pygame_events = scheduler.wait_for_events(animating)
+            for event in pygame_events:
+                if event.type == pygame.QUIT:
+                    running = False
+            profiler.handle_events(pygame_events)
+            profiler.mark("events", idle=scheduler.last_sleep)
+            
+            # Get abstract hardware actions, mapped by the current view's keymap
+            actions = hardware.get_events(pygame_events, ui_manager.get_keymap())
+            profiler.mark("hardware")
+            
+            if actions or any(event.type == pygame.KEYDOWN for event in pygame_events):
+                if scheduler.notify_activity():
+                    # The key press that wakes a blank display is not passed on
+                    ui_manager.full_redraw = True
+                    continue
+            
+            # Pass actions to UI
+            profiler.call(ui_manager.current_view, ui_manager.handle_input, actions)
+            profiler.mark("input")
+            
+            # 2. Update
+            hardware.update()
+            profiler.call(ui_manager.current_view, ui_manager.update)
+            if sync is not None:
+                # Only stored here; the sync thread does the sending
+                sync.publish(ui_manager.get_status())
+            if dashboard is not None:
+                ui_manager.publish_snapshot()
+            profiler.mark("update")
+            
+            scheduler.update_idle(animating)
+            if scheduler.suspended:
+                # Display is blanked, stop rendering until the next key press
+                continue
+            
+            # 3. Draw (only when something can have changed; only the damaged
+            # regions are pushed to the display)
+            if profiler.overlay != overlay_shown:
+                overlay_shown = profiler.overlay
+                ui_manager.full_redraw = True
+            peers_changed = False
+            if sync is not None and sync.version != sync_version:
+                sync_version = sync.version
+                # Only views that show the other bombs need redrawing
+                peers_changed = ui_manager.current_view.shows_peers
+            if animating or actions or ui_manager.full_redraw or peers_changed:
+                dirty_rects = profiler.call(ui_manager.current_view, ui_manager.draw)
+                if profiler.overlay:
+                    dirty_rects.append(profiler.draw_overlay(screen))
+                profiler.mark("draw")
+                if dirty_rects:
+                    display.update(dirty_rects)
+                profiler.mark("present")
+                if boot.first_frame_time is None:
+                    boot.first_frame()
+                    if args.boot_profile:
+                        print(boot.report())
+        finally:
+            profiler.end_frame()
+            if profiler.dump_requested:
+                profiler.dump()
 
     hardware.cleanup()
+    if recorder is not None:
+        recorder.close(ui_manager.clock)
+    if sync is not None:
+        sync.close()
+    if dashboard is not None:
+        dashboard.close()
+    if display is not pygame.display:
+        display.close()
+    # Write any settings and results still waiting for the background writers
+    settings.close()
+    results.close()
     pygame.quit()
     sys.exit()
 
@@ -1,7 +1,7 @@
-import pygame
-import time
 from src import config
+from src.net.protocol import make_status
 from src.ui.base import BaseView
+from src.utils.countdown import Countdown, EXPLODED
 
 class DemolitionView(BaseView):
     """
@@ -10,18 +10,21 @@ class DemolitionView(BaseView):
     - Countdown starts
     - Defenders must defuse with code
     """
+    mode_name = "demolition"
+    shows_peers = True
+
     def __init__(self, manager):
         super().__init__(manager)
         from src.utils.settings import get_settings
         settings = get_settings()
         
         self.state = "MENU"  # MENU, PLANT, ARMED, DEFUSE, EXPLODED, DEFUSED
-        self.code = settings.get('bomb_code', '7355608')
+        self.code = settings.get('bomb_code')
         self.input_code = ""
-        self.countdown_time = settings.get('countdown_time', 45)
-        self.plant_time = None
-        self.beep_interval = 1.0  # seconds between beeps
-        self.last_beep = 0
+        self.countdown_time = settings.get('countdown_time')
+        self.countdown = None
+        self.planted_at = None
+        self.wrong_codes = 0
         
     def handle_input(self, action):
         if self.state == "MENU":
@@ -32,11 +35,15 @@ class DemolitionView(BaseView):
             elif action == 'SELECT':
                 if self.input_code == self.code:
                     self.state = "ARMED"
-                    self.plant_time = time.time()
+                    self.countdown = Countdown(self.countdown_time)
+                    self.countdown.start(self.clock.now)
+                    self.planted_at = self.clock.now
                     self.input_code = ""
                     print("BOMB PLANTED!")
                 else:
                     print("WRONG CODE!")
+                    self.wrong_codes += 1
+                    self.sound.play('error')
                     self.input_code = ""
             elif action == 'BACK':
                 if self.input_code:
@@ -53,9 +60,12 @@ class DemolitionView(BaseView):
             elif action == 'SELECT':
                 if self.input_code == self.code:
                     self.state = "DEFUSED"
+                    self.sound.play('defused')
                     print("BOMB DEFUSED!")
                 else:
                     print("WRONG CODE!")
+                    self.wrong_codes += 1
+                    self.sound.play('error')
                     self.input_code = ""
             elif action == 'BACK':
                 if self.input_code:
@@ -66,70 +76,76 @@ class DemolitionView(BaseView):
                 from src.ui.menu import MainMenuView
                 self.manager.set_view(MainMenuView)
     
-    def update(self):
+    def get_status(self):
+        remaining = self.countdown.remaining(self.clock.now) if self.state == "ARMED" else None
+        winner = {"EXPLODED": "ATTACKERS", "DEFUSED": "DEFENDERS"}.get(self.state)
+        return make_status(self.mode_name, self.state, remaining, winner=winner)
+    
+    def match_result(self):
+        return {
+            'winner': "ATTACKERS" if self.state == "EXPLODED" else "DEFENDERS",
+            'params': {'countdown_time': self.countdown_time, 'code_length': len(self.code)},
+            'wrong_codes': self.wrong_codes,
+            'timings': {'planted_at': self.planted_at - self.started_at,
+                        'remaining': self.countdown.remaining(self.clock.now)},
+        }
+    
+    def is_animating(self):
+        return self.state == "ARMED"
+    
+    def update(self, dt):
         if self.state == "ARMED":
-            elapsed = time.time() - self.plant_time
-            remaining = self.countdown_time - elapsed
-            
-            if remaining <= 0:
-                self.state = "EXPLODED"
-                print("BOMB EXPLODED!")
-            else:
-                # Beep faster as time runs out
-                if remaining < 10:
-                    self.beep_interval = 0.2
-                elif remaining < 20:
-                    self.beep_interval = 0.5
-                    
-                if time.time() - self.last_beep > self.beep_interval:
-                    self.last_beep = time.time()
-                    # TODO: Play beep sound
+            for event in self.countdown.poll(self.clock.now):
+                if event == EXPLODED:
+                    self.state = "EXPLODED"
+                    self.sound.play('alarm')
+                    print("BOMB EXPLODED!")
+                else:
+                    self.sound.play(event)
     
-    def draw(self):
-        self.screen.fill(config.BLACK)
-        
-        # Header
-        self.draw_text("DEMOLITION MODE", self.font_header, config.MILITARY_GREEN, 
-                      config.SCREEN_WIDTH // 2, 20, center=True)
-        pygame.draw.line(self.screen, config.MILITARY_GREEN, (20, 50), 
-                        (config.SCREEN_WIDTH - 20, 50), 2)
+    def draw_static(self):
+        self.draw_header("DEMOLITION MODE")
         
         if self.state == "MENU":
             self.draw_text("ENTER CODE TO PLANT:", self.font_normal, config.MILITARY_GREEN, 
                           config.SCREEN_WIDTH // 2, 100, center=True)
-            self.draw_text("*" * len(self.input_code), self.font_header, config.AMBER, 
-                          config.SCREEN_WIDTH // 2, 150, center=True)
             self.draw_text("PRESS ENTER TO CONFIRM", self.font_small, config.GRAY, 
                           config.SCREEN_WIDTH // 2, 220, center=True)
-            self.draw_text("MINUS (-) TO GO BACK", self.font_small, config.GRAY, 
-                          config.SCREEN_WIDTH // 2, 250, center=True)
+            self.draw_footer("MINUS (-) TO GO BACK", 250)
                           
         elif self.state == "ARMED":
-            elapsed = time.time() - self.plant_time
-            remaining = max(0, self.countdown_time - elapsed)
-            
-            # Big countdown
-            color = config.MILITARY_GREEN if remaining > 10 else config.ALERT_RED
-            self.draw_text(f"{int(remaining):02d}", self.font_header, color, 
-                          config.SCREEN_WIDTH // 2, 100, center=True)
-            
             self.draw_text("ENTER CODE TO DEFUSE:", self.font_normal, config.MILITARY_GREEN, 
                           config.SCREEN_WIDTH // 2, 170, center=True)
-            self.draw_text("*" * len(self.input_code), self.font_normal, config.AMBER, 
-                          config.SCREEN_WIDTH // 2, 210, center=True)
                           
         elif self.state == "EXPLODED":
             self.draw_text("BOMB EXPLODED!", self.font_header, config.ALERT_RED, 
                           config.SCREEN_WIDTH // 2, 140, center=True)
             self.draw_text("ATTACKERS WIN", self.font_normal, config.ALERT_RED, 
                           config.SCREEN_WIDTH // 2, 190, center=True)
-            self.draw_text("PRESS MINUS (-) TO EXIT", self.font_small, config.GRAY, 
-                          config.SCREEN_WIDTH // 2, 250, center=True)
+            self.draw_footer("PRESS MINUS (-) TO EXIT", 250)
                           
         elif self.state == "DEFUSED":
             self.draw_text("BOMB DEFUSED!", self.font_header, config.MILITARY_GREEN, 
                           config.SCREEN_WIDTH // 2, 140, center=True)
             self.draw_text("DEFENDERS WIN", self.font_normal, config.MILITARY_GREEN, 
                           config.SCREEN_WIDTH // 2, 190, center=True)
-            self.draw_text("PRESS MINUS (-) TO EXIT", self.font_small, config.GRAY, 
-                          config.SCREEN_WIDTH // 2, 250, center=True)
+            self.draw_footer("PRESS MINUS (-) TO EXIT", 250)
+    
+    def draw(self):
+        self.draw_background()
+        self.draw_peers()
+        
+        if self.state == "MENU":
+            self.draw_text("*" * len(self.input_code), self.font_header, config.AMBER, 
+                          config.SCREEN_WIDTH // 2, 150, center=True)
+                          
+        elif self.state == "ARMED":
+            remaining = self.countdown.remaining(self.clock.now)
+            
+            # Big countdown
+            color = config.MILITARY_GREEN if remaining > 10 else config.ALERT_RED
+            self.draw_text(f"{int(remaining):02d}", self.font_header, color, 
+                          config.SCREEN_WIDTH // 2, 100, center=True)
+            
+            self.draw_text("*" * len(self.input_code), self.font_normal, config.AMBER, 
+                          config.SCREEN_WIDTH // 2, 210, center=True)
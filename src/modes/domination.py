@@ -1,6 +1,5 @@
-import pygame
-import time
 from src import config
+from src.net.protocol import make_status
 from src.ui.base import BaseView
 
 class DominationView(BaseView):
@@ -9,6 +8,9 @@ class DominationView(BaseView):
     - Two teams accumulate time by holding their button
     - First to reach target time wins
     """
+    mode_name = "domination"
+    shows_peers = True
+
     def __init__(self, manager):
         super().__init__(manager)
         from src.utils.settings import get_settings
@@ -17,8 +19,7 @@ class DominationView(BaseView):
         self.state = "PLAYING"  # PLAYING, FINISHED
         self.team_a_time = 0.0
         self.team_b_time = 0.0
-        self.target_time = settings.get('domination_target_time', 60.0)
-        self.last_update = time.time()
+        self.target_time = settings.get('domination_target_time')
         self.current_holder = None  # None, 'A', or 'B'
         
     def handle_input(self, action):
@@ -35,16 +36,32 @@ class DominationView(BaseView):
                 from src.ui.menu import MainMenuView
                 self.manager.set_view(MainMenuView)
     
-    def update(self):
+    def get_status(self):
+        return make_status(self.mode_name, self.state,
+                           team_a=self.team_a_time / self.target_time,
+                           team_b=self.team_b_time / self.target_time,
+                           winner=getattr(self, 'winner', None))
+    
+    def get_details(self):
+        return {'team_a_time': self.team_a_time, 'team_b_time': self.team_b_time,
+                'target_time': self.target_time, 'holder': self.current_holder}
+    
+    def match_result(self):
+        return {
+            'winner': self.winner,
+            'params': {'target_time': self.target_time},
+            'timings': {'team_a': self.team_a_time, 'team_b': self.team_b_time},
+        }
+    
+    def is_animating(self):
+        return self.state == "PLAYING"
+    
+    def update(self, dt):
         if self.state == "PLAYING":
-            current_time = time.time()
-            delta = current_time - self.last_update
-            self.last_update = current_time
-            
             if self.current_holder == 'A':
-                self.team_a_time += delta
+                self.team_a_time += dt
             elif self.current_holder == 'B':
-                self.team_b_time += delta
+                self.team_b_time += dt
                 
             # Check win condition
             if self.team_a_time >= self.target_time:
@@ -54,37 +71,46 @@ class DominationView(BaseView):
                 self.state = "FINISHED"
                 self.winner = 'B'
     
-    def draw(self):
-        self.screen.fill(config.BLACK)
-        
-        # Header
-        self.draw_text("DOMINATION MODE", self.font_header, config.MILITARY_GREEN, 
-                      config.SCREEN_WIDTH // 2, 20, center=True)
-        pygame.draw.line(self.screen, config.MILITARY_GREEN, (20, 50), 
-                        (config.SCREEN_WIDTH - 20, 50), 2)
+    def draw_static(self):
+        self.draw_header("DOMINATION MODE")
         
         if self.state == "PLAYING":
-            # Team A
+            # Team labels and bar outlines
             self.draw_text("TEAM A (Press 1)", self.font_normal, config.MILITARY_GREEN, 
                           config.SCREEN_WIDTH // 2, 80, center=True)
+            self.draw_rect(config.GRAY, 
+                         (40, 110, config.SCREEN_WIDTH - 80, 20), 1)
+            self.draw_text("TEAM B (Press 2)", self.font_normal, config.MILITARY_GREEN, 
+                          config.SCREEN_WIDTH // 2, 180, center=True)
+            self.draw_rect(config.GRAY, 
+                         (40, 210, config.SCREEN_WIDTH - 80, 20), 1)
+                              
+        elif self.state == "FINISHED":
+            self.draw_footer("PRESS MINUS (-) TO EXIT", 250)
+    
+    def draw(self):
+        self.draw_background()
+        self.draw_peers()
+        
+        if self.state == "PLAYING":
+            # Bar fills sit inside the 1px outlines of the static layer
+            inner_width = config.SCREEN_WIDTH - 82
+            
+            # Team A
             progress_a = min(1.0, self.team_a_time / self.target_time)
-            bar_width = int((config.SCREEN_WIDTH - 80) * progress_a)
-            pygame.draw.rect(self.screen, config.MILITARY_GREEN, 
-                           (40, 110, bar_width, 20))
-            pygame.draw.rect(self.screen, config.GRAY, 
-                           (40, 110, config.SCREEN_WIDTH - 80, 20), 1)
+            bar_width = int(inner_width * progress_a)
+            if bar_width > 0:
+                self.draw_rect(config.MILITARY_GREEN, 
+                             (41, 111, bar_width, 18))
             self.draw_text(f"{int(self.team_a_time)}s / {int(self.target_time)}s", 
                           self.font_small, config.WHITE, config.SCREEN_WIDTH // 2, 145, center=True)
             
             # Team B
-            self.draw_text("TEAM B (Press 2)", self.font_normal, config.MILITARY_GREEN, 
-                          config.SCREEN_WIDTH // 2, 180, center=True)
             progress_b = min(1.0, self.team_b_time / self.target_time)
-            bar_width = int((config.SCREEN_WIDTH - 80) * progress_b)
-            pygame.draw.rect(self.screen, config.AMBER, 
-                           (40, 210, bar_width, 20))
-            pygame.draw.rect(self.screen, config.GRAY, 
-                           (40, 210, config.SCREEN_WIDTH - 80, 20), 1)
+            bar_width = int(inner_width * progress_b)
+            if bar_width > 0:
+                self.draw_rect(config.AMBER, 
+                             (41, 211, bar_width, 18))
             self.draw_text(f"{int(self.team_b_time)}s / {int(self.target_time)}s", 
                           self.font_small, config.WHITE, config.SCREEN_WIDTH // 2, 245, center=True)
             
@@ -96,5 +122,3 @@ class DominationView(BaseView):
         elif self.state == "FINISHED":
             self.draw_text(f"TEAM {self.winner} WINS!", self.font_header, config.MILITARY_GREEN, 
                           config.SCREEN_WIDTH // 2, 140, center=True)
-            self.draw_text("PRESS MINUS (-) TO EXIT", self.font_small, config.GRAY, 
-                          config.SCREEN_WIDTH // 2, 250, center=True)
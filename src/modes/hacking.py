@@ -1,45 +1,83 @@
-import pygame
-import time
-import random
 from src import config
+from src.hardware.keymap import CONFIRM_KEYMAP
+from src.net.protocol import make_status
 from src.ui.base import BaseView
+from src.utils.rng import get_rng
+
+# Track geometry
+TRACK_X = 40
+TRACK_Y = 160
+TRACK_WIDTH = config.SCREEN_WIDTH - 80
 
 class HackingView(BaseView):
     """
     Hacking mode: Minigame with moving bar
     - Stop the bar in the green zone to hack
     - Multiple rounds to complete
+
+    The bar bounces between the ends of the track at constant speed, so
+    its position is a function of game time (bar_position_at). A press is
+    judged at the game time it was captured at, not at the frame it
+    happens to be handled in, so hits do not depend on the frame rate.
     """
+    mode_name = "hacking"
+    shows_peers = True
+    keymap = CONFIRM_KEYMAP
+
     def __init__(self, manager):
         super().__init__(manager)
         from src.utils.settings import get_settings
         settings = get_settings()
         
         self.state = "PLAYING"  # PLAYING, SUCCESS, FAILED
-        self.bar_position = 0.0  # 0.0 to 1.0
+        self.bar_position = 0.0  # 0.0 to 1.0, as of the last update
         self.bar_speed = 0.5  # units per second
         self.bar_direction = 1  # 1 or -1
+        # Position and direction of the bar at game time bar_anchor_time
+        self.bar_anchor_time = self.clock.now
+        self.bar_anchor_position = 0.0
+        self.bar_anchor_direction = 1
         self.target_zone_start = 0.4
         self.target_zone_end = 0.6
         self.rounds_completed = 0
-        self.rounds_needed = settings.get('hacking_rounds', 3)
-        self.last_update = time.time()
+        self.rounds_needed = settings.get('hacking_rounds')
         self.attempts = 0
-        self.max_attempts = settings.get('hacking_max_attempts', 5)
+        self.max_attempts = settings.get('hacking_max_attempts')
+        self.round_times = []  # Seconds from the start to each successful hack
         
+    def bar_position_at(self, t):
+        """(position, direction) of the bar at game time t"""
+        # Unfold the bounces: 0..1 is the way out, 1..2 the way back
+        start = self.bar_anchor_position
+        if self.bar_anchor_direction < 0:
+            start = 2.0 - start
+        phase = (start + self.bar_speed * (t - self.bar_anchor_time)) % 2.0
+        if phase <= 1.0:
+            return phase, 1
+        return 2.0 - phase, -1
+    
     def handle_input(self, action):
         if self.state == "PLAYING":
-            if action == 'SELECT' or action == '5':
+            if action == 'SELECT':
+                # Where the bar was when the button was pressed
+                pressed_at = self.clock.time_at(getattr(action, 'timestamp', None))
+                position, direction = self.bar_position_at(pressed_at)
                 # Check if in target zone
-                if self.target_zone_start <= self.bar_position <= self.target_zone_end:
+                if self.target_zone_start <= position <= self.target_zone_end:
                     self.rounds_completed += 1
+                    self.round_times.append(pressed_at - self.started_at)
                     if self.rounds_completed >= self.rounds_needed:
                         self.state = "SUCCESS"
                     else:
-                        # Reset for next round, make it harder
+                        # Reset for next round, make it harder; the bar
+                        # carries on from where it was hit
+                        self.bar_anchor_time = pressed_at
+                        self.bar_anchor_position = position
+                        self.bar_anchor_direction = direction
                         self.bar_speed += 0.1
-                        self.target_zone_start = random.uniform(0.2, 0.6)
-                        self.target_zone_end = self.target_zone_start + random.uniform(0.15, 0.25)
+                        rng = get_rng()
+                        self.target_zone_start = rng.uniform(0.2, 0.6)
+                        self.target_zone_end = self.target_zone_start + rng.uniform(0.15, 0.25)
                 else:
                     self.attempts += 1
                     if self.attempts >= self.max_attempts:
@@ -54,80 +92,78 @@ class HackingView(BaseView):
                 from src.ui.menu import MainMenuView
                 self.manager.set_view(MainMenuView)
     
-    def update(self):
+    def get_status(self):
+        winner = {"SUCCESS": "ATTACKERS", "FAILED": "DEFENDERS"}.get(self.state)
+        return make_status(self.mode_name, self.state, winner=winner)
+    
+    def get_details(self):
+        return {'rounds_completed': self.rounds_completed, 'rounds_needed': self.rounds_needed,
+                'attempts': self.attempts, 'max_attempts': self.max_attempts}
+    
+    def match_result(self):
+        return {
+            'winner': "ATTACKERS" if self.state == "SUCCESS" else "DEFENDERS",
+            'params': {'rounds': self.rounds_needed, 'max_attempts': self.max_attempts},
+            'attempts': self.attempts,
+            'timings': {'rounds': self.round_times},
+        }
+    
+    def is_animating(self):
+        return self.state == "PLAYING"
+    
+    def update(self, dt):
         if self.state == "PLAYING":
-            current_time = time.time()
-            delta = current_time - self.last_update
-            self.last_update = current_time
-            
-            self.bar_position += self.bar_speed * self.bar_direction * delta
-            
-            # Bounce at edges
-            if self.bar_position >= 1.0:
-                self.bar_position = 1.0
-                self.bar_direction = -1
-            elif self.bar_position <= 0.0:
-                self.bar_position = 0.0
-                self.bar_direction = 1
+            self.bar_position, self.bar_direction = self.bar_position_at(self.clock.now)
     
-    def draw(self):
-        self.screen.fill(config.BLACK)
-        
-        # Header
-        self.draw_text("HACKING MINIGAME", self.font_header, config.MILITARY_GREEN, 
-                      config.SCREEN_WIDTH // 2, 20, center=True)
-        pygame.draw.line(self.screen, config.MILITARY_GREEN, (20, 50), 
-                        (config.SCREEN_WIDTH - 20, 50), 2)
+    def draw_static(self):
+        self.draw_header("HACKING MINIGAME")
         
         if self.state == "PLAYING":
-            # Round info
-            self.draw_text(f"ROUND {self.rounds_completed + 1}/{self.rounds_needed}", 
-                          self.font_normal, config.MILITARY_GREEN, 
-                          config.SCREEN_WIDTH // 2, 80, center=True)
-            self.draw_text(f"ATTEMPTS: {self.attempts}/{self.max_attempts}", 
-                          self.font_small, config.GRAY, 
-                          config.SCREEN_WIDTH // 2, 110, center=True)
-            
-            # Draw track
-            track_y = 160
-            track_width = config.SCREEN_WIDTH - 80
-            track_x = 40
-            
             # Background track
-            pygame.draw.rect(self.screen, config.GRAY, 
-                           (track_x, track_y, track_width, 30), 2)
-            
-            # Target zone (green)
-            zone_start_x = track_x + int(track_width * self.target_zone_start)
-            zone_width = int(track_width * (self.target_zone_end - self.target_zone_start))
-            pygame.draw.rect(self.screen, config.DARK_GREEN, 
-                           (zone_start_x, track_y, zone_width, 30))
-            pygame.draw.rect(self.screen, config.MILITARY_GREEN, 
-                           (zone_start_x, track_y, zone_width, 30), 2)
-            
-            # Moving bar
-            bar_x = track_x + int(track_width * self.bar_position)
-            pygame.draw.rect(self.screen, config.AMBER, 
-                           (bar_x - 3, track_y - 5, 6, 40))
+            self.draw_rect(config.GRAY, 
+                         (TRACK_X, TRACK_Y, TRACK_WIDTH, 30), 2)
             
             # Instructions
             self.draw_text("PRESS ENTER WHEN IN GREEN ZONE", self.font_small, config.WHITE, 
                           config.SCREEN_WIDTH // 2, 220, center=True)
-            self.draw_text("MINUS (-) TO EXIT", self.font_small, config.GRAY, 
-                          config.SCREEN_WIDTH // 2, 250, center=True)
+            self.draw_footer("MINUS (-) TO EXIT", 250)
                           
         elif self.state == "SUCCESS":
             self.draw_text("HACK SUCCESSFUL!", self.font_header, config.MILITARY_GREEN, 
                           config.SCREEN_WIDTH // 2, 140, center=True)
             self.draw_text("SYSTEM COMPROMISED", self.font_normal, config.MILITARY_GREEN, 
                           config.SCREEN_WIDTH // 2, 190, center=True)
-            self.draw_text("PRESS MINUS (-) TO EXIT", self.font_small, config.GRAY, 
-                          config.SCREEN_WIDTH // 2, 250, center=True)
+            self.draw_footer("PRESS MINUS (-) TO EXIT", 250)
                           
         elif self.state == "FAILED":
             self.draw_text("HACK FAILED!", self.font_header, config.ALERT_RED, 
                           config.SCREEN_WIDTH // 2, 140, center=True)
             self.draw_text("TOO MANY FAILED ATTEMPTS", self.font_normal, config.ALERT_RED, 
                           config.SCREEN_WIDTH // 2, 190, center=True)
-            self.draw_text("PRESS MINUS (-) TO EXIT", self.font_small, config.GRAY, 
-                          config.SCREEN_WIDTH // 2, 250, center=True)
+            self.draw_footer("PRESS MINUS (-) TO EXIT", 250)
+    
+    def draw(self):
+        self.draw_background()
+        self.draw_peers()
+        
+        if self.state == "PLAYING":
+            # Round info
+            self.draw_text(f"ROUND {self.rounds_completed + 1}/{self.rounds_needed}", 
+                          self.font_normal, config.MILITARY_GREEN, 
+                          config.SCREEN_WIDTH // 2, 80, center=True)
+            self.draw_text(f"ATTEMPTS: {self.attempts}/{self.max_attempts}", 
+                          self.font_small, config.GRAY, 
+                          config.SCREEN_WIDTH // 2, 110, center=True)
+            
+            # Target zone (green)
+            zone_start_x = TRACK_X + int(TRACK_WIDTH * self.target_zone_start)
+            zone_width = int(TRACK_WIDTH * (self.target_zone_end - self.target_zone_start))
+            self.draw_rect(config.DARK_GREEN, 
+                         (zone_start_x, TRACK_Y, zone_width, 30))
+            self.draw_rect(config.MILITARY_GREEN, 
+                         (zone_start_x, TRACK_Y, zone_width, 30), 2)
+            
+            # Moving bar
+            bar_x = TRACK_X + int(TRACK_WIDTH * self.bar_position)
+            self.draw_rect(config.AMBER, 
+                         (bar_x - 3, TRACK_Y - 5, 6, 40))
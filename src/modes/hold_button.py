@@ -1,6 +1,5 @@
-import pygame
-import time
 from src import config
+from src.net.protocol import make_status
 from src.ui.base import BaseView
 
 class HoldButtonView(BaseView):
@@ -9,6 +8,9 @@ class HoldButtonView(BaseView):
     - Hold button to fill capture bar
     - First to 100% wins
     """
+    mode_name = "hold_button"
+    shows_peers = True
+
     def __init__(self, manager):
         super().__init__(manager)
         from src.utils.settings import get_settings
@@ -17,9 +19,8 @@ class HoldButtonView(BaseView):
         self.state = "PLAYING"  # PLAYING, FINISHED
         self.team_a_progress = 0.0  # 0.0 to 1.0
         self.team_b_progress = 0.0
-        self.last_update = time.time()
-        self.capture_speed = settings.get('hold_button_capture_speed', 0.2)
-        self.decay_speed = settings.get('hold_button_decay_speed', 0.05)
+        self.capture_speed = settings.get('hold_button_capture_speed')
+        self.decay_speed = settings.get('hold_button_decay_speed')
         self.current_holder = None
         
     def handle_input(self, action):
@@ -28,6 +29,10 @@ class HoldButtonView(BaseView):
                 self.current_holder = 'A'
             elif action == '2':
                 self.current_holder = 'B'
+            elif action == '1_RELEASED' and self.current_holder == 'A':
+                self.current_holder = None
+            elif action == '2_RELEASED' and self.current_holder == 'B':
+                self.current_holder = None
             elif action == 'BACK':
                 from src.ui.menu import MainMenuView
                 self.manager.set_view(MainMenuView)
@@ -36,22 +41,35 @@ class HoldButtonView(BaseView):
                 from src.ui.menu import MainMenuView
                 self.manager.set_view(MainMenuView)
     
-    def update(self):
+    def get_status(self):
+        return make_status(self.mode_name, self.state,
+                           team_a=self.team_a_progress, team_b=self.team_b_progress,
+                           winner=getattr(self, 'winner', None))
+    
+    def get_details(self):
+        return {'holder': self.current_holder}
+    
+    def match_result(self):
+        return {
+            'winner': self.winner,
+            'params': {'capture_speed': self.capture_speed, 'decay_speed': self.decay_speed},
+        }
+    
+    def is_animating(self):
+        return self.state == "PLAYING"
+    
+    def update(self, dt):
         if self.state == "PLAYING":
-            current_time = time.time()
-            delta = current_time - self.last_update
-            self.last_update = current_time
-            
             if self.current_holder == 'A':
-                self.team_a_progress += self.capture_speed * delta
-                self.team_b_progress -= self.decay_speed * delta
+                self.team_a_progress += self.capture_speed * dt
+                self.team_b_progress -= self.decay_speed * dt
             elif self.current_holder == 'B':
-                self.team_b_progress += self.capture_speed * delta
-                self.team_a_progress -= self.decay_speed * delta
+                self.team_b_progress += self.capture_speed * dt
+                self.team_a_progress -= self.decay_speed * dt
             else:
                 # Decay both when no one is holding
-                self.team_a_progress -= self.decay_speed * delta
-                self.team_b_progress -= self.decay_speed * delta
+                self.team_a_progress -= self.decay_speed * dt
+                self.team_b_progress -= self.decay_speed * dt
             
             # Clamp values
             self.team_a_progress = max(0.0, min(1.0, self.team_a_progress))
@@ -64,44 +82,48 @@ class HoldButtonView(BaseView):
             elif self.team_b_progress >= 1.0:
                 self.state = "FINISHED"
                 self.winner = 'B'
-            
-            # Reset holder (must hold continuously)
-            self.current_holder = None
     
-    def draw(self):
-        self.screen.fill(config.BLACK)
-        
-        # Header
-        self.draw_text("HOLD THE BUTTON", self.font_header, config.MILITARY_GREEN, 
-                      config.SCREEN_WIDTH // 2, 20, center=True)
-        pygame.draw.line(self.screen, config.MILITARY_GREEN, (20, 50), 
-                        (config.SCREEN_WIDTH - 20, 50), 2)
+    def draw_static(self):
+        self.draw_header("HOLD THE BUTTON")
         
         if self.state == "PLAYING":
-            # Team A
+            # Team labels and bar outlines
             self.draw_text("TEAM A (Hold 1)", self.font_normal, config.MILITARY_GREEN, 
                           config.SCREEN_WIDTH // 2, 80, center=True)
-            bar_width = int((config.SCREEN_WIDTH - 80) * self.team_a_progress)
-            pygame.draw.rect(self.screen, config.MILITARY_GREEN, 
-                           (40, 110, bar_width, 25))
-            pygame.draw.rect(self.screen, config.GRAY, 
-                           (40, 110, config.SCREEN_WIDTH - 80, 25), 2)
+            self.draw_rect(config.GRAY, 
+                         (40, 110, config.SCREEN_WIDTH - 80, 25), 2)
+            self.draw_text("TEAM B (Hold 2)", self.font_normal, config.MILITARY_GREEN, 
+                          config.SCREEN_WIDTH // 2, 190, center=True)
+            self.draw_rect(config.GRAY, 
+                         (40, 220, config.SCREEN_WIDTH - 80, 25), 2)
+                          
+        elif self.state == "FINISHED":
+            self.draw_footer("PRESS MINUS (-) TO EXIT", 250)
+    
+    def draw(self):
+        self.draw_background()
+        self.draw_peers()
+        
+        if self.state == "PLAYING":
+            # Bar fills sit inside the 2px outlines of the static layer
+            inner_width = config.SCREEN_WIDTH - 84
+            
+            # Team A
+            bar_width = int(inner_width * self.team_a_progress)
+            if bar_width > 0:
+                self.draw_rect(config.MILITARY_GREEN, 
+                             (42, 112, bar_width, 21))
             self.draw_text(f"{int(self.team_a_progress * 100)}%", 
                           self.font_small, config.WHITE, config.SCREEN_WIDTH // 2, 150, center=True)
             
             # Team B
-            self.draw_text("TEAM B (Hold 2)", self.font_normal, config.MILITARY_GREEN, 
-                          config.SCREEN_WIDTH // 2, 190, center=True)
-            bar_width = int((config.SCREEN_WIDTH - 80) * self.team_b_progress)
-            pygame.draw.rect(self.screen, config.AMBER, 
-                           (40, 220, bar_width, 25))
-            pygame.draw.rect(self.screen, config.GRAY, 
-                           (40, 220, config.SCREEN_WIDTH - 80, 25), 2)
+            bar_width = int(inner_width * self.team_b_progress)
+            if bar_width > 0:
+                self.draw_rect(config.AMBER, 
+                             (42, 222, bar_width, 21))
             self.draw_text(f"{int(self.team_b_progress * 100)}%", 
                           self.font_small, config.WHITE, config.SCREEN_WIDTH // 2, 260, center=True)
                           
         elif self.state == "FINISHED":
             self.draw_text(f"TEAM {self.winner} WINS!", self.font_header, config.MILITARY_GREEN, 
                           config.SCREEN_WIDTH // 2, 140, center=True)
-            self.draw_text("PRESS MINUS (-) TO EXIT", self.font_small, config.GRAY, 
-                          config.SCREEN_WIDTH // 2, 250, center=True)
@@ -1,46 +1,47 @@
-import pygame
-import time
 from src import config
+from src.net.protocol import make_status
 from src.ui.base import BaseView
+from src.utils.countdown import Countdown, EXPLODED
 
 class NFCModeView(BaseView):
     """
     NFC Plant/Defuse mode
-    - Simulates NFC card reading (mocked for now)
-    - Press specific keys to simulate card tap
+    - Tap a valid NFC card to plant, tap again to defuse
+    - Keys 1 and 2 simulate a tap of the first and second card
     """
+    mode_name = "nfc"
+    shows_peers = True
+
     def __init__(self, manager):
         super().__init__(manager)
         from src.utils.settings import get_settings
         settings = get_settings()
         
         self.state = "WAITING"  # WAITING, ARMED, DEFUSED, EXPLODED
-        self.valid_cards = ['1234', '5678']  # Simulated NFC card IDs
-        self.countdown_time = settings.get('countdown_time', 45)
-        self.plant_time = None
-        self.last_beep = 0
-        self.beep_interval = 1.0
+        self.valid_cards = list(config.NFC_VALID_CARDS)
+        self.countdown_time = settings.get('countdown_time')
+        self.countdown = None
+        self.planted_at = None
+        self.unknown_cards = 0
         
     def handle_input(self, action):
+        if action == 'CARD':
+            self._on_card(action.data)
+            return
+        if action == '1' or action == '2':
+            # Simulated tap
+            index = int(action) - 1
+            if index < len(self.valid_cards):
+                self._on_card(self.valid_cards[index])
+            return
+
         if self.state == "WAITING":
-            # Simulate NFC tap with number sequences
-            if action == '1':
-                print("Card 1234 detected - PLANTING BOMB")
-                self.state = "ARMED"
-                self.plant_time = time.time()
-            elif action == '2':
-                print("Card 5678 detected - PLANTING BOMB")
-                self.state = "ARMED"
-                self.plant_time = time.time()
-            elif action == 'BACK':
+            if action == 'BACK':
                 from src.ui.menu import MainMenuView
                 self.manager.set_view(MainMenuView)
                 
         elif self.state == "ARMED":
-            if action == '1' or action == '2':
-                print("Valid card detected - DEFUSING")
-                self.state = "DEFUSED"
-            elif action == 'BACK':
+            if action == 'BACK':
                 pass  # Can't go back when armed
                 
         elif self.state in ["DEFUSED", "EXPLODED"]:
@@ -48,30 +49,53 @@ class NFCModeView(BaseView):
                 from src.ui.menu import MainMenuView
                 self.manager.set_view(MainMenuView)
     
-    def update(self):
+    def _on_card(self, uid):
+        if self.state not in ("WAITING", "ARMED"):
+            return
+        if uid not in self.valid_cards:
+            print(f"Unknown card {uid}")
+            self.unknown_cards += 1
+            self.sound.play('error')
+            return
+        if self.state == "WAITING":
+            print(f"Card {uid} detected - PLANTING BOMB")
+            self.state = "ARMED"
+            self.countdown = Countdown(self.countdown_time)
+            self.countdown.start(self.clock.now)
+            self.planted_at = self.clock.now
+        else:
+            print(f"Card {uid} detected - DEFUSING")
+            self.state = "DEFUSED"
+            self.sound.play('defused')
+    
+    def get_status(self):
+        remaining = self.countdown.remaining(self.clock.now) if self.state == "ARMED" else None
+        winner = {"EXPLODED": "ATTACKERS", "DEFUSED": "DEFENDERS"}.get(self.state)
+        return make_status(self.mode_name, self.state, remaining, winner=winner)
+    
+    def match_result(self):
+        return {
+            'winner': "ATTACKERS" if self.state == "EXPLODED" else "DEFENDERS",
+            'params': {'countdown_time': self.countdown_time},
+            'wrong_codes': self.unknown_cards,
+            'timings': {'planted_at': self.planted_at - self.started_at,
+                        'remaining': self.countdown.remaining(self.clock.now)},
+        }
+    
+    def is_animating(self):
+        return self.state == "ARMED"
+    
+    def update(self, dt):
         if self.state == "ARMED":
-            elapsed = time.time() - self.plant_time
-            remaining = self.countdown_time - elapsed
-            
-            if remaining <= 0:
-                self.state = "EXPLODED"
-            else:
-                if remaining < 10:
-                    self.beep_interval = 0.2
-                elif remaining < 20:
-                    self.beep_interval = 0.5
-                    
-                if time.time() - self.last_beep > self.beep_interval:
-                    self.last_beep = time.time()
+            for event in self.countdown.poll(self.clock.now):
+                if event == EXPLODED:
+                    self.state = "EXPLODED"
+                    self.sound.play('alarm')
+                else:
+                    self.sound.play(event)
     
-    def draw(self):
-        self.screen.fill(config.BLACK)
-        
-        # Header
-        self.draw_text("NFC PLANT/DEFUSE", self.font_header, config.MILITARY_GREEN, 
-                      config.SCREEN_WIDTH // 2, 20, center=True)
-        pygame.draw.line(self.screen, config.MILITARY_GREEN, (20, 50), 
-                        (config.SCREEN_WIDTH - 20, 50), 2)
+    def draw_static(self):
+        self.draw_header("NFC PLANT/DEFUSE")
         
         if self.state == "WAITING":
             self.draw_text("TAP CARD TO PLANT", self.font_normal, config.MILITARY_GREEN, 
@@ -80,21 +104,14 @@ class NFCModeView(BaseView):
                           config.SCREEN_WIDTH // 2, 160, center=True)
             
             # Draw NFC icon simulation
-            pygame.draw.circle(self.screen, config.MILITARY_GREEN, 
-                             (config.SCREEN_WIDTH // 2, 220), 30, 3)
-            pygame.draw.circle(self.screen, config.MILITARY_GREEN, 
-                             (config.SCREEN_WIDTH // 2, 220), 20, 2)
-            pygame.draw.circle(self.screen, config.MILITARY_GREEN, 
-                             (config.SCREEN_WIDTH // 2, 220), 10, 2)
+            self.draw_circle(config.MILITARY_GREEN, 
+                           (config.SCREEN_WIDTH // 2, 220), 30, 3)
+            self.draw_circle(config.MILITARY_GREEN, 
+                           (config.SCREEN_WIDTH // 2, 220), 20, 2)
+            self.draw_circle(config.MILITARY_GREEN, 
+                           (config.SCREEN_WIDTH // 2, 220), 10, 2)
                              
         elif self.state == "ARMED":
-            elapsed = time.time() - self.plant_time
-            remaining = max(0, self.countdown_time - elapsed)
-            
-            color = config.MILITARY_GREEN if remaining > 10 else config.ALERT_RED
-            self.draw_text(f"{int(remaining):02d}", self.font_header, color, 
-                          config.SCREEN_WIDTH // 2, 100, center=True)
-            
             self.draw_text("BOMB ARMED!", self.font_normal, config.ALERT_RED, 
                           config.SCREEN_WIDTH // 2, 160, center=True)
             self.draw_text("TAP CARD TO DEFUSE", self.font_normal, config.MILITARY_GREEN, 
@@ -105,11 +122,20 @@ class NFCModeView(BaseView):
         elif self.state == "DEFUSED":
             self.draw_text("BOMB DEFUSED!", self.font_header, config.MILITARY_GREEN, 
                           config.SCREEN_WIDTH // 2, 140, center=True)
-            self.draw_text("PRESS MINUS (-) TO EXIT", self.font_small, config.GRAY, 
-                          config.SCREEN_WIDTH // 2, 250, center=True)
+            self.draw_footer("PRESS MINUS (-) TO EXIT", 250)
                           
         elif self.state == "EXPLODED":
             self.draw_text("BOMB EXPLODED!", self.font_header, config.ALERT_RED, 
                           config.SCREEN_WIDTH // 2, 140, center=True)
-            self.draw_text("PRESS MINUS (-) TO EXIT", self.font_small, config.GRAY, 
-                          config.SCREEN_WIDTH // 2, 250, center=True)
+            self.draw_footer("PRESS MINUS (-) TO EXIT", 250)
+    
+    def draw(self):
+        self.draw_background()
+        self.draw_peers()
+        
+        if self.state == "ARMED":
+            remaining = self.countdown.remaining(self.clock.now)
+            
+            color = config.MILITARY_GREEN if remaining > 10 else config.ALERT_RED
+            self.draw_text(f"{int(remaining):02d}", self.font_header, color, 
+                          config.SCREEN_WIDTH // 2, 100, center=True)
@@ -1,14 +1,17 @@
-import pygame
-import time
-import random
 from src import config
+from src.net.protocol import make_status
 from src.ui.base import BaseView
+from src.utils.countdown import Countdown, EXPLODED
+from src.utils.rng import get_rng
 
 class SimonSaysPlantView(BaseView):
     """
     Simon Says minigame for planting/defusing bomb.
     Shows sequences of numbers that must be repeated.
     """
+    mode_name = "simon"
+    shows_peers = True
+
     def __init__(self, manager, num_series=4, digits_per_series=6, countdown_time=45):
         super().__init__(manager)
         self.num_series = num_series
@@ -22,18 +25,19 @@ class SimonSaysPlantView(BaseView):
         self.input_buffer = ""
         self.show_start_time = None
         self.show_duration = 5.0  # seconds to show sequence
-        self.plant_time = None
-        self.last_beep = 0
-        self.beep_interval = 1.0
+        self.countdown = None
+        self.planted_at = None
+        self.wrong_sequences = 0
         
         # Generate sequences for planting
         self._generate_sequences()
         
     def _generate_sequences(self):
         """Generate random number sequences"""
+        rng = get_rng()
         self.sequences = []
         for _ in range(self.num_series):
-            sequence = ''.join([str(random.randint(0, 9)) for _ in range(self.digits_per_series)])
+            sequence = ''.join([str(rng.randint(0, 9)) for _ in range(self.digits_per_series)])
             self.sequences.append(sequence)
     
     def handle_input(self, action):
@@ -55,7 +59,11 @@ class SimonSaysPlantView(BaseView):
                     
         elif self.state == "ARMED":
             # Can't go back when armed
-            pass
+            if action == '1':
+                # Start defuse sequence
+                self.current_series = 0
+                self.state = "DEFUSE_SHOW"
+                self.show_start_time = None
             
         elif self.state == "DEFUSE_SHOW":
             # Just wait
@@ -83,15 +91,19 @@ class SimonSaysPlantView(BaseView):
             if self.current_series >= self.num_series:
                 # All sequences completed - bomb planted!
                 self.state = "ARMED"
-                self.plant_time = time.time()
+                self.countdown = Countdown(self.countdown_time)
+                self.countdown.start(self.clock.now)
+                self.planted_at = self.clock.now
                 print("BOMB PLANTED!")
             else:
-                # Next sequence
+                # Next sequence (picked up by update())
                 self.state = "PLANT_SHOW"
-                self.show_start_time = time.time()
+                self.show_start_time = None
         else:
             # Wrong sequence - reset
             print("WRONG SEQUENCE!")
+            self.wrong_sequences += 1
+            self.sound.play('error')
             self.input_buffer = ""
     
     def _check_defuse_sequence(self):
@@ -102,105 +114,101 @@ class SimonSaysPlantView(BaseView):
             if self.current_series >= self.num_series:
                 # All sequences completed - bomb defused!
                 self.state = "DEFUSED"
+                self.sound.play('defused')
                 print("BOMB DEFUSED!")
             else:
-                # Next sequence
+                # Next sequence (picked up by update())
                 self.state = "DEFUSE_SHOW"
-                self.show_start_time = time.time()
+                self.show_start_time = None
         else:
             # Wrong sequence - reset current series
             print("WRONG SEQUENCE!")
+            self.wrong_sequences += 1
+            self.sound.play('error')
             self.input_buffer = ""
     
-    def update(self):
+    def get_status(self):
+        remaining = self.countdown.remaining(self.clock.now) if self.state == "ARMED" else None
+        winner = {"EXPLODED": "ATTACKERS", "DEFUSED": "DEFENDERS"}.get(self.state)
+        return make_status(self.mode_name, self.state, remaining, winner=winner)
+    
+    def match_result(self):
+        return {
+            'winner': "ATTACKERS" if self.state == "EXPLODED" else "DEFENDERS",
+            'params': {'num_series': self.num_series, 'digits_per_series': self.digits_per_series,
+                       'countdown_time': self.countdown_time},
+            'wrong_codes': self.wrong_sequences,
+            'timings': {'planted_at': self.planted_at - self.started_at,
+                        'remaining': self.countdown.remaining(self.clock.now)},
+        }
+    
+    def is_animating(self):
+        return self.state in ["PLANT_SHOW", "DEFUSE_SHOW", "ARMED"]
+    
+    def update(self, dt):
         if self.state == "PLANT_SHOW":
             if self.show_start_time is None:
-                self.show_start_time = time.time()
+                self.show_start_time = self.clock.now
                 self.current_sequence = self.sequences[self.current_series]
-            elif time.time() - self.show_start_time >= self.show_duration:
+            elif self.clock.now - self.show_start_time >= self.show_duration:
                 self.state = "PLANT_INPUT"
                 self.show_start_time = None
                 
         elif self.state == "DEFUSE_SHOW":
             if self.show_start_time is None:
-                self.show_start_time = time.time()
+                self.show_start_time = self.clock.now
                 self.current_sequence = self.sequences[self.current_series]
-            elif time.time() - self.show_start_time >= self.show_duration:
+            elif self.clock.now - self.show_start_time >= self.show_duration:
                 self.state = "DEFUSE_INPUT"
                 self.show_start_time = None
                 
         elif self.state == "ARMED":
-            elapsed = time.time() - self.plant_time
-            remaining = self.countdown_time - elapsed
-            
-            if remaining <= 0:
-                self.state = "EXPLODED"
-            else:
-                if remaining < 10:
-                    self.beep_interval = 0.2
-                elif remaining < 20:
-                    self.beep_interval = 0.5
-                    
-                if time.time() - self.last_beep > self.beep_interval:
-                    self.last_beep = time.time()
+            for event in self.countdown.poll(self.clock.now):
+                if event == EXPLODED:
+                    self.state = "EXPLODED"
+                    self.sound.play('alarm')
+                else:
+                    self.sound.play(event)
     
-    def draw(self):
-        self.screen.fill(config.BLACK)
+    def draw_static(self):
+        self.draw_header("SIMON SAYS MODE")
         
-        # Header
-        self.draw_text("SIMON SAYS MODE", self.font_header, config.MILITARY_GREEN, 
-                      config.SCREEN_WIDTH // 2, 20, center=True)
-        pygame.draw.line(self.screen, config.MILITARY_GREEN, (20, 50), 
-                        (config.SCREEN_WIDTH - 20, 50), 2)
-        
-        if self.state == "PLANT_SHOW":
-            self.draw_text(f"MEMORIZE SEQUENCE {self.current_series + 1}/{self.num_series}", 
-                          self.font_normal, config.MILITARY_GREEN, 
-                          config.SCREEN_WIDTH // 2, 90, center=True)
-            self.draw_text(self.current_sequence, self.font_header, config.AMBER, 
-                          config.SCREEN_WIDTH // 2, 150, center=True)
-            remaining = self.show_duration - (time.time() - self.show_start_time)
-            self.draw_text(f"{int(remaining)}s", self.font_normal, config.GRAY, 
-                          config.SCREEN_WIDTH // 2, 210, center=True)
-                          
-        elif self.state == "PLANT_INPUT":
-            self.draw_text(f"ENTER SEQUENCE {self.current_series + 1}/{self.num_series}", 
-                          self.font_normal, config.MILITARY_GREEN, 
-                          config.SCREEN_WIDTH // 2, 90, center=True)
-            display = self.input_buffer + "_" * (self.digits_per_series - len(self.input_buffer))
-            self.draw_text(display, self.font_header, config.AMBER, 
-                          config.SCREEN_WIDTH // 2, 150, center=True)
+        if self.state == "PLANT_INPUT":
             self.draw_text("MINUS (-) TO DELETE", self.font_small, config.GRAY, 
                           config.SCREEN_WIDTH // 2, 220, center=True)
                           
         elif self.state == "ARMED":
-            elapsed = time.time() - self.plant_time
-            remaining = max(0, self.countdown_time - elapsed)
-            
-            color = config.MILITARY_GREEN if remaining > 10 else config.ALERT_RED
-            self.draw_text(f"{int(remaining):02d}", self.font_header, color, 
-                          config.SCREEN_WIDTH // 2, 80, center=True)
-            
             self.draw_text("BOMB ARMED!", self.font_normal, config.ALERT_RED, 
                           config.SCREEN_WIDTH // 2, 140, center=True)
             self.draw_text("PRESS 1 TO START DEFUSE", self.font_small, config.MILITARY_GREEN, 
                           config.SCREEN_WIDTH // 2, 180, center=True)
-            
-            # Start defuse if user presses 1
-            if self.state == "ARMED":  # Check again in case it changed
-                pass  # Will be handled in handle_input
-                
-        elif self.state == "DEFUSE_SHOW":
+                          
+        elif self.state == "EXPLODED":
+            self.draw_text("BOMB EXPLODED!", self.font_header, config.ALERT_RED, 
+                          config.SCREEN_WIDTH // 2, 140, center=True)
+            self.draw_footer("PRESS MINUS (-) TO EXIT", 250)
+                          
+        elif self.state == "DEFUSED":
+            self.draw_text("BOMB DEFUSED!", self.font_header, config.MILITARY_GREEN, 
+                          config.SCREEN_WIDTH // 2, 140, center=True)
+            self.draw_footer("PRESS MINUS (-) TO EXIT", 250)
+    
+    def draw(self):
+        self.draw_background()
+        self.draw_peers()
+        
+        if self.state in ["PLANT_SHOW", "DEFUSE_SHOW"]:
             self.draw_text(f"MEMORIZE SEQUENCE {self.current_series + 1}/{self.num_series}", 
                           self.font_normal, config.MILITARY_GREEN, 
                           config.SCREEN_WIDTH // 2, 90, center=True)
             self.draw_text(self.current_sequence, self.font_header, config.AMBER, 
                           config.SCREEN_WIDTH // 2, 150, center=True)
-            remaining = self.show_duration - (time.time() - self.show_start_time)
-            self.draw_text(f"{int(remaining)}s", self.font_normal, config.GRAY, 
-                          config.SCREEN_WIDTH // 2, 210, center=True)
+            if self.show_start_time is not None:
+                remaining = self.show_duration - (self.clock.now - self.show_start_time)
+                self.draw_text(f"{int(remaining)}s", self.font_normal, config.GRAY, 
+                              config.SCREEN_WIDTH // 2, 210, center=True)
                           
-        elif self.state == "DEFUSE_INPUT":
+        elif self.state in ["PLANT_INPUT", "DEFUSE_INPUT"]:
             self.draw_text(f"ENTER SEQUENCE {self.current_series + 1}/{self.num_series}", 
                           self.font_normal, config.MILITARY_GREEN, 
                           config.SCREEN_WIDTH // 2, 90, center=True)
@@ -208,26 +216,9 @@ class SimonSaysPlantView(BaseView):
             self.draw_text(display, self.font_header, config.AMBER, 
                           config.SCREEN_WIDTH // 2, 150, center=True)
                           
-        elif self.state == "EXPLODED":
-            self.draw_text("BOMB EXPLODED!", self.font_header, config.ALERT_RED, 
-                          config.SCREEN_WIDTH // 2, 140, center=True)
-            self.draw_text("PRESS MINUS (-) TO EXIT", self.font_small, config.GRAY, 
-                          config.SCREEN_WIDTH // 2, 250, center=True)
-                          
-        elif self.state == "DEFUSED":
-            self.draw_text("BOMB DEFUSED!", self.font_header, config.MILITARY_GREEN, 
-                          config.SCREEN_WIDTH // 2, 140, center=True)
-            self.draw_text("PRESS MINUS (-) TO EXIT", self.font_small, config.GRAY, 
-                          config.SCREEN_WIDTH // 2, 250, center=True)
-    
-    # Override handle_input to add defuse start
-    def handle_input(self, action):
-        if self.state == "ARMED" and action == '1':
-            # Start defuse sequence
-            self.current_series = 0
-            self.state = "DEFUSE_SHOW"
-            self.show_start_time = None
-            return
+        elif self.state == "ARMED":
+            remaining = self.countdown.remaining(self.clock.now)
             
-        # Call parent implementation for other cases
-        super().handle_input(action)
+            color = config.MILITARY_GREEN if remaining > 10 else config.ALERT_RED
+            self.draw_text(f"{int(remaining):02d}", self.font_header, color, 
+                          config.SCREEN_WIDTH // 2, 80, center=True)
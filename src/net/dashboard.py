@@ -0,0 +1,200 @@
+"""
+Referee status dashboard.
+A small asyncio HTTP server on its own thread. It serves the current
+view, game state, countdown, team times and settings as JSON and pushes
+updates to browsers with Server-Sent Events:
+
+    GET /         page that follows /events (open it on a phone)
+    GET /status   latest snapshot as JSON
+    GET /events   text/event-stream, one JSON snapshot per update
+
+The server only reads the snapshot the UIManager publishes each frame
+(UIManager.publish_snapshot), an immutable mapping whose reference is
+replaced, so it never touches a live view and never takes a lock.
+
+    server = DashboardServer(lambda: ui_manager.snapshot)
+    ...
+    server.close()
+"""
+import asyncio
+import json
+import threading
+
+from src import config
+
+REQUEST_TIMEOUT = 5.0    # Seconds to receive the request headers
+WRITE_TIMEOUT = 5.0      # A client that does not read for this long is dropped
+KEEPALIVE_INTERVAL = 15.0
+MAX_REQUEST = 8192
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 503: "Service Unavailable"}
+
+PAGE = b"""<!DOCTYPE html>
+<html><head><meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Airsoft Bomb</title>
+<style>
+body { background: #0a0a0a; color: #32cd32; font-family: monospace; margin: 1em; }
+#state { font-size: 2em; } #remaining { font-size: 4em; color: #ffbf00; }
+.lost { color: #dc143c; } td { padding: 0 1em 0 0; }
+</style></head><body>
+<div id="view"></div><div id="state"></div><div id="remaining"></div>
+<table id="fields"></table><h3>Settings</h3><table id="settings"></table>
+<script>
+function rows(id, values) {
+  document.getElementById(id).innerHTML = Object.entries(values || {})
+    .map(([k, v]) => "<tr><td>" + k + "</td><td>" + v + "</td></tr>").join("");
+}
+function show(s) {
+  document.getElementById("view").textContent = s.view + (s.bomb_id != null ? " #" + s.bomb_id : "");
+  document.getElementById("state").textContent = s.state || "";
+  var r = s.remaining;
+  document.getElementById("remaining").textContent = r == null ? "" :
+    Math.floor(r / 60) + ":" + String(Math.floor(r % 60)).padStart(2, "0");
+  var fields = Object.assign({}, s.details);
+  if (s.team_a != null && s.mode != "demolition") { fields.team_a = Math.round(s.team_a * 100) + "%"; fields.team_b = Math.round(s.team_b * 100) + "%"; }
+  if (s.winner) fields.winner = s.winner;
+  rows("fields", fields); rows("settings", s.settings);
+}
+var events = new EventSource("/events");
+events.onmessage = function (e) { document.body.className = ""; show(JSON.parse(e.data)); };
+events.onerror = function () { document.body.className = "lost"; };
+</script></body></html>
+"""
+
+
+def _json_default(value):
+    # Snapshots are built from read-only mappings
+    return dict(value)
+
+
+class DashboardServer:
+    def __init__(self, source, host=None, port=None, push_interval=None, max_clients=None):
+        self.source = source  # Callable returning the latest snapshot (or None)
+        self.host = host if host is not None else config.DASHBOARD_HOST
+        self.port = port if port is not None else config.DASHBOARD_PORT
+        self.push_interval = push_interval if push_interval is not None else config.DASHBOARD_PUSH_INTERVAL
+        self.max_clients = max_clients if max_clients is not None else config.DASHBOARD_MAX_CLIENTS
+        self.clients = 0
+
+        # Only used on the server thread
+        self._encoded_for = None
+        self._encoded = b"null"
+
+        self._loop = asyncio.new_event_loop()
+        self._server = None
+        self._error = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="dashboard", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+        print(f"[DASHBOARD] Serving on http://{self.host}:{self.port}/")
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle, self.host, self.port, limit=MAX_REQUEST))
+            # Port 0 picks a free port
+            self.port = self._server.sockets[0].getsockname()[1]
+        except OSError as e:
+            self._error = e
+            self._ready.set()
+            self._loop.close()
+            return
+        self._ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._server.close()
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self._loop.run_until_complete(self._server.wait_closed())
+            self._loop.close()
+
+    def _encode(self, snapshot):
+        """JSON of a snapshot, encoded once however many clients read it"""
+        if snapshot is not self._encoded_for:
+            self._encoded = json.dumps(snapshot, default=_json_default).encode('utf-8')
+            self._encoded_for = snapshot
+        return self._encoded
+
+    async def _handle(self, reader, writer):
+        try:
+            try:
+                request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), REQUEST_TIMEOUT)
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                return
+            parts = request.split(b"\r\n", 1)[0].decode('latin-1').split()
+            if len(parts) != 3:
+                await self._respond(writer, 400)
+                return
+            method, target = parts[0], parts[1]
+            path = target.split("?", 1)[0]
+            if method != "GET":
+                await self._respond(writer, 405)
+            elif path == "/":
+                await self._respond(writer, 200, PAGE, "text/html; charset=utf-8")
+            elif path == "/status":
+                await self._respond(writer, 200, self._encode(self.source()), "application/json")
+            elif path == "/events":
+                await self._stream(writer)
+            else:
+                await self._respond(writer, 404)
+        except (ConnectionError, asyncio.TimeoutError):
+            pass
+        except asyncio.CancelledError:
+            # Server shutting down
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, status, body=None, content_type="text/plain"):
+        if body is None:
+            body = REASONS[status].encode('ascii')
+        writer.write(f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                     f"Content-Type: {content_type}\r\n"
+                     f"Content-Length: {len(body)}\r\n"
+                     "Cache-Control: no-store\r\n"
+                     "Access-Control-Allow-Origin: *\r\n"
+                     "Connection: close\r\n\r\n".encode('ascii') + body)
+        await asyncio.wait_for(writer.drain(), WRITE_TIMEOUT)
+
+    async def _stream(self, writer):
+        if self.clients >= self.max_clients:
+            await self._respond(writer, 503)
+            return
+        self.clients += 1
+        try:
+            writer.write(b"HTTP/1.1 200 OK\r\n"
+                         b"Content-Type: text/event-stream\r\n"
+                         b"Cache-Control: no-store\r\n"
+                         b"Access-Control-Allow-Origin: *\r\n"
+                         b"Connection: keep-alive\r\n\r\n")
+            last = None
+            idle = 0.0
+            while True:
+                snapshot = self.source()
+                if snapshot is not last:
+                    last = snapshot
+                    idle = 0.0
+                    writer.write(b"data: " + self._encode(snapshot) + b"\n\n")
+                elif idle >= KEEPALIVE_INTERVAL:
+                    idle = 0.0
+                    writer.write(b": keepalive\n\n")
+                await asyncio.wait_for(writer.drain(), WRITE_TIMEOUT)
+                await asyncio.sleep(self.push_interval)
+                idle += self.push_interval
+        finally:
+            self.clients -= 1
+
+    def close(self):
+        if self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=2.0)
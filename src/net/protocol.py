@@ -0,0 +1,117 @@
+"""
+Wire format of the multi-bomb state sync.
+A bomb's state is a BombStatus of small integers (mode and state as
+table indices, remaining time in milliseconds, team progress scaled to
+16 bits), so a packet only needs a few bytes and two statuses compare
+equal when nothing visible changed.
+
+Every packet starts with a 12-byte header (magic, version, kind, bomb
+id, sequence number) followed by a field mask and the fields present:
+a keyframe carries all of them, a delta only those that changed since
+the previous packet. Values are absolute, so a receiver that missed a
+packet can still apply later deltas; only the fields changed in the lost
+packet stay stale until the next keyframe.
+"""
+import struct
+from collections import namedtuple
+
+MAGIC = 0xAB5B
+VERSION = 1
+
+KEYFRAME = 1
+DELTA = 2
+
+HEADER = struct.Struct("<HBBII")  # magic, version, kind, bomb id, sequence
+MASK = struct.Struct("<B")
+
+BombStatus = namedtuple("BombStatus", "mode state remaining team_a team_b winner")
+
+# Field formats, in BombStatus order
+FIELD_FORMATS = tuple(struct.Struct("<" + fmt) for fmt in ("B", "B", "I", "H", "H", "B"))
+ALL_FIELDS = (1 << len(FIELD_FORMATS)) - 1
+
+# Table indices sent for mode names, view states and winners
+MODES = ("demolition", "domination", "hold_button", "nfc", "simon", "hacking")
+STATES = ("MENU", "WAITING", "PLAYING", "PLANT_SHOW", "PLANT_INPUT", "ARMED",
+          "DEFUSE_SHOW", "DEFUSE_INPUT", "EXPLODED", "DEFUSED", "SUCCESS",
+          "FAILED", "FINISHED")
+WINNERS = (None, "A", "B", "ATTACKERS", "DEFENDERS")
+UNKNOWN = 0xFF
+
+NO_TIME = 0xFFFFFFFF  # remaining when no countdown is running
+PROGRESS_SCALE = 0xFFFF
+
+
+def _index(table, value):
+    try:
+        return table.index(value)
+    except ValueError:
+        return UNKNOWN
+
+
+def make_status(mode, state, remaining=None, team_a=0.0, team_b=0.0, winner=None):
+    """
+    Quantized status of a view: remaining in seconds (None if no
+    countdown), team progress as fractions from 0.0 to 1.0.
+    """
+    return BombStatus(
+        _index(MODES, mode),
+        _index(STATES, state),
+        NO_TIME if remaining is None else min(int(remaining * 1000), NO_TIME - 1),
+        int(max(0.0, min(1.0, team_a)) * PROGRESS_SCALE),
+        int(max(0.0, min(1.0, team_b)) * PROGRESS_SCALE),
+        _index(WINNERS, winner),
+    )
+
+
+def describe(status):
+    """Plain values of a BombStatus: names, seconds and fractions"""
+    return {
+        "mode": MODES[status.mode] if status.mode < len(MODES) else None,
+        "state": STATES[status.state] if status.state < len(STATES) else None,
+        "remaining": None if status.remaining == NO_TIME else status.remaining / 1000,
+        "team_a": status.team_a / PROGRESS_SCALE,
+        "team_b": status.team_b / PROGRESS_SCALE,
+        "winner": WINNERS[status.winner] if status.winner < len(WINNERS) else None,
+    }
+
+
+def encode(kind, bomb_id, seq, status, previous=None):
+    """
+    Packet for status: a keyframe, or a delta against the previous
+    status sent (None if nothing changed).
+    """
+    mask = ALL_FIELDS
+    if kind == DELTA:
+        mask = 0
+        for i, (old, new) in enumerate(zip(previous, status)):
+            if old != new:
+                mask |= 1 << i
+        if not mask:
+            return None
+    parts = [HEADER.pack(MAGIC, VERSION, kind, bomb_id, seq), MASK.pack(mask)]
+    for i, fmt in enumerate(FIELD_FORMATS):
+        if mask & (1 << i):
+            parts.append(fmt.pack(status[i]))
+    return b"".join(parts)
+
+
+def decode(packet):
+    """(kind, bomb id, sequence, {field index: value}); ValueError if malformed"""
+    try:
+        magic, version, kind, bomb_id, seq = HEADER.unpack_from(packet, 0)
+        if magic != MAGIC or version != VERSION or kind not in (KEYFRAME, DELTA):
+            raise ValueError("not a sync packet")
+        offset = HEADER.size
+        (mask,) = MASK.unpack_from(packet, offset)
+        offset += MASK.size
+        fields = {}
+        for i, fmt in enumerate(FIELD_FORMATS):
+            if mask & (1 << i):
+                (fields[i],) = fmt.unpack_from(packet, offset)
+                offset += fmt.size
+    except struct.error:
+        raise ValueError("truncated sync packet")
+    if kind == KEYFRAME and mask != ALL_FIELDS:
+        raise ValueError("incomplete keyframe")
+    return kind, bomb_id, seq, fields
@@ -0,0 +1,251 @@
+"""
+Multi-bomb state sync over UDP multicast.
+Each bomb publishes the status of its current game once per frame
+(publish() only stores it); a background thread sends it to the
+multicast group at most config.SYNC_RATE times per second, as a delta
+against the previous packet, with a full keyframe every
+config.SYNC_KEYFRAME_INTERVAL seconds and on every state transition. The
+same thread receives the other bombs' packets and swaps in a new
+read-only snapshot of their states, so the render loop never blocks or
+takes a lock. `version` only changes (and the main loop is only woken)
+when what is shown of the other bombs changes, i.e. a bomb joins or
+drops or its label (PeerState.label) changes, so an idle peer does not
+keep the display awake:
+
+    sync = BombSync()
+    sync.publish(view.get_status())
+    for peer in sync.peers.values():
+        print(peer.bomb_id, peer.state, peer.remaining(time.monotonic()))
+
+Several instances on one host share the group over loopback:
+
+    BombSync(interface='127.0.0.1')
+"""
+import os
+import select
+import socket
+import struct
+import threading
+import time
+from collections import namedtuple
+from types import MappingProxyType
+
+from src import config
+from src.hardware.events import wake_main_loop
+from src.net.protocol import (DELTA, KEYFRAME, MODES, NO_TIME, PROGRESS_SCALE, STATES,
+                              WINNERS, BombStatus, decode, encode)
+
+SEQ_MASK = 0xFFFFFFFF
+MAX_PACKET = 512
+
+
+def _newer(seq, last):
+    """True if seq comes after last (sequence numbers wrap around)"""
+    return 0 < (seq - last) & SEQ_MASK < 0x80000000
+
+
+def _lookup(table, index):
+    return table[index] if index < len(table) else None
+
+
+class PeerState(namedtuple("PeerState", "bomb_id status seq received_at synced")):
+    """
+    Last known state of another bomb. synced is False after a lost
+    packet, until the next keyframe.
+    """
+    __slots__ = ()
+
+    @property
+    def mode(self):
+        return _lookup(MODES, self.status.mode)
+
+    @property
+    def state(self):
+        return _lookup(STATES, self.status.state)
+
+    @property
+    def winner(self):
+        return _lookup(WINNERS, self.status.winner)
+
+    @property
+    def team_a(self):
+        return self.status.team_a / PROGRESS_SCALE
+
+    @property
+    def team_b(self):
+        return self.status.team_b / PROGRESS_SCALE
+
+    def remaining(self, now):
+        """Countdown seconds left at monotonic time now (None if not counting down)"""
+        if self.status.remaining == NO_TIME:
+            return None
+        return max(0.0, self.status.remaining / 1000 - (now - self.received_at))
+
+    def label(self, now):
+        """The line shown for this bomb on the others' screens (BaseView.draw_peers)"""
+        text = f"#{self.bomb_id % 10000:04d} {self.state or '?'}"
+        remaining = self.remaining(now)
+        if remaining is not None:
+            text += f" {int(remaining) // 60}:{int(remaining) % 60:02d}"
+        elif self.mode in ("domination", "hold_button") and self.state == "PLAYING":
+            text += f" A{int(self.team_a * 100)}% B{int(self.team_b * 100)}%"
+        elif self.winner:
+            text += f" {self.winner}"
+        return text
+
+
+class BombSync:
+    def __init__(self, bomb_id=None, group=None, port=None, interface=None, ttl=None,
+                 rate=None, keyframe_interval=None, peer_timeout=None):
+        if bomb_id is None:
+            bomb_id = config.SYNC_BOMB_ID
+        self.bomb_id = bomb_id if bomb_id is not None else int.from_bytes(os.urandom(4), 'little')
+        self.group = group if group is not None else config.SYNC_GROUP
+        self.port = port if port is not None else config.SYNC_PORT
+        interface = interface if interface is not None else config.SYNC_INTERFACE
+        ttl = ttl if ttl is not None else config.SYNC_TTL
+        self.send_interval = 1.0 / (rate if rate is not None else config.SYNC_RATE)
+        self.keyframe_interval = (keyframe_interval if keyframe_interval is not None
+                                  else config.SYNC_KEYFRAME_INTERVAL)
+        self.peer_timeout = peer_timeout if peer_timeout is not None else config.SYNC_PEER_TIMEOUT
+
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        try:
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if hasattr(socket, 'SO_REUSEPORT'):
+                # Several instances on one host (loopback tests)
+                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            self.sock.bind(('', self.port))
+            membership = struct.pack("4s4s", socket.inet_aton(self.group),
+                                     socket.inet_aton(interface))
+            self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, membership)
+            self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF,
+                                 socket.inet_aton(interface))
+            self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, ttl)
+            self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+            self.sock.setblocking(False)
+        except OSError:
+            self.sock.close()
+            raise
+
+        # Written by the main thread, read by the sync thread
+        self._status = None
+        # Sync thread state
+        self.seq = 0
+        self._last_sent = None
+        self._next_keyframe = 0.0
+        self._peer_states = {}
+        self._send_error = False
+        self._shown = ()
+        # Read-only snapshot for the main thread, replaced on every change
+        self.peers = MappingProxyType({})
+        self.version = 0
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="bomb-sync", daemon=True)
+        self._thread.start()
+        print(f"[SYNC] Bomb {self.bomb_id:08x} on {self.group}:{self.port}")
+
+    def publish(self, status):
+        """Set the status to send (a BombStatus, or None when no game is running)"""
+        self._status = status
+
+    def _run(self):
+        next_send = time.monotonic()
+        while not self._stop.is_set():
+            timeout = max(0.0, next_send - time.monotonic())
+            try:
+                readable, _, _ = select.select([self.sock], [], [], timeout)
+            except (OSError, ValueError):
+                # Socket closed
+                return
+            now = time.monotonic()
+            changed = self._receive(now) if readable else False
+            if now >= next_send:
+                self._send(now)
+                changed = self._expire(now) or changed
+                next_send = now + self.send_interval
+            if changed:
+                self.peers = MappingProxyType(dict(self._peer_states))
+            # Labels also change without packets as countdowns run out
+            shown = tuple((bomb_id, peer.label(now))
+                          for bomb_id, peer in sorted(self._peer_states.items()))
+            if shown != self._shown:
+                self._shown = shown
+                self.version += 1
+                wake_main_loop()
+
+    def _send(self, now):
+        status = self._status
+        if status is None:
+            self._last_sent = None
+            return
+        last = self._last_sent
+        if (last is None or now >= self._next_keyframe
+                or status.mode != last.mode or status.state != last.state):
+            kind = KEYFRAME
+            self._next_keyframe = now + self.keyframe_interval
+        else:
+            kind = DELTA
+        seq = (self.seq + 1) & SEQ_MASK
+        packet = encode(kind, self.bomb_id, seq, status, last)
+        if packet is None:
+            return
+        try:
+            self.sock.sendto(packet, (self.group, self.port))
+            self._send_error = False
+        except OSError as e:
+            if not self._send_error:
+                print(f"[SYNC] Send failed: {e}")
+                self._send_error = True
+            return
+        self.seq = seq
+        self._last_sent = status
+
+    def _receive(self, now):
+        changed = False
+        while True:
+            try:
+                packet, _ = self.sock.recvfrom(MAX_PACKET)
+            except (BlockingIOError, InterruptedError):
+                return changed
+            except OSError:
+                return changed
+            try:
+                kind, bomb_id, seq, fields = decode(packet)
+            except ValueError:
+                continue
+            if bomb_id != self.bomb_id:
+                changed = self._apply(now, kind, bomb_id, seq, fields) or changed
+
+    def _apply(self, now, kind, bomb_id, seq, fields):
+        peer = self._peer_states.get(bomb_id)
+        if peer is not None and not _newer(seq, peer.seq):
+            # Duplicate or reordered packet
+            return False
+        if kind == KEYFRAME:
+            status = BombStatus(*(fields[i] for i in range(len(BombStatus._fields))))
+            synced = True
+        elif peer is None:
+            # Nothing to apply a delta to until the first keyframe
+            return False
+        else:
+            status = peer.status._replace(**{BombStatus._fields[i]: value
+                                             for i, value in fields.items()})
+            synced = peer.synced and seq == (peer.seq + 1) & SEQ_MASK
+        self._peer_states[bomb_id] = PeerState(bomb_id, status, seq, now, synced)
+        return True
+
+    def _expire(self, now):
+        expired = [bomb_id for bomb_id, peer in self._peer_states.items()
+                   if now - peer.received_at > self.peer_timeout]
+        for bomb_id in expired:
+            del self._peer_states[bomb_id]
+            print(f"[SYNC] Lost bomb {bomb_id:08x}")
+        return bool(expired)
+
+    def close(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=1.0)
+        self.sock.close()
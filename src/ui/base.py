@@ -1,13 +1,99 @@
 import pygame
+import time
+from collections import OrderedDict
 from src import config
+from src.hardware.keymap import DEFAULT_KEYMAP
+from src.ui.fonts import get_fonts
+from src.ui.text_cache import get_text_cache
+from src.utils.sound import get_sound_manager
+
+# States in which a game is over and the player goes back to the menu
+GAME_OVER_STATES = ("EXPLODED", "DEFUSED", "SUCCESS", "FAILED", "FINISHED")
+
+# Pre-rendered static layers, shared by all instances of a view class and
+# keyed by (view class, layer key)
+MAX_STATIC_LAYERS = 32
+_static_layers = OrderedDict()
 
 class BaseView:
+    # Physical key -> action table; override, or override get_keymap for
+    # state-dependent bindings
+    keymap = DEFAULT_KEYMAP
+    # Views without per-visit state can be kept by the UIManager and
+    # reused instead of being rebuilt on every visit
+    cacheable = False
+    # Name under which finished games of this view are recorded in the
+    # results store; None for views that are not games
+    mode_name = None
+    # Views that call draw_peers(); only these are redrawn when the
+    # shown state of another bomb changes (--sync)
+    shows_peers = False
+
     def __init__(self, manager):
         self.manager = manager
         self.screen = manager.screen
-        self.font_header = pygame.font.Font(config.FONT_MAIN, config.FONT_SIZE_HEADER)
-        self.font_normal = pygame.font.Font(config.FONT_MAIN, config.FONT_SIZE_NORMAL)
-        self.font_small = pygame.font.Font(config.FONT_MAIN, config.FONT_SIZE_SMALL)
+        self.clock = manager.clock
+        self.started_at = self.clock.now
+        self.text_cache = get_text_cache()
+        self.sound = get_sound_manager()
+        fonts = get_fonts()
+        self.font_header = fonts.header
+        self.font_normal = fonts.normal
+        self.font_small = fonts.small
+        
+        # Damage tracking: everything drawn through the helpers below is
+        # recorded, and regions that differ from the previous frame are
+        # reported to the UIManager as dirty rectangles.
+        self._draw_items = {}
+        self._last_draw_items = {}
+        self._dirty_rects = []
+
+    def on_enter(self):
+        """
+        Called each time the view becomes current (cached views are
+        entered again on every visit). Override this in subclasses.
+        """
+        pass
+
+    def on_exit(self):
+        """
+        Called when another view replaces this one.
+        Override this in subclasses.
+        """
+        pass
+
+    def get_next_view(self):
+        """
+        View class the player will most likely switch to next, built ahead
+        of time by the UIManager; None if there is no obvious one.
+        """
+        if getattr(self, 'state', None) in GAME_OVER_STATES:
+            from src.ui.menu import MainMenuView
+            return MainMenuView
+        return None
+
+    def get_status(self):
+        """
+        BombStatus (src.net.protocol.make_status) shared with the other
+        bombs while this view is current; None for views that are not
+        games. Override this in game views.
+        """
+        return None
+
+    def get_details(self):
+        """
+        Mode-specific plain values shown on the status dashboard next to
+        the get_status() fields. Override this in game views.
+        """
+        return {}
+
+    def match_result(self):
+        """
+        Details of the finished game for the results store, passed as
+        keyword arguments to ResultsStore.record (winner, params,
+        wrong_codes, attempts, timings). Override this in game views.
+        """
+        return {}
 
     def handle_input(self, action):
         """
@@ -16,25 +102,180 @@ class BaseView:
         """
         pass
 
-    def update(self):
+    def get_keymap(self):
         """
-        Update logic for the view.
+        Keymap used to translate keys into the actions passed to
+        handle_input while this view is current.
+        """
+        return self.keymap
+
+    def update(self, dt):
+        """
+        Update logic for the view, called once per fixed timestep of dt
+        seconds. Read the current game time from self.clock.now.
         Override this in subclasses.
         """
         pass
 
+    def is_animating(self):
+        """
+        Return True while the view changes without input (running timers,
+        moving bars) and needs the full frame rate.
+        Override this in subclasses.
+        """
+        return False
+
     def draw(self):
         """
         Draw the view to the screen.
         Override this in subclasses.
         """
-        self.screen.fill(config.BLACK)
+        self.draw_background()
+
+    def get_layer_key(self):
+        """
+        Identify the static layer for the current state.
+        Override this in subclasses whose chrome depends on more than 'state'.
+        """
+        return getattr(self, 'state', None)
+
+    def draw_static(self):
+        """
+        Draw the parts of the view that never change for the current layer
+        key (header, divider, labels, buttons, footer). Rendered once into a
+        cached layer by draw_background(). Override this in subclasses.
+        """
+        pass
+
+    def draw_background(self):
+        """Blit the static layer for the current state, rendering it on first use"""
+        key = (type(self).__name__, self.get_layer_key())
+        layer = self._get_static_layer(key)
+        rect = self.screen.blit(layer, (0, 0))
+        self._record(("layer", key), rect)
+
+    def prewarm(self):
+        """Render the static layer for the current state ahead of the first draw"""
+        self._get_static_layer((type(self).__name__, self.get_layer_key()))
+
+    def _get_static_layer(self, key):
+        layer = _static_layers.get(key)
+        if layer is None:
+            layer = self._render_static_layer()
+            _static_layers[key] = layer
+            if len(_static_layers) > MAX_STATIC_LAYERS:
+                _static_layers.popitem(last=False)
+        else:
+            _static_layers.move_to_end(key)
+        return layer
+
+    def _render_static_layer(self):
+        layer = pygame.Surface(self.screen.get_size())
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        layer.fill(config.BLACK)
+        
+        # Point the draw helpers at the layer without recording damage
+        screen, items = self.screen, self._draw_items
+        self.screen, self._draw_items = layer, {}
+        try:
+            self.draw_static()
+        finally:
+            self.screen, self._draw_items = screen, items
+        return layer
+
+    def draw_header(self, title):
+        self.draw_text(title, self.font_header, config.MILITARY_GREEN, 
+                      config.SCREEN_WIDTH // 2, 20, center=True)
+        self.draw_line(config.MILITARY_GREEN, (20, 50), 
+                      (config.SCREEN_WIDTH - 20, 50), 2)
+
+    def draw_footer(self, text, y=None):
+        if y is None:
+            y = config.SCREEN_HEIGHT - 20
+        self.draw_text(text, self.font_small, config.GRAY, 
+                      config.SCREEN_WIDTH // 2, y, center=True)
+
+    def draw_start_button(self, label="PRESS ENTER (5) TO START"):
+        button_y = config.SCREEN_HEIGHT - 80
+        button_rect = pygame.Rect(60, button_y - 20, config.SCREEN_WIDTH - 120, 50)
+        self.draw_rect(config.DARK_GREEN, button_rect)
+        self.draw_rect(config.MILITARY_GREEN, button_rect, 2)
+        self.draw_text(label, self.font_normal, config.AMBER, 
+                      config.SCREEN_WIDTH // 2, button_y + 5, center=True)
+
+    def draw_edit_static(self, label):
+        """Chrome of the numeric edit screen shared by the config views"""
+        self.draw_text(label, self.font_normal, config.MILITARY_GREEN, 
+                      config.SCREEN_WIDTH // 2, 100, center=True)
+        self.draw_text("ENTER TO CONFIRM", self.font_small, config.GRAY, 
+                      config.SCREEN_WIDTH // 2, 220, center=True)
+        self.draw_text("MINUS (-) TO DELETE", self.font_small, config.GRAY, 
+                      config.SCREEN_WIDTH // 2, 250, center=True)
+
+    def draw_peers(self):
+        """One line at the bottom with the state of the other bombs (--sync)"""
+        sync = self.manager.sync
+        if sync is None or not sync.peers:
+            return
+        now = time.monotonic()
+        peers = sorted(sync.peers.values(), key=lambda peer: peer.bomb_id)
+        parts = [peer.label(now) for peer in peers[:config.SYNC_MAX_PEERS_SHOWN]]
+        self.draw_text("  |  ".join(parts), self.font_small, config.AMBER,
+                      config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT - 12, center=True)
 
     def draw_text(self, text, font, color, x, y, center=False):
-        surface = font.render(text, True, color)
+        surface = self.text_cache.render(text, font, color)
         rect = surface.get_rect()
         if center:
             rect.center = (x, y)
         else:
             rect.topleft = (x, y)
         self.screen.blit(surface, rect)
+        self._record(("text", text, font, tuple(color), rect.topleft), rect)
+        return rect
+
+    def draw_rect(self, color, rect, width=0):
+        drawn = pygame.draw.rect(self.screen, color, rect, width)
+        self._record(("rect", tuple(color), tuple(rect), width), drawn)
+        return drawn
+
+    def draw_line(self, color, start, end, width=1):
+        drawn = pygame.draw.line(self.screen, color, start, end, width)
+        self._record(("line", tuple(color), tuple(start), tuple(end), width), drawn)
+        return drawn
+
+    def draw_circle(self, color, center, radius, width=0):
+        drawn = pygame.draw.circle(self.screen, color, center, radius, width)
+        self._record(("circle", tuple(color), tuple(center), radius, width), drawn)
+        return drawn
+
+    def mark_dirty(self, rect=None):
+        """Force a region (or the whole screen) to be pushed this frame"""
+        if rect is None:
+            rect = self.screen.get_rect()
+        self._dirty_rects.append(pygame.Rect(rect))
+
+    def _record(self, key, rect):
+        self._draw_items[key] = rect
+
+    def collect_dirty_rects(self):
+        """
+        Return the regions that changed since the previous frame and start
+        tracking a new frame. Called by the UIManager after draw().
+        """
+        current = self._draw_items
+        previous = self._last_draw_items
+        dirty = self._dirty_rects
+        for key, rect in current.items():
+            if key not in previous:
+                dirty.append(rect)
+        for key, rect in previous.items():
+            if key not in current:
+                dirty.append(rect)
+        
+        self._last_draw_items = current
+        self._draw_items = {}
+        self._dirty_rects = []
+        return dirty
+
@@ -0,0 +1,69 @@
+"""
+Process-wide font registry.
+Fonts are loaded once per (face, size) and shared by every view, so
+switching views never re-opens or re-parses the font file.
+"""
+import os
+import pygame
+from src import config
+
+
+class FontRegistry:
+    """
+    Loads and caches pygame fonts by (face, size).
+    A face of None means config.FONT_MAIN (or the pygame default font).
+    """
+    def __init__(self, default_face=None):
+        self.default_face = self._resolve_face(default_face)
+        self._fonts = {}
+
+    def _resolve_face(self, face):
+        """Fall back to the pygame default font if a TTF file is missing"""
+        if face is None:
+            face = config.FONT_MAIN
+        if face is not None and not os.path.exists(face):
+            print(f"[FONTS] Font file {face} not found, using default font")
+            return None
+        return face
+
+    def get(self, size, face=None):
+        """Get a font, loading it on first use"""
+        if face is None:
+            face = self.default_face
+        key = (face, size)
+        font = self._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(face, size)
+            self._fonts[key] = font
+        return font
+
+    def prewarm(self, sizes=None, face=None):
+        """Load the given sizes (default: the config sizes) ahead of the first frame"""
+        if sizes is None:
+            sizes = (config.FONT_SIZE_HEADER, config.FONT_SIZE_NORMAL, config.FONT_SIZE_SMALL)
+        for size in sizes:
+            self.get(size, face)
+
+    @property
+    def header(self):
+        return self.get(config.FONT_SIZE_HEADER)
+
+    @property
+    def normal(self):
+        return self.get(config.FONT_SIZE_NORMAL)
+
+    @property
+    def small(self):
+        return self.get(config.FONT_SIZE_SMALL)
+
+# Global registry instance
+_registry_instance = None
+
+def get_fonts():
+    """Get the global font registry"""
+    global _registry_instance
+    if _registry_instance is None:
+        _registry_instance = FontRegistry()
+    return _registry_instance
@@ -1,29 +1,222 @@
-import pygame
+from collections import OrderedDict
+from types import MappingProxyType
 from src import config
+from src.hardware.keymap import DEFAULT_KEYMAP
+from src.net.protocol import describe
+from src.ui.base import GAME_OVER_STATES, BaseView
+from src.utils.clock import GameClock
+from src.utils.settings import get_settings
+
+# If the damaged area covers more than this fraction of the screen, a
+# single full-screen update is cheaper than many small ones.
+FULL_UPDATE_THRESHOLD = 0.6
+
+# Views of classes marked cacheable are kept for reuse, up to this many
+MAX_CACHED_VIEWS = 4
 
 class UIManager:
-    def __init__(self, screen):
+    def __init__(self, screen, clock=None, results=None):
         self.screen = screen
+        self.clock = clock if clock is not None else GameClock()
+        # Finished games are recorded here (a ResultsStore), if given
+        self.results = results
+        self.recorded_view = None
+        # Every input batch is written here (an InputRecorder), if set
+        self.recorder = None
+        # Multi-bomb state sync (a BombSync), if enabled
+        self.sync = None
+        # Read-only description of the last frame, replaced (never
+        # modified) by publish_snapshot for readers on other threads
+        self.snapshot = None
+        self.snapshot_count = 0
+        self._settings_snapshot = None
+        self._settings_version = None
         self.current_view = None
+        self.pending_view = None
+        self.view_cache = OrderedDict()
+        self.prepared_for = None
         self.running = True
+        self.full_redraw = True
 
-    def set_view(self, view_class):
+    def set_view(self, view):
         """
-        Switch to a new view.
+        Switch to a new view: a view class (or factory taking the manager)
+        or an already built view. The switch happens at the end of the
+        current frame (see apply_transition); the first view is shown
+        immediately.
         """
-        self.current_view = view_class(self)
+        self.pending_view = view
+        if self.current_view is None:
+            self.apply_transition()
+
+    def apply_transition(self):
+        """Switch to the pending view, if any; returns True if the view changed"""
+        target = self.pending_view
+        if target is None:
+            return False
+        self.pending_view = None
+        view = target if isinstance(target, BaseView) else self._get_view(target)
+
+        if self.current_view is not None:
+            self.current_view.on_exit()
+        self.current_view = view
+        view.on_enter()
+        self.full_redraw = True
+        self.prepared_for = None
+        return True
+
+    def _get_view(self, view_class):
+        """Cached instance of a cacheable view class, or a new view"""
+        view = self.view_cache.get(view_class)
+        if view is not None:
+            self.view_cache.move_to_end(view_class)
+            return view
+        view = view_class(self)
+        if getattr(view, 'cacheable', False):
+            self.view_cache[view_class] = view
+            if len(self.view_cache) > MAX_CACHED_VIEWS:
+                self.view_cache.popitem(last=False)
+        return view
+
+    def prepare_view(self, view_class):
+        """Build a cacheable view (and its static layer) ahead of time"""
+        if view_class in self.view_cache or not getattr(view_class, 'cacheable', False):
+            return
+        self._get_view(view_class).prewarm()
 
     def handle_input(self, actions):
+        if self.recorder is not None and actions:
+            self.recorder.record(self.clock, actions)
+        # A switch requested outside the frame loop happens first
+        self.apply_transition()
         if self.current_view:
             for action in actions:
                 self.current_view.handle_input(action)
+                if self.pending_view is not None:
+                    # The rest of the batch was meant for the old view
+                    break
+            self.record_game_over()
+
+    def record_game_over(self):
+        """Record the current game in the results store once it is over"""
+        view = self.current_view
+        if (self.results is None or view is None or view.mode_name is None
+                or view is self.recorded_view
+                or getattr(view, 'state', None) not in GAME_OVER_STATES):
+            return
+        self.recorded_view = view
+        self.results.record(view.mode_name, view.state, self.clock.now - view.started_at,
+                            **view.match_result())
+
+    def get_status(self):
+        """Status of the current game for the multi-bomb sync (None outside games)"""
+        if self.current_view is None:
+            return None
+        return self.current_view.get_status()
+
+    def publish_snapshot(self):
+        """
+        Publish the current view, game state and settings as a new
+        read-only snapshot. Other threads (the status dashboard) only
+        ever read self.snapshot, so they never see a live view object or
+        a half-updated frame, and nobody takes a lock.
+        """
+        view = self.current_view
+        self.snapshot_count += 1
+        snapshot = {
+            "frame": self.snapshot_count,
+            "time": self.clock.now,
+            "view": type(view).__name__ if view is not None else None,
+            "mode": None,
+            "state": getattr(view, 'state', None),
+            "remaining": None,
+            "team_a": None,
+            "team_b": None,
+            "winner": None,
+        }
+        status = view.get_status() if view is not None else None
+        if status is not None:
+            snapshot.update(describe(status))
+            snapshot["details"] = MappingProxyType(dict(view.get_details()))
+        settings = get_settings()
+        if settings.version != self._settings_version or self._settings_snapshot is None:
+            self._settings_snapshot = MappingProxyType({
+                key: value for key, value in settings.get_all().items()
+                if not settings.schema[key].secret})
+            self._settings_version = settings.version
+        snapshot["settings"] = self._settings_snapshot
+        if self.sync is not None:
+            snapshot["bomb_id"] = self.sync.bomb_id
+        self.snapshot = MappingProxyType(snapshot)
+
+    def get_keymap(self):
+        """Keymap used to translate physical keys for the current view"""
+        if self.current_view is None:
+            return DEFAULT_KEYMAP
+        return self.current_view.get_keymap()
+
+    def is_animating(self):
+        return self.current_view is not None and self.current_view.is_animating()
 
     def update(self):
-        if self.current_view:
-            self.current_view.update()
+        """Advance the game clock and run the fixed-timestep updates due this frame"""
+        self.clock.tick()
+        for dt in self.clock.steps():
+            # A view that is being left is not updated any more
+            if self.current_view and self.pending_view is None:
+                self.current_view.update(dt)
+        self.record_game_over()
+        self.apply_transition()
+
+        # Build the screen the player will most likely go to next (e.g.
+        # the main menu once a game is over) while nothing is happening
+        view = self.current_view
+        if view is not None and self.prepared_for is not view:
+            next_view = view.get_next_view()
+            if next_view is not None:
+                self.prepared_for = view
+                self.prepare_view(next_view)
 
     def draw(self):
-        if self.current_view:
-            self.current_view.draw()
-        else:
+        """
+        Draw the current view and return the list of screen regions that
+        must be pushed to the display (empty if nothing changed).
+        """
+        self.apply_transition()
+        screen_rect = self.screen.get_rect()
+        if not self.current_view:
             self.screen.fill(config.BLACK)
+            return [screen_rect]
+
+        self.current_view.draw()
+        dirty = self.current_view.collect_dirty_rects()
+
+        if self.full_redraw:
+            self.full_redraw = False
+            return [screen_rect]
+        return merge_rects(dirty, screen_rect)
+
+def merge_rects(rects, screen_rect):
+    """
+    Merge overlapping rectangles and clip them to the screen.
+    Falls back to a single full-screen rect when most of it is damaged.
+    """
+    merged = []
+    for rect in rects:
+        rect = rect.clip(screen_rect)
+        if rect.width == 0 or rect.height == 0:
+            continue
+        # Absorb every existing rect this one touches
+        i = 0
+        while i < len(merged):
+            if rect.colliderect(merged[i]):
+                rect = rect.union(merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+
+    area = sum(r.width * r.height for r in merged)
+    if area > screen_rect.width * screen_rect.height * FULL_UPDATE_THRESHOLD:
+        return [screen_rect]
+    return merged
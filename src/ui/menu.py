@@ -1,8 +1,9 @@
-import pygame
 from src import config
 from src.ui.base import BaseView
 
 class MainMenuView(BaseView):
+    cacheable = True
+
     def __init__(self, manager):
         super().__init__(manager)
         self.menu_items = [
@@ -21,50 +22,35 @@ class MainMenuView(BaseView):
         elif action == '2':
             from src.ui.mode_config import ModeConfigView
             from src.modes.domination import DominationView
-            self.manager.set_view(lambda mgr: ModeConfigView(
-                mgr, "DOMINATION MODE", DominationView,
-                [
-                    ("TARGET TIME (s)", "target_time", 60, 30, 300),
-                ]
+            self.manager.set_view(ModeConfigView(
+                self.manager, "DOMINATION MODE", DominationView,
+                [("domination_target_time", "target_time")]
             ))
         elif action == '3':
             from src.ui.mode_config import ModeConfigView
             from src.modes.hold_button import HoldButtonView
-            
-            # Create custom view for decimal values
-            view = ModeConfigView(
-                mgr, "HOLD THE BUTTON", HoldButtonView,
+            self.manager.set_view(ModeConfigView(
+                self.manager, "HOLD THE BUTTON", HoldButtonView,
                 [
-                    ("CAPTURE SPEED (x10)", "capture_speed_x10", 20, 5, 50),
-                    ("DECAY SPEED (x10)", "decay_speed_x10", 5, 1, 20),
+                    ("hold_button_capture_speed", "capture_speed"),
+                    ("hold_button_decay_speed", "decay_speed"),
                 ]
-            )
-            # Override start game to convert values
-            original_start = view._start_game
-            def custom_start():
-                game_view = HoldButtonView(view.manager)
-                game_view.capture_speed = view.values['capture_speed_x10'] / 100.0
-                game_view.decay_speed = view.values['decay_speed_x10'] / 100.0
-                view.manager.set_view(lambda mgr: game_view)
-            view._start_game = custom_start
-            self.manager.set_view(lambda mgr: view)
+            ))
         elif action == '4':
             from src.ui.mode_config import ModeConfigView
             from src.modes.nfc_mode import NFCModeView
-            self.manager.set_view(lambda mgr: ModeConfigView(
-                mgr, "NFC PLANT/DEFUSE", NFCModeView,
-                [
-                    ("COUNTDOWN TIME (s)", "countdown_time", 45, 10, 300),
-                ]
+            self.manager.set_view(ModeConfigView(
+                self.manager, "NFC PLANT/DEFUSE", NFCModeView,
+                [("countdown_time", "countdown_time")]
             ))
         elif action == '5':
             from src.ui.mode_config import ModeConfigView
             from src.modes.hacking import HackingView
-            self.manager.set_view(lambda mgr: ModeConfigView(
-                mgr, "HACKING MODE", HackingView,
+            self.manager.set_view(ModeConfigView(
+                self.manager, "HACKING MODE", HackingView,
                 [
-                    ("ROUNDS TO WIN", "rounds_needed", 3, 1, 10),
-                    ("MAX ATTEMPTS", "max_attempts", 5, 3, 10),
+                    ("hacking_rounds", "rounds_needed"),
+                    ("hacking_max_attempts", "max_attempts"),
                 ]
             ))
         elif action == '6':
@@ -75,14 +61,16 @@ class MainMenuView(BaseView):
             self.manager.running = False
 
     def draw(self):
-        self.screen.fill(config.BLACK)
-        
+        # The whole menu is static
+        self.draw_background()
+
+    def draw_static(self):
         # Draw Header
         header_text = "AIRSOFT BOMB SYSTEM"
         self.draw_text(header_text, self.font_header, config.MILITARY_GREEN, config.SCREEN_WIDTH // 2, 30, center=True)
         
         # Draw decorative line
-        pygame.draw.line(self.screen, config.MILITARY_GREEN, (20, 60), (config.SCREEN_WIDTH - 20, 60), 2)
+        self.draw_line(config.MILITARY_GREEN, (20, 60), (config.SCREEN_WIDTH - 20, 60), 2)
 
         # Draw Menu Items
         start_y = 100
@@ -1,36 +1,47 @@
-import pygame
 from src import config
+from src.hardware.keymap import CONFIRM_KEYMAP, EDIT_KEYMAP
 from src.ui.base import BaseView
+from src.utils.settings import get_settings
 
 class ModeConfigView(BaseView):
     """
     Generic configuration view for game modes.
     Shows editable parameters before starting the mode.
     """
-    def __init__(self, manager, mode_name, mode_class, config_params):
+    def __init__(self, manager, title, mode_class, config_params):
         super().__init__(manager)
-        self.mode_name = mode_name
+        self.title = title
         self.mode_class = mode_class
-        self.config_params = config_params  # List of (name, key, default, min, max)
+        # List of (setting key, attribute of the mode view); label, range
+        # and default come from the settings schema
+        self.config_params = config_params
+        self.fields = {}
         self.values = {}
         
-        # Initialize values
-        for name, key, default, min_val, max_val in config_params:
-            self.values[key] = default
+        # Initialize values from the current settings
+        settings = get_settings()
+        for setting_key, attribute in config_params:
+            self.fields[attribute] = settings.schema[setting_key]
+            self.values[attribute] = settings.get(setting_key)
+        self._build_value_texts()
         
         self.editing_field = None
         self.input_buffer = ""
         
+    def get_keymap(self):
+        # Numpad 5 starts the game unless a value is being typed
+        return EDIT_KEYMAP if self.editing_field is not None else CONFIRM_KEYMAP
+
     def handle_input(self, action):
         if self.editing_field is None:
             # Menu mode
-            for i, (name, key, default, min_val, max_val) in enumerate(self.config_params):
+            for i, attribute in enumerate(self.fields):
                 if action == str(i + 1):
-                    self.editing_field = key
-                    self.input_buffer = str(self.values[key])
+                    self.editing_field = attribute
+                    self.input_buffer = self.fields[attribute].edit_text(self.values[attribute])
                     return
             
-            if action == 'SELECT' or action == '5':
+            if action == 'SELECT':
                 # Start game
                 self._start_game()
             elif action == 'BACK':
@@ -55,13 +66,9 @@ class ModeConfigView(BaseView):
             return
         
         try:
-            # Find the config param
-            for name, key, default, min_val, max_val in self.config_params:
-                if key == self.editing_field:
-                    value = int(self.input_buffer)
-                    if min_val <= value <= max_val:
-                        self.values[key] = value
-                    break
+            field = self.fields[self.editing_field]
+            self.values[self.editing_field] = field.parse(self.input_buffer)
+            self._build_value_texts()
         except ValueError:
             pass
         
@@ -75,54 +82,40 @@ class ModeConfigView(BaseView):
         for key, value in self.values.items():
             if hasattr(view, key):
                 setattr(view, key, value)
-        self.manager.set_view(lambda mgr: view)
+        self.manager.set_view(view)
     
-    def draw(self):
-        self.screen.fill(config.BLACK)
+    def _build_value_texts(self):
+        self.value_texts = [
+            f"{i + 1}. {field.label}: {field.format(self.values[attribute])}"
+            for i, (attribute, field) in enumerate(self.fields.items())
+        ]
+    
+    def get_layer_key(self):
+        return (self.title, self.editing_field)
+    
+    def draw_static(self):
+        self.draw_header(self.title)
         
-        # Header
-        self.draw_text(self.mode_name, self.font_header, config.MILITARY_GREEN, 
-                      config.SCREEN_WIDTH // 2, 20, center=True)
-        pygame.draw.line(self.screen, config.MILITARY_GREEN, (20, 50), 
-                        (config.SCREEN_WIDTH - 20, 50), 2)
+        if self.editing_field:
+            self.draw_edit_static(f"EDIT: {self.fields[self.editing_field].label}")
+        else:
+            self.draw_text("CONFIGURATION:", self.font_normal, config.MILITARY_GREEN, 
+                          config.SCREEN_WIDTH // 2, 80, center=True)
+            self.draw_start_button()
+            self.draw_footer("PRESS NUMBER TO EDIT - MINUS (-) TO GO BACK")
+    
+    def draw(self):
+        self.draw_background()
         
         if self.editing_field:
             # Show editing screen
-            field_name = ""
-            for name, key, default, min_val, max_val in self.config_params:
-                if key == self.editing_field:
-                    field_name = name
-                    break
-            
-            self.draw_text(f"EDIT: {field_name}", self.font_normal, config.MILITARY_GREEN, 
-                          config.SCREEN_WIDTH // 2, 100, center=True)
             self.draw_text(self.input_buffer or "_", self.font_header, config.AMBER, 
                           config.SCREEN_WIDTH // 2, 150, center=True)
-            self.draw_text("ENTER TO CONFIRM", self.font_small, config.GRAY, 
-                          config.SCREEN_WIDTH // 2, 220, center=True)
-            self.draw_text("MINUS (-) TO DELETE", self.font_small, config.GRAY, 
-                          config.SCREEN_WIDTH // 2, 250, center=True)
         else:
             # Show configuration menu
-            self.draw_text("CONFIGURATION:", self.font_normal, config.MILITARY_GREEN, 
-                          config.SCREEN_WIDTH // 2, 80, center=True)
-            
             start_y = 120
             line_spacing = 30
             
-            for i, (name, key, default, min_val, max_val) in enumerate(self.config_params):
-                value = self.values[key]
-                text = f"{i + 1}. {name}: {value}"
+            for i, text in enumerate(self.value_texts):
                 self.draw_text(text, self.font_small, config.MILITARY_GREEN, 
                               50, start_y + (i * line_spacing))
-            
-            # Start button
-            button_y = config.SCREEN_HEIGHT - 80
-            self.draw_text("PRESS ENTER (5) TO START", self.font_normal, config.AMBER, 
-                          config.SCREEN_WIDTH // 2, button_y, center=True)
-            button_rect = pygame.Rect(60, button_y - 20, config.SCREEN_WIDTH - 120, 50)
-            pygame.draw.rect(self.screen, config.DARK_GREEN, button_rect)
-            pygame.draw.rect(self.screen, config.MILITARY_GREEN, button_rect, 2)
-            
-            self.draw_text("PRESS NUMBER TO EDIT - MINUS (-) TO GO BACK", self.font_small, config.GRAY, 
-                          config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT - 20, center=True)
@@ -1,5 +1,5 @@
-import pygame
 from src import config
+from src.hardware.keymap import EDIT_KEYMAP
 from src.ui.base import BaseView
 from src.utils.settings import get_settings
 
@@ -7,6 +7,8 @@ class SettingsView(BaseView):
     """
     Settings screen for configuring game parameters
     """
+    cacheable = True
+
     def __init__(self, manager):
         super().__init__(manager)
         self.settings = get_settings()
@@ -18,9 +20,33 @@ class SettingsView(BaseView):
             "5. RESET DEFAULTS",
             "6. SAVE & EXIT"
         ]
+        # Setting shown after each menu item
+        self.menu_keys = ['bomb_code', 'countdown_time', 'sound_enabled', 'brightness', None, None]
         self.editing_mode = None
         self.input_buffer = ""
         
+        # Menu lines are only rebuilt when a shown setting changes
+        self._build_menu_texts()
+        self.settings.subscribe(self._on_setting_changed,
+                                [key for key in self.menu_keys if key])
+        
+    def _build_menu_texts(self):
+        self.menu_texts = [
+            f"{item}: {self.settings.format(key)}" if key else item
+            for item, key in zip(self.menu_items, self.menu_keys)
+        ]
+    
+    def _on_setting_changed(self, key, value):
+        self._build_menu_texts()
+        
+    def on_enter(self):
+        # A cached screen always opens on the menu
+        self.editing_mode = None
+        self.input_buffer = ""
+    
+    def get_keymap(self):
+        return EDIT_KEYMAP if self.editing_mode else self.keymap
+
     def handle_input(self, action):
         if self.editing_mode:
             # Handle editing mode
@@ -36,18 +62,15 @@ class SettingsView(BaseView):
         else:
             # Handle menu selection
             if action == '1':
-                self.editing_mode = 'bomb_code'
-                self.input_buffer = str(self.settings.get('bomb_code'))
+                self._start_edit('bomb_code')
             elif action == '2':
-                self.editing_mode = 'countdown_time'
-                self.input_buffer = str(self.settings.get('countdown_time'))
+                self._start_edit('countdown_time')
             elif action == '3':
                 # Toggle sound
                 current = self.settings.get('sound_enabled')
                 self.settings.set('sound_enabled', not current)
             elif action == '4':
-                self.editing_mode = 'brightness'
-                self.input_buffer = str(self.settings.get('brightness'))
+                self._start_edit('brightness')
             elif action == '5':
                 self.settings.reset_to_defaults()
             elif action == '6':
@@ -58,71 +81,49 @@ class SettingsView(BaseView):
                 from src.ui.menu import MainMenuView
                 self.manager.set_view(MainMenuView)
     
+    def _start_edit(self, key):
+        self.editing_mode = key
+        self.input_buffer = self.settings.schema[key].edit_text(self.settings.get(key))
+    
     def _save_edit(self):
-        """Save the current edit"""
+        """Save the current edit (ignored if it does not fit the schema)"""
         if not self.input_buffer:
             self.editing_mode = None
             return
             
         try:
-            if self.editing_mode == 'bomb_code':
-                self.settings.set('bomb_code', self.input_buffer)
-            elif self.editing_mode == 'countdown_time':
-                value = int(self.input_buffer)
-                if 10 <= value <= 300:
-                    self.settings.set('countdown_time', value)
-            elif self.editing_mode == 'brightness':
-                value = int(self.input_buffer)
-                if 10 <= value <= 100:
-                    self.settings.set('brightness', value)
+            setting = self.settings.schema[self.editing_mode]
+            self.settings.set(self.editing_mode, setting.parse(self.input_buffer))
         except ValueError:
             pass
         
         self.editing_mode = None
         self.input_buffer = ""
     
-    def draw(self):
-        self.screen.fill(config.BLACK)
+    def get_layer_key(self):
+        return self.editing_mode
+    
+    def draw_static(self):
+        self.draw_header("SETTINGS")
         
-        # Header
-        self.draw_text("SETTINGS", self.font_header, config.MILITARY_GREEN, 
-                      config.SCREEN_WIDTH // 2, 20, center=True)
-        pygame.draw.line(self.screen, config.MILITARY_GREEN, (20, 50), 
-                        (config.SCREEN_WIDTH - 20, 50), 2)
+        if self.editing_mode:
+            self.draw_edit_static(f"EDITING: {self.settings.schema[self.editing_mode].label}")
+        else:
+            self.draw_footer("PRESS NUMBER TO EDIT - MINUS (-) TO GO BACK")
+    
+    def draw(self):
+        self.draw_background()
         
         if self.editing_mode:
             # Show editing screen
-            self.draw_text(f"EDITING: {self.editing_mode.upper().replace('_', ' ')}", 
-                          self.font_normal, config.MILITARY_GREEN, 
-                          config.SCREEN_WIDTH // 2, 100, center=True)
             self.draw_text(self.input_buffer or "_", self.font_header, config.AMBER, 
                           config.SCREEN_WIDTH // 2, 150, center=True)
-            self.draw_text("ENTER TO CONFIRM", self.font_small, config.GRAY, 
-                          config.SCREEN_WIDTH // 2, 220, center=True)
-            self.draw_text("MINUS (-) TO DELETE", self.font_small, config.GRAY, 
-                          config.SCREEN_WIDTH // 2, 250, center=True)
         else:
             # Show settings menu
             start_y = 70
             item_spacing = 30
             
             # Display each setting with current value
-            values = [
-                f": {self.settings.get('bomb_code')}",
-                f": {self.settings.get('countdown_time')}s",
-                f": {'ON' if self.settings.get('sound_enabled') else 'OFF'}",
-                f": {self.settings.get('brightness')}%",
-                "",
-                ""
-            ]
-            
-            for i, (item, value) in enumerate(zip(self.menu_items, values)):
-                color = config.MILITARY_GREEN
-                text = item + value
-                self.draw_text(text, self.font_small, color, 
+            for i, text in enumerate(self.menu_texts):
+                self.draw_text(text, self.font_small, config.MILITARY_GREEN, 
                               40, start_y + (i * item_spacing))
-            
-            # Footer
-            self.draw_text("PRESS NUMBER TO EDIT - MINUS (-) TO GO BACK", 
-                          self.font_small, config.GRAY, 
-                          config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT - 20, center=True)
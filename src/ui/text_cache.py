@@ -0,0 +1,67 @@
+"""
+Shared cache of rendered text surfaces.
+Most text on screen (menu items, footers, headers) never changes between
+frames, so rendering it once and reusing the surface saves a FreeType
+rasterization per line per frame.
+"""
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 256
+
+
+class TextCache:
+    """
+    Bounded LRU cache of surfaces keyed by (text, font, color, antialias).
+    """
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, text, font, color, antialias=True):
+        """Return a rendered surface, rendering it only on a cache miss"""
+        key = (text, font, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        """Drop all cached surfaces (counters are kept)"""
+        self._surfaces.clear()
+
+    def get_stats(self):
+        """Get cache counters"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._surfaces),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits / total) if total else 0.0
+        }
+
+    def __len__(self):
+        return len(self._surfaces)
+
+# Global cache instance
+_cache_instance = None
+
+def get_text_cache():
+    """Get the global text cache instance"""
+    global _cache_instance
+    if _cache_instance is None:
+        _cache_instance = TextCache()
+    return _cache_instance
@@ -0,0 +1,290 @@
+"""
+Per-view frame-time benchmark.
+Builds every view through a headless UIManager, puts each game mode in
+each of its states and times handle_input, update and draw over many
+frames on an offscreen surface. Reports p50/p95/p99 frame times and
+allocations per frame, saves the results as JSON and fails when a view
+exceeds the frame budget scaled for the Raspberry Pi 2B.
+
+Usage:
+    python -m src.utils.benchmark [--frames N] [--output FILE] [--compare OLD.json]
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import pygame
+from src import config
+from src.utils.countdown import Countdown
+from src.utils.simulation import HeadlessManager, silenced
+
+# Frame budget at the target frame rate, in milliseconds
+FRAME_BUDGET_MS = 1000.0 / config.FPS
+
+# How much slower a Raspberry Pi 2B is than the machine running the
+# benchmark; the budget is divided by this factor
+PI2B_SLOWDOWN = 10.0
+
+DEFAULT_FRAMES = 2000
+WARMUP_FRAMES = 50
+ALLOC_FRAMES = 200
+
+
+def _set(**attributes):
+    """Scenario setup that assigns view attributes"""
+    def setup(view):
+        for key, value in attributes.items():
+            setattr(view, key, value)
+    return setup
+
+
+def _armed(**attributes):
+    """Scenario setup for a running countdown"""
+    def setup(view):
+        for key, value in attributes.items():
+            setattr(view, key, value)
+        view.state = "ARMED"
+        view.countdown = Countdown(view.countdown_time)
+        view.countdown.start(view.clock.now)
+    return setup
+
+
+def _config(state, **attributes):
+    """Scenario setup for a DemolitionConfigView configuration screen"""
+    def setup(view):
+        view._enter_config(state)
+        for key, value in attributes.items():
+            setattr(view, key, value)
+    return setup
+
+
+def _show(state):
+    def setup(view):
+        view.state = state
+        view.show_start_time = view.clock.now
+        view.current_sequence = view.sequences[0]
+    return setup
+
+
+def _mode_config(manager):
+    from src.ui.mode_config import ModeConfigView
+    from src.modes.domination import DominationView
+    return ModeConfigView(manager, "DOMINATION MODE", DominationView,
+                          [("domination_target_time", "target_time")])
+
+
+def _pregame_config(manager):
+    from src.ui.pregame_config import PreGameConfigView
+    from src.modes.demolition import DemolitionView
+    return PreGameConfigView(manager, "DEMOLITION MODE", DemolitionView,
+                             ["bomb_code", "countdown_time", "sound_enabled"])
+
+
+def get_scenarios():
+    """List of (name, view factory, setup function, input action)"""
+    from src.ui.menu import MainMenuView
+    from src.ui.settings import SettingsView
+    from src.ui.demolition_config import DemolitionConfigView
+    from src.modes.demolition import DemolitionView
+    from src.modes.domination import DominationView
+    from src.modes.hold_button import HoldButtonView
+    from src.modes.hacking import HackingView
+    from src.modes.nfc_mode import NFCModeView
+    from src.modes.simon_says import SimonSaysPlantView
+
+    # 'UP' is not bound in any of these states, so the dispatch path is
+    # exercised without changing the view
+    return [
+        ("MainMenuView", MainMenuView, None, 'UP'),
+        ("SettingsView", SettingsView, None, 'UP'),
+        ("SettingsView:EDIT", SettingsView, _set(editing_mode='countdown_time', input_buffer='45'), 'UP'),
+        ("ModeConfigView", _mode_config, None, 'UP'),
+        ("ModeConfigView:EDIT", _mode_config, _set(editing_field='target_time', input_buffer='60'), 'UP'),
+        ("PreGameConfigView", _pregame_config, None, 'UP'),
+        ("DemolitionConfigView:METHOD", DemolitionConfigView, None, 'UP'),
+        ("DemolitionConfigView:CONFIG_CODE", DemolitionConfigView, _config("CONFIG_CODE", selected_method="CODE"), 'UP'),
+        ("DemolitionConfigView:CONFIG_SIMON", DemolitionConfigView, _config("CONFIG_SIMON", selected_method="SIMON"), 'UP'),
+        ("DemolitionConfigView:EDIT", DemolitionConfigView, _config("CONFIG_CODE", editing_field="bomb_code", input_buffer="1234"), 'UP'),
+        ("DemolitionView:MENU", DemolitionView, _set(input_code="12"), 'UP'),
+        ("DemolitionView:ARMED", DemolitionView, _armed(countdown_time=300), 'UP'),
+        ("DemolitionView:EXPLODED", DemolitionView, _set(state="EXPLODED"), 'UP'),
+        ("DemolitionView:DEFUSED", DemolitionView, _set(state="DEFUSED"), 'UP'),
+        ("DominationView:PLAYING", DominationView, _set(current_holder='A', target_time=300), 'UP'),
+        ("DominationView:FINISHED", DominationView, _set(state="FINISHED", winner='A'), 'UP'),
+        ("HoldButtonView:PLAYING", HoldButtonView, None, 'UP'),
+        ("HoldButtonView:FINISHED", HoldButtonView, _set(state="FINISHED", winner='B'), 'UP'),
+        ("HackingView:PLAYING", HackingView, None, 'UP'),
+        ("HackingView:SUCCESS", HackingView, _set(state="SUCCESS"), 'UP'),
+        ("HackingView:FAILED", HackingView, _set(state="FAILED"), 'UP'),
+        ("NFCModeView:WAITING", NFCModeView, None, 'UP'),
+        ("NFCModeView:ARMED", NFCModeView, _armed(countdown_time=300), 'UP'),
+        ("NFCModeView:DEFUSED", NFCModeView, _set(state="DEFUSED"), 'UP'),
+        ("NFCModeView:EXPLODED", NFCModeView, _set(state="EXPLODED"), 'UP'),
+        ("SimonSaysPlantView:PLANT_SHOW", SimonSaysPlantView, _show("PLANT_SHOW"), 'UP'),
+        ("SimonSaysPlantView:PLANT_INPUT", SimonSaysPlantView, _set(state="PLANT_INPUT", input_buffer="12"), 'UP'),
+        ("SimonSaysPlantView:ARMED", SimonSaysPlantView, _armed(countdown_time=300), 'UP'),
+        ("SimonSaysPlantView:DEFUSE_SHOW", SimonSaysPlantView, _show("DEFUSE_SHOW"), 'UP'),
+        ("SimonSaysPlantView:DEFUSE_INPUT", SimonSaysPlantView, _set(state="DEFUSE_INPUT", input_buffer="12"), 'UP'),
+        ("SimonSaysPlantView:EXPLODED", SimonSaysPlantView, _set(state="EXPLODED"), 'UP'),
+        ("SimonSaysPlantView:DEFUSED", SimonSaysPlantView, _set(state="DEFUSED"), 'UP'),
+    ]
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _summary(samples_ns):
+    values = sorted(sample / 1e6 for sample in samples_ns)
+    return {
+        "p50": round(_percentile(values, 0.50), 4),
+        "p95": round(_percentile(values, 0.95), 4),
+        "p99": round(_percentile(values, 0.99), 4),
+        "max": round(values[-1], 4) if values else 0.0,
+    }
+
+
+def _prepare(factory, setup):
+    manager = HeadlessManager()
+    manager.set_view(factory)
+    view = manager.current_view
+    if setup:
+        setup(view)
+    return manager, view
+
+
+def benchmark_view(name, factory, setup, action, frames=DEFAULT_FRAMES):
+    """Time one scenario and return its statistics"""
+    manager, view = _prepare(factory, setup)
+    state = getattr(view, 'state', None)
+    perf = time.perf_counter_ns
+
+    input_ns, update_ns, draw_ns, frame_ns = [], [], [], []
+    for i in range(WARMUP_FRAMES + frames):
+        # Restart the scenario if the view left the state being measured
+        if manager.current_view is not view or getattr(view, 'state', None) != state:
+            manager, view = _prepare(factory, setup)
+
+        t0 = perf()
+        manager.handle_input([action])
+        t1 = perf()
+        manager.step()
+        t2 = perf()
+        manager.draw()
+        t3 = perf()
+
+        if i >= WARMUP_FRAMES:
+            input_ns.append(t1 - t0)
+            update_ns.append(t2 - t1)
+            draw_ns.append(t3 - t2)
+            frame_ns.append(t3 - t0)
+
+    # Allocations are measured in a separate, shorter pass because
+    # tracemalloc slows everything down
+    manager, view = _prepare(factory, setup)
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    peaks = []
+    for _ in range(ALLOC_FRAMES):
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        manager.handle_input([action])
+        manager.step()
+        manager.draw()
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+    blocks_after = sys.getallocatedblocks()
+    peaks.sort()
+
+    return {
+        "frames": frames,
+        "frame_ms": _summary(frame_ns),
+        "handle_input_ms": _summary(input_ns),
+        "update_ms": _summary(update_ns),
+        "draw_ms": _summary(draw_ns),
+        "alloc_bytes_per_frame_p50": _percentile(peaks, 0.50),
+        "alloc_bytes_per_frame_max": peaks[-1] if peaks else 0,
+        "net_blocks_per_frame": round((blocks_after - blocks_before) / ALLOC_FRAMES, 3),
+    }
+
+
+def run(frames=DEFAULT_FRAMES, slowdown=PI2B_SLOWDOWN, names=None):
+    """Benchmark every scenario and return the full report"""
+    budget_ms = FRAME_BUDGET_MS / slowdown
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "machine": platform.machine(),
+            "frames": frames,
+            "frame_budget_ms": round(FRAME_BUDGET_MS, 3),
+            "pi2b_slowdown": slowdown,
+            "scaled_budget_ms": round(budget_ms, 4),
+        },
+        "views": {},
+        "failures": [],
+    }
+
+    for name, factory, setup, action in get_scenarios():
+        if names and not any(part in name for part in names):
+            continue
+        with silenced():
+            result = benchmark_view(name, factory, setup, action, frames)
+        result["over_budget"] = result["frame_ms"]["p99"] > budget_ms
+        report["views"][name] = result
+        if result["over_budget"]:
+            report["failures"].append(name)
+        print(f"[BENCH] {name:40s} p50 {result['frame_ms']['p50']:.3f}ms "
+              f"p95 {result['frame_ms']['p95']:.3f}ms p99 {result['frame_ms']['p99']:.3f}ms "
+              f"alloc {result['alloc_bytes_per_frame_p50']}B"
+              f"{'  OVER BUDGET' if result['over_budget'] else ''}")
+    return report
+
+
+def compare(report, previous):
+    """Print the p95 frame-time change of each view against an older report"""
+    for name, result in report["views"].items():
+        old = previous.get("views", {}).get(name)
+        if not old:
+            continue
+        before = old["frame_ms"]["p95"]
+        after = result["frame_ms"]["p95"]
+        change = ((after - before) / before * 100) if before else 0.0
+        print(f"[BENCH] {name:40s} p95 {before:.3f}ms -> {after:.3f}ms ({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-view frame-time benchmark")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES)
+    parser.add_argument("--slowdown", type=float, default=PI2B_SLOWDOWN,
+                        help="how much slower the Pi 2B is than this machine")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", help="previous results JSON to compare against")
+    parser.add_argument("views", nargs="*", help="only run scenarios matching these names")
+    args = parser.parse_args()
+
+    pygame.font.init()
+    report = run(args.frames, args.slowdown, args.views)
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"[BENCH] Results saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            compare(report, json.load(f))
+
+    if report["failures"]:
+        print(f"[BENCH] Over budget ({report['meta']['scaled_budget_ms']}ms): {', '.join(report['failures'])}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Boot profiler.
+Records when every startup import and initialization step starts and
+ends (on any thread), relative to the moment this module was imported,
+and reports the timeline and the time to the first frame.
+
+    boot = get_boot_profiler()
+    pygame = boot.import_module("pygame")
+    with boot.stage("display"):
+        ...
+    boot.first_frame()
+"""
+import importlib
+import threading
+import time
+
+# Reference point of the timeline: main.py imports this module first
+BOOT_START = time.monotonic()
+
+# Modules the menu would otherwise import the first time a mode is
+# selected; main.py imports them on a background thread behind the splash
+PRELOAD_MODULES = (
+    "src.ui.demolition_config",
+    "src.ui.mode_config",
+    "src.ui.settings",
+    "src.ui.pregame_config",
+    "src.modes.demolition",
+    "src.modes.domination",
+    "src.modes.hacking",
+    "src.modes.hold_button",
+    "src.modes.nfc_mode",
+    "src.modes.simon_says",
+)
+
+
+class BootProfiler:
+    def __init__(self, start=BOOT_START):
+        self.start = start
+        self.events = []  # (start, end, label, thread name), seconds from start
+        self.first_frame_time = None
+        self.splash_time = None
+        self._lock = threading.Lock()
+
+    def _now(self):
+        return time.monotonic() - self.start
+
+    def _record(self, begin, label):
+        with self._lock:
+            self.events.append((begin, self._now(), label, threading.current_thread().name))
+
+    def stage(self, label):
+        """Context manager timing one initialization step"""
+        return _Stage(self, label)
+
+    def import_module(self, name):
+        """Import a module, timing it (near zero if it was already imported)"""
+        begin = self._now()
+        module = importlib.import_module(name)
+        self._record(begin, f"import {name}")
+        return module
+
+    def splash(self):
+        """The splash frame has been presented"""
+        self.splash_time = self._now()
+        self._record(self.splash_time, "splash frame")
+
+    def first_frame(self):
+        """The first real frame has been presented; returns the time to it in seconds"""
+        if self.first_frame_time is None:
+            self.first_frame_time = self._now()
+            self._record(self.first_frame_time, "first frame")
+            print(f"[BOOT] Time to first frame: {self.first_frame_time * 1000:.0f}ms"
+                  f" (splash at {(self.splash_time or 0) * 1000:.0f}ms)")
+        return self.first_frame_time
+
+    def report(self):
+        """Timeline of every recorded step, in start order"""
+        with self._lock:
+            events = sorted(self.events)
+        lines = [f"{'start':>9s} {'took':>9s}  {'thread':12s} step"]
+        for begin, end, label, thread in events:
+            lines.append(f"{begin * 1000:7.1f}ms {(end - begin) * 1000:7.1f}ms  {thread[:12]:12s} {label}")
+        if self.first_frame_time is not None:
+            lines.append(f"Time to first frame: {self.first_frame_time * 1000:.1f}ms")
+        return "\n".join(lines)
+
+
+class _Stage:
+    def __init__(self, profiler, label):
+        self.profiler = profiler
+        self.label = label
+
+    def __enter__(self):
+        self.begin = self.profiler._now()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler._record(self.begin, self.label)
+        return False
+
+
+# Global boot profiler instance
+_boot_profiler = None
+
+def get_boot_profiler():
+    """Get the global boot profiler instance"""
+    global _boot_profiler
+    if _boot_profiler is None:
+        _boot_profiler = BootProfiler()
+    return _boot_profiler
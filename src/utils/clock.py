@@ -0,0 +1,112 @@
+"""
+Monotonic game clock.
+All game modes read time from a single GameClock owned by the UIManager
+instead of calling time.time(), so NTP steps can not affect a running
+countdown and update()/draw() always agree on the time within a frame.
+"""
+import time
+
+DEFAULT_STEP = 1.0 / 60
+MAX_STEPS_PER_FRAME = 10
+
+
+class GameClock:
+    """
+    Game time in seconds, advanced in fixed steps.
+
+    tick() samples the time source once per frame and feeds the elapsed
+    (scaled) time into an accumulator; steps() then yields fixed-size
+    timesteps and advances `now` by each of them. `now` is the shared time
+    snapshot read by update() and draw() during the frame. time_at() maps
+    a time source reading, such as an input event's capture timestamp,
+    to game time.
+    """
+    def __init__(self, time_source=time.monotonic, step=DEFAULT_STEP,
+                 max_steps=MAX_STEPS_PER_FRAME):
+        self.time_source = time_source
+        self.step = step
+        self.max_steps = max_steps
+        self.time_scale = 1.0
+        self.paused = False
+        self.now = 0.0
+        self.step_count = 0
+        self._accumulator = 0.0
+        self._last_source_time = time_source()
+        # Game time at the last tick (now plus the accumulated time not
+        # yet stepped); None when the clock is driven by advance()
+        self._tick_game_time = 0.0
+
+    def tick(self):
+        """Sample the time source once for this frame"""
+        source_time = self.time_source()
+        elapsed = source_time - self._last_source_time
+        self._last_source_time = source_time
+        if not self.paused and elapsed > 0:
+            self._accumulator += elapsed * self.time_scale
+        # Never try to catch up more than max_steps in one frame
+        self._accumulator = min(self._accumulator, self.step * self.max_steps)
+        self._tick_game_time = self.now + self._accumulator
+
+    def steps(self):
+        """Yield the fixed timesteps due this frame, advancing `now`"""
+        while self._accumulator >= self.step:
+            self._accumulator -= self.step
+            self.now += self.step
+            self.step_count += 1
+            yield self.step
+
+    @property
+    def source_time(self):
+        """Time source reading of the last tick"""
+        return self._last_source_time
+
+    @property
+    def tick_game_time(self):
+        """Game time at the last tick (None while driven by advance())"""
+        return self._tick_game_time
+
+    def time_at(self, timestamp):
+        """
+        Game time at a time source reading, e.g. when an input event was
+        captured, independent of the frame it is handled in. Returns
+        `now` for None or when the clock is driven by advance().
+        """
+        if timestamp is None or self._tick_game_time is None:
+            return self.now
+        elapsed = timestamp - self._last_source_time
+        if self.paused:
+            elapsed = min(elapsed, 0.0)
+        # Same cap as tick(): time lost to a stall is lost for events too
+        elapsed = min(elapsed, self.step * self.max_steps)
+        return self._tick_game_time + elapsed * self.time_scale
+
+    def set_reference(self, source_time, game_time):
+        """
+        Make time_at() map source_time to game_time, as a tick at that
+        reading would. Used by replays to map recorded event timestamps
+        exactly as during the recording.
+        """
+        self._last_source_time = source_time
+        self._tick_game_time = game_time
+
+    def advance(self):
+        """
+        Advance game time by exactly one step without sampling the time
+        source. Used by headless runs that drive the clock themselves.
+        """
+        self.now += self.step
+        self.step_count += 1
+        self._tick_game_time = None
+        return self.step
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        # Time spent paused is discarded on the next tick
+        self._last_source_time = self.time_source()
+        self.paused = False
+
+    def set_time_scale(self, scale):
+        """Run game time faster (>1) or slower (<1) than real time"""
+        self.time_scale = max(0.0, scale)
@@ -0,0 +1,112 @@
+"""
+Bomb countdown shared by the plant/defuse modes.
+The whole timeline of a countdown (every beep, the ten-seconds-left
+warning and the explosion) is computed once when the bomb is armed.
+Each frame the view only asks for the events that became due since the
+previous frame, instead of recomputing intervals and comparing
+timestamps.
+
+Event names match the sound names, so a view can pass them straight to
+SoundManager.play:
+
+    for event in self.countdown.poll(self.clock.now):
+        if event == EXPLODED:
+            ...
+        else:
+            self.sound.play(event)
+"""
+from functools import lru_cache
+
+from src import config
+
+# Deadline events
+BEEP = 'beep'
+BEEP_FAST = 'beep_fast'
+TEN_SECONDS_LEFT = 'ten_seconds_left'
+EXPLODED = 'exploded'
+
+FINAL_SECONDS = 10  # Fast beeps and the warning start here
+
+_NO_EVENTS = ()
+
+
+def stepped_curve(remaining, duration):
+    """The classic beep: every second, every 0.5s below 20s, 0.2s below 10s"""
+    if remaining < 10:
+        return 0.2
+    if remaining < 20:
+        return 0.5
+    return 1.0
+
+
+def accelerating_curve(remaining, duration):
+    """Interval shrinks continuously from 1s at arming to 0.1s at the end"""
+    fraction = max(0.0, remaining / duration)
+    return 0.1 + 0.9 * fraction * fraction
+
+
+def constant_curve(remaining, duration):
+    """One beep per second"""
+    return 1.0
+
+
+# Curve name -> function(remaining, duration) returning the next beep interval
+BEEP_CURVES = {
+    'stepped': stepped_curve,
+    'accelerating': accelerating_curve,
+    'constant': constant_curve,
+}
+
+
+@lru_cache(maxsize=16)
+def build_schedule(duration, curve='stepped'):
+    """
+    Timeline of a countdown of `duration` seconds as two tuples:
+    (offsets from arming, event names), in time order.
+    """
+    interval = BEEP_CURVES[curve]
+    timeline = []
+    t = 0.0
+    while t < duration:
+        remaining = duration - t
+        timeline.append((t, 1, BEEP_FAST if remaining < FINAL_SECONDS else BEEP))
+        t += interval(remaining, duration)
+    if duration > FINAL_SECONDS:
+        # Sorted before a beep at the same instant
+        timeline.append((duration - FINAL_SECONDS, 0, TEN_SECONDS_LEFT))
+    timeline.append((duration, 2, EXPLODED))
+    timeline.sort()
+    return tuple(t for t, _, _ in timeline), tuple(event for _, _, event in timeline)
+
+
+class Countdown:
+    def __init__(self, duration, curve=None):
+        self.duration = duration
+        self.curve = curve if curve is not None else config.COUNTDOWN_BEEP_CURVE
+        self.offsets, self.events = build_schedule(duration, self.curve)
+        self.start_time = None
+        self.index = 0
+
+    def start(self, now):
+        self.start_time = now
+        self.index = 0
+
+    def poll(self, now):
+        """Events that became due since the previous poll, in order"""
+        if self.start_time is None:
+            return _NO_EVENTS
+        elapsed = now - self.start_time
+        first = self.index
+        offsets = self.offsets
+        while self.index < len(offsets) and offsets[self.index] <= elapsed:
+            self.index += 1
+        if self.index == first:
+            return _NO_EVENTS
+        return self.events[first:self.index]
+
+    def remaining(self, now):
+        """Seconds left, never negative"""
+        if self.start_time is None:
+            return self.duration
+        return max(0.0, self.duration - (now - self.start_time))
+
@@ -0,0 +1,217 @@
+"""
+Frame profiler for the main loop.
+Times each phase of every frame into a fixed-size ring buffer, can draw
+an FPS/phase overlay in the corner of the screen, and dumps a frame-time
+histogram plus a cProfile report grouped by view class on request
+(F12 or SIGUSR1; F11 or SIGUSR2 toggles the overlay).
+"""
+import cProfile
+import io
+import pstats
+import signal
+import time
+from array import array
+
+import pygame
+from src import config
+
+# Loop phases, in order
+PHASES = ("idle", "events", "hardware", "input", "update", "draw", "present")
+
+DEFAULT_FRAMES = 600  # Ring buffer size (10 seconds at 60 FPS)
+HISTOGRAM_BUCKET_MS = 2.0
+HISTOGRAM_BUCKETS = 16
+OVERLAY_FONT_SIZE = 14
+
+
+class FrameProfiler:
+    def __init__(self, size=DEFAULT_FRAMES, overlay=False):
+        self.size = size
+        self.overlay = overlay
+        self.samples = {phase: array('d', bytes(8 * size)) for phase in PHASES}
+        self.frame_times = array('d', bytes(8 * size))
+        self.index = 0
+        self.count = 0
+        self.view_profiles = {}
+        self.dump_requested = False
+        self._frame_start = 0.0
+        self._phase_start = 0.0
+        self._font = None
+
+    def install_signal_handlers(self):
+        """SIGUSR1 dumps a report, SIGUSR2 toggles the overlay"""
+        if hasattr(signal, 'SIGUSR1'):
+            signal.signal(signal.SIGUSR1, self._on_dump_signal)
+            signal.signal(signal.SIGUSR2, self._on_overlay_signal)
+
+    def _on_dump_signal(self, signum, frame):
+        self.dump_requested = True
+
+    def _on_overlay_signal(self, signum, frame):
+        self.overlay = not self.overlay
+
+    def handle_events(self, pygame_events):
+        """
+        Check the profiler hotkeys. Returns True if the overlay was toggled
+        (the screen then needs a full redraw).
+        """
+        toggled = False
+        for event in pygame_events:
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F12:
+                    self.dump_requested = True
+                elif event.key == pygame.K_F11:
+                    self.overlay = not self.overlay
+                    toggled = True
+        return toggled
+
+    # --- Timing ---
+
+    def begin_frame(self):
+        now = time.perf_counter()
+        self._frame_start = now
+        self._phase_start = now
+        for phase in PHASES:
+            self.samples[phase][self.index] = 0.0
+
+    def mark(self, phase, idle=0.0):
+        """
+        End the current phase. idle is time within the phase spent
+        sleeping (frame pacing), which is accounted to the idle phase.
+        """
+        now = time.perf_counter()
+        self.samples[phase][self.index] = (now - self._phase_start) - idle
+        if idle:
+            self.samples["idle"][self.index] = idle
+        self._phase_start = now
+
+    def end_frame(self):
+        self.frame_times[self.index] = time.perf_counter() - self._frame_start
+        self.index = (self.index + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+    def call(self, view, func, *args):
+        """Call func under the cProfile profile of the view's class"""
+        if view is None:
+            return func(*args)
+        name = type(view).__name__
+        profile = self.view_profiles.get(name)
+        if profile is None:
+            profile = self.view_profiles[name] = cProfile.Profile()
+        profile.enable()
+        try:
+            return func(*args)
+        finally:
+            profile.disable()
+
+    # --- Statistics ---
+
+    def _recent(self, values):
+        if self.count < self.size:
+            return list(values[:self.count])
+        return list(values)
+
+    def fps(self):
+        frames = self._recent(self.frame_times)
+        total = sum(frames)
+        return len(frames) / total if total > 0 else 0.0
+
+    def phase_means(self):
+        """Mean time per phase in milliseconds"""
+        if not self.count:
+            return {phase: 0.0 for phase in PHASES}
+        return {phase: sum(self._recent(self.samples[phase])) / self.count * 1000
+                for phase in PHASES}
+
+    # --- Overlay ---
+
+    def draw_overlay(self, screen):
+        """Draw FPS and the phase breakdown in the top-left corner; returns the rect"""
+        if self._font is None:
+            from src.ui.fonts import get_fonts
+            self._font = get_fonts().get(OVERLAY_FONT_SIZE)
+        means = self.phase_means()
+        lines = [f"FPS {self.fps():5.1f}"]
+        lines.extend(f"{phase[:6]:6s} {means[phase]:6.2f}ms" for phase in PHASES if phase != "idle")
+
+        line_height = self._font.get_linesize()
+        rect = pygame.Rect(0, 0, 110, line_height * len(lines) + 4)
+        screen.fill(config.BLACK, rect)
+        pygame.draw.rect(screen, config.DARK_GREEN, rect, 1)
+        for i, line in enumerate(lines):
+            surface = self._font.render(line, False, config.AMBER)
+            screen.blit(surface, (4, 2 + i * line_height))
+        return rect
+
+    # --- Reports ---
+
+    def histogram(self):
+        """Text histogram of frame times and per-phase percentiles"""
+        out = io.StringIO()
+        frames = sorted(t * 1000 for t in self._recent(self.frame_times))
+        out.write(f"Frames: {len(frames)}  FPS: {self.fps():.1f}\n\n")
+
+        out.write(f"{'phase':10s} {'mean':>8s} {'p50':>8s} {'p95':>8s} {'p99':>8s} {'max':>8s}\n")
+        for phase in PHASES:
+            values = sorted(t * 1000 for t in self._recent(self.samples[phase]))
+            out.write(f"{phase:10s} " + " ".join(f"{v:8.3f}" for v in _stats(values)) + "\n")
+        out.write(f"{'frame':10s} " + " ".join(f"{v:8.3f}" for v in _stats(frames)) + "\n\n")
+
+        buckets = [0] * HISTOGRAM_BUCKETS
+        for t in frames:
+            buckets[min(HISTOGRAM_BUCKETS - 1, int(t // HISTOGRAM_BUCKET_MS))] += 1
+        peak = max(buckets) if frames else 0
+        for i, n in enumerate(buckets):
+            low = i * HISTOGRAM_BUCKET_MS
+            label = f"{low:5.1f}+ms" if i == HISTOGRAM_BUCKETS - 1 else f"{low:5.1f}-{low + HISTOGRAM_BUCKET_MS:.1f}ms"
+            bar = "#" * (int(40 * n / peak) if peak else 0)
+            out.write(f"{label:>13s} {n:6d} {bar}\n")
+        return out.getvalue()
+
+    def dump(self, path=None):
+        """Write the histogram and per-view cProfile reports to a file"""
+        if path is None:
+            path = time.strftime("frame_profile_%Y%m%d_%H%M%S.txt")
+        with open(path, 'w') as f:
+            f.write(self.histogram())
+            for name, profile in sorted(self.view_profiles.items()):
+                f.write(f"\n===== {name} =====\n")
+                stats = pstats.Stats(profile, stream=f)
+                stats.sort_stats("cumulative").print_stats(25)
+        print(f"[PROFILER] Report written to {path}")
+        self.dump_requested = False
+        return path
+
+
+class NullProfiler:
+    """Stand-in used when profiling is off; every hook is a no-op"""
+    overlay = False
+    dump_requested = False
+
+    def install_signal_handlers(self):
+        pass
+
+    def handle_events(self, pygame_events):
+        return False
+
+    def begin_frame(self):
+        pass
+
+    def mark(self, phase, idle=0.0):
+        pass
+
+    def end_frame(self):
+        pass
+
+    def call(self, view, func, *args):
+        return func(*args)
+
+
+def _stats(sorted_values):
+    """mean, p50, p95, p99, max of a sorted list"""
+    if not sorted_values:
+        return (0.0, 0.0, 0.0, 0.0, 0.0)
+    n = len(sorted_values)
+    def pct(fraction):
+        return sorted_values[min(n - 1, int(round(fraction * (n - 1))))]
+    return (sum(sorted_values) / n, pct(0.50), pct(0.95), pct(0.99), sorted_values[-1])
@@ -0,0 +1,296 @@
+"""
+Deterministic input recording and replay.
+An InputRecorder attached to the UIManager writes every batch of actions
+passed to handle_input to a compact binary file, together with the game
+clock step it arrived at, the RNG seed, the settings and the first view.
+Replaying the file into a fresh headless app re-seeds the RNG, restores
+the settings and delivers each batch at exactly the same step, with the
+clock mapping event timestamps to game time as it did when recording
+(GameClock.time_at), so the session unfolds identically, either as fast
+as possible or paced in real time.
+
+    python -m src.main --record match.rec
+    python -m src.utils.replay match.rec [--realtime]
+
+File layout (little-endian):
+    header  b"ABRP", version u16, clock step f64, seed u64,
+            first view (u16 length + utf-8 "module:Class"),
+            settings (u32 length + utf-8 JSON)
+    batch   clock step index u32, game time f64, time of the clock tick
+            f64 (seconds since recording start), game time at that tick
+            f64 (NaN if the clock was not ticked), action count u16, then
+            per action:
+                time f64 (seconds since recording start), kind u8,
+                flags u8, name, source[, data]  (u8 length + utf-8 each)
+A batch with no actions marks the end of the recording.
+"""
+import argparse
+import contextlib
+import importlib
+import json
+import math
+import struct
+import time
+
+import pygame
+from src.hardware.events import PRESS, RELEASE, Action
+from src.utils import rng
+from src.utils.settings import get_settings
+
+MAGIC = b"ABRP"
+VERSION = 2
+
+_HEADER = struct.Struct("<4sHdQ")
+_BATCH = struct.Struct("<IdddH")
+_ACTION = struct.Struct("<dBB")
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+
+KINDS = (PRESS, RELEASE)
+FLAG_DATA = 1
+
+
+def _pack_str(text, size=_U8):
+    data = text.encode('utf-8')
+    return size.pack(len(data)) + data
+
+
+def _tick_fields(clock, start):
+    game_time = clock.tick_game_time
+    return (clock.step_count, clock.now, clock.source_time - start,
+            math.nan if game_time is None else game_time)
+
+
+def view_path(view_class):
+    return f"{view_class.__module__}:{view_class.__qualname__}"
+
+
+def resolve_view(path):
+    module, name = path.split(":")
+    return getattr(importlib.import_module(module), name)
+
+
+class InputRecorder:
+    """
+    Appends the actions handed to UIManager.handle_input to a recording
+    file. Each batch is written and flushed when it arrives, so the file
+    is usable even if the app is killed.
+    """
+    def __init__(self, path, view_class, step, seed=None, settings=None):
+        self.path = path
+        self.start = time.monotonic()
+        self.file = open(path, 'wb')
+        seed = seed if seed is not None else rng.get_seed()
+        settings = settings if settings is not None else dict(get_settings().get_all())
+        self.file.write(_HEADER.pack(MAGIC, VERSION, step, seed))
+        self.file.write(_pack_str(view_path(view_class), _U16))
+        self.file.write(_pack_str(json.dumps(settings, sort_keys=True), _U32))
+        self.file.flush()
+        self.batches = 0
+        print(f"[REPLAY] Recording to {path} (seed {seed})")
+
+    def record(self, clock, actions):
+        """Write one batch of actions, delivered at the clock's current step"""
+        if self.file is None:
+            return
+        parts = [_BATCH.pack(*_tick_fields(clock, self.start), len(actions))]
+        for action in actions:
+            timestamp = getattr(action, 'timestamp', self.start)
+            kind = getattr(action, 'kind', PRESS)
+            source = getattr(action, 'source', "keyboard")
+            data = getattr(action, 'data', None)
+            parts.append(_ACTION.pack(timestamp - self.start, KINDS.index(kind),
+                                      FLAG_DATA if data is not None else 0))
+            parts.append(_pack_str(str(action)))
+            parts.append(_pack_str(source))
+            if data is not None:
+                parts.append(_pack_str(str(data)))
+        self.file.write(b"".join(parts))
+        self.file.flush()
+        self.batches += 1
+
+    def close(self, clock):
+        """Write the end marker (the step the session ended at) and close the file"""
+        if self.file is None:
+            return
+        self.file.write(_BATCH.pack(*_tick_fields(clock, self.start), 0))
+        self.file.close()
+        self.file = None
+        print(f"[REPLAY] Recorded {self.batches} input batches to {self.path}")
+
+
+class Recording:
+    """A recording file loaded in memory"""
+    def __init__(self, step, seed, view, settings, batches):
+        self.step = step
+        self.seed = seed
+        self.view = view
+        self.settings = settings
+        # (step index, game time, tick time, tick game time, [Action]);
+        # the last one has no actions and marks the end
+        self.batches = batches
+
+    @property
+    def end_step(self):
+        return self.batches[-1][0] if self.batches else 0
+
+
+def _read_str(data, offset, size=_U8):
+    (length,) = size.unpack_from(data, offset)
+    offset += size.size
+    if offset + length > len(data):
+        raise struct.error("truncated string")
+    return data[offset:offset + length].decode('utf-8'), offset + length
+
+
+def load_recording(path):
+    """Parse a recording file; ValueError if it is not one"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < _HEADER.size:
+        raise ValueError(f"{path} is not an input recording")
+    magic, version, step, seed = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not an input recording")
+    if version != VERSION:
+        raise ValueError(f"{path}: unsupported recording version {version}")
+    offset = _HEADER.size
+    view, offset = _read_str(data, offset, _U16)
+    settings, offset = _read_str(data, offset, _U32)
+
+    batches = []
+    while offset + _BATCH.size <= len(data):
+        step_index, now, tick_time, tick_game_time, count = _BATCH.unpack_from(data, offset)
+        offset += _BATCH.size
+        actions = []
+        try:
+            for _ in range(count):
+                timestamp, kind, flags = _ACTION.unpack_from(data, offset)
+                offset += _ACTION.size
+                name, offset = _read_str(data, offset)
+                source, offset = _read_str(data, offset)
+                payload = None
+                if flags & FLAG_DATA:
+                    payload, offset = _read_str(data, offset)
+                actions.append(Action(name, timestamp, KINDS[kind], source, payload))
+        except (struct.error, UnicodeDecodeError):
+            # Truncated by a crash: keep the complete batches
+            break
+        batches.append((step_index, now, tick_time, tick_game_time, actions))
+    if not batches or batches[-1][4]:
+        # No end marker: the app did not shut down cleanly
+        print(f"[REPLAY] {path} has no end marker, replaying up to the last input")
+        if batches:
+            batches.append(batches[-1][:4] + ([],))
+    return Recording(step, seed, view, json.loads(settings), batches)
+
+
+class _ResultsLog:
+    """Stand-in results store that keeps the recorded games in memory"""
+    def __init__(self):
+        self.games = []
+
+    def record(self, mode, result, duration, **details):
+        self.games.append(dict(details, mode=mode, result=result, duration=round(duration, 6)))
+
+
+@contextlib.contextmanager
+def recorded_settings(values):
+    """Apply the recorded settings for the replay and restore the current ones after"""
+    settings = get_settings()
+    previous = dict(settings.get_all())
+    persist = settings.persist
+    settings.persist = False
+    try:
+        for key, value in values.items():
+            if key in settings.schema:
+                settings.set(key, value)
+        yield
+    finally:
+        for key, value in previous.items():
+            settings.set(key, value)
+        settings.persist = persist
+
+
+def replay(recording, realtime=False, screen=None, quiet=True):
+    """
+    Replay a recording (or a recording file) into a fresh headless app
+    and return the outcome as a dict. With realtime=True each step is
+    paced to the game clock; frames are drawn to `screen` if given.
+    """
+    # Imported here: the simulation module selects the dummy video driver
+    from src.utils.simulation import HeadlessManager, silenced
+
+    if not isinstance(recording, Recording):
+        recording = load_recording(recording)
+
+    with silenced(quiet):
+        with recorded_settings(recording.settings):
+            rng.seed(recording.seed)
+            manager = HeadlessManager(recording.step)
+            if screen is not None:
+                manager.screen = screen
+            manager.results = _ResultsLog()
+            clock = manager.clock
+            manager.set_view(resolve_view(recording.view))
+
+            start = time.perf_counter()
+            desyncs = 0
+            delivered = 0
+            for step_index, now, tick_time, tick_game_time, actions in recording.batches:
+                while clock.step_count < step_index and manager.running:
+                    manager.step()
+                    if realtime:
+                        delay = start + clock.now - time.perf_counter()
+                        if delay > 0:
+                            time.sleep(delay)
+                    if screen is not None:
+                        pygame.event.pump()
+                        dirty = manager.draw()
+                        if dirty:
+                            pygame.display.update(dirty)
+                if abs(clock.now - now) > 1e-9:
+                    desyncs += 1
+                if actions:
+                    if not math.isnan(tick_game_time):
+                        # Event timestamps map to the recorded game times
+                        clock.set_reference(tick_time, tick_game_time)
+                    manager.handle_input(actions)
+                    delivered += len(actions)
+            manager.apply_transition()
+            view = manager.current_view
+
+    return {
+        "view": type(view).__name__,
+        "state": getattr(view, 'state', None),
+        "duration": round(clock.now, 6),
+        "steps": clock.step_count,
+        "actions_delivered": delivered,
+        "games": manager.results.games,
+        "desyncs": desyncs,
+        "replay_seconds": round(time.perf_counter() - start, 6),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay an input recording")
+    parser.add_argument("recording", help="file written with python -m src.main --record FILE")
+    parser.add_argument("--realtime", action="store_true",
+                        help="pace the replay to the recorded time and show it on the display")
+    parser.add_argument("--verbose", action="store_true", help="show the app's own output")
+    args = parser.parse_args()
+
+    screen = None
+    if args.realtime:
+        from src import config
+        pygame.init()
+        screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+        pygame.display.set_caption("Airsoft Bomb (replay)")
+
+    result = replay(args.recording, realtime=args.realtime, screen=screen, quiet=not args.verbose)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
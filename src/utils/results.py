@@ -0,0 +1,299 @@
+"""
+Match results store.
+Every finished game is appended to a SQLite database: mode, result,
+winner, duration, parameters, wrong-code and hacking attempts and
+per-game timings. Games are queued by the UI thread and written in
+batches by a background writer, so recording never touches the disk
+during a frame. The table is capped at config.RESULTS_MAX_ROWS rows; the
+oldest games are dropped first.
+
+    store = get_results_store()
+    store.record("demolition", "DEFUSED", 83.2, winner="DEFENDERS", wrong_codes=2)
+    store.last_games(10)
+    store.mode_stats()
+
+Print the stored results with:
+
+    python -m src.utils.results [--last N] [--mode MODE]
+"""
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+from src import config
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    mode TEXT NOT NULL,
+    finished_at REAL NOT NULL,
+    duration REAL NOT NULL,
+    result TEXT NOT NULL,
+    winner TEXT,
+    wrong_codes INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    params TEXT,
+    timings TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_matches_finished ON matches (finished_at);
+CREATE INDEX IF NOT EXISTS idx_matches_mode ON matches (mode, finished_at);
+
+-- Running totals per (mode, winner), kept current by triggers so the
+-- all-time statistics never scan the matches table ('' = no winner)
+CREATE TABLE IF NOT EXISTS totals (
+    mode TEXT NOT NULL,
+    winner TEXT NOT NULL,
+    games INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    wrong_codes INTEGER NOT NULL,
+    attempts INTEGER NOT NULL,
+    PRIMARY KEY (mode, winner)
+);
+CREATE TRIGGER IF NOT EXISTS matches_insert AFTER INSERT ON matches BEGIN
+    INSERT INTO totals VALUES (NEW.mode, COALESCE(NEW.winner, ''), 1, NEW.duration,
+                               NEW.wrong_codes, NEW.attempts)
+    ON CONFLICT (mode, winner) DO UPDATE SET
+        games = games + 1,
+        duration = duration + excluded.duration,
+        wrong_codes = wrong_codes + excluded.wrong_codes,
+        attempts = attempts + excluded.attempts;
+END;
+CREATE TRIGGER IF NOT EXISTS matches_delete AFTER DELETE ON matches BEGIN
+    UPDATE totals SET
+        games = games - 1,
+        duration = duration - OLD.duration,
+        wrong_codes = wrong_codes - OLD.wrong_codes,
+        attempts = attempts - OLD.attempts
+    WHERE mode = OLD.mode AND winner = COALESCE(OLD.winner, '');
+END;
+"""
+
+INSERT = """
+INSERT INTO matches (mode, finished_at, duration, result, winner,
+                     wrong_codes, attempts, params, timings)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+COLUMNS = ("id", "mode", "finished_at", "duration", "result", "winner",
+           "wrong_codes", "attempts", "params", "timings")
+
+
+def _connect(db_path):
+    directory = os.path.dirname(os.path.abspath(db_path))
+    os.makedirs(directory, exist_ok=True)
+    # The connection is only used under the store's locks
+    connection = sqlite3.connect(db_path, check_same_thread=False)
+    # Readers do not block the writer (and the other way round)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+    return connection
+
+
+def _row_to_dict(row):
+    game = dict(zip(COLUMNS, row))
+    game["params"] = json.loads(game["params"]) if game["params"] else {}
+    game["timings"] = json.loads(game["timings"]) if game["timings"] else {}
+    return game
+
+
+class ResultsStore:
+    def __init__(self, db_path=None, max_rows=None, write_delay=None):
+        self.db_path = db_path if db_path is not None else config.RESULTS_DB
+        self.max_rows = max_rows if max_rows is not None else config.RESULTS_MAX_ROWS
+        self.write_delay = write_delay if write_delay is not None else config.RESULTS_WRITE_DELAY
+
+        self._pending = []
+        self._due = None
+        self._closing = False
+        self._writer = None
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._read_lock = threading.Lock()
+        self._write_connection = None
+        self._read_connection = None
+
+    def record(self, mode, result, duration, winner=None, params=None,
+               wrong_codes=0, attempts=0, timings=None, finished_at=None):
+        """Queue a finished game to be written by the background writer"""
+        row = (mode, finished_at if finished_at is not None else time.time(),
+               float(duration), result, winner, int(wrong_codes), int(attempts),
+               json.dumps(params or {}, sort_keys=True),
+               json.dumps(timings or {}, sort_keys=True))
+        with self._condition:
+            self._pending.append(row)
+            if self._due is None:
+                # A batch is written write_delay after its first game
+                self._due = time.monotonic() + self.write_delay
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run_writer,
+                                                name="results-writer", daemon=True)
+                self._writer.start()
+            self._condition.notify()
+
+    def flush(self):
+        """Write queued games now, on the calling thread"""
+        with self._condition:
+            rows = self._pending
+            self._pending = []
+            self._due = None
+        if not rows:
+            return True
+        return self._write(rows)
+
+    def close(self):
+        """Flush queued games, stop the writer thread and close the database"""
+        self.flush()
+        with self._condition:
+            self._closing = True
+            self._condition.notify()
+        if self._writer is not None:
+            self._writer.join(timeout=2.0)
+            self._writer = None
+        self._closing = False
+        with self._write_lock:
+            if self._write_connection is not None:
+                self._write_connection.close()
+                self._write_connection = None
+        with self._read_lock:
+            if self._read_connection is not None:
+                self._read_connection.close()
+                self._read_connection = None
+
+    def _run_writer(self):
+        while True:
+            with self._condition:
+                while not self._closing:
+                    if not self._pending:
+                        self._condition.wait()
+                        continue
+                    delay = self._due - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._condition.wait(delay)
+                if self._closing:
+                    return
+                rows = self._pending
+                self._pending = []
+                self._due = None
+            self._write(rows)
+
+    def _write(self, rows):
+        with self._write_lock:
+            try:
+                if self._write_connection is None:
+                    self._write_connection = _connect(self.db_path)
+                connection = self._write_connection
+                with connection:
+                    connection.executemany(INSERT, rows)
+                    # ids only grow and only the oldest rows are deleted,
+                    # so the newest max_rows games are the top id range
+                    connection.execute(
+                        "DELETE FROM matches WHERE id <= (SELECT MAX(id) FROM matches) - ?",
+                        (self.max_rows,))
+                print(f"[RESULTS] Recorded {len(rows)} game(s)")
+                return True
+            except sqlite3.Error as e:
+                print(f"[RESULTS] Error writing {self.db_path}: {e}")
+                return False
+
+    def _query(self, sql, args=()):
+        with self._read_lock:
+            try:
+                if self._read_connection is None:
+                    if not os.path.exists(self.db_path):
+                        return []
+                    self._read_connection = _connect(self.db_path)
+                return self._read_connection.execute(sql, args).fetchall()
+            except sqlite3.Error as e:
+                print(f"[RESULTS] Error reading {self.db_path}: {e}")
+                return []
+
+    def last_games(self, count=10, mode=None):
+        """The last `count` written games (optionally of one mode), newest first"""
+        columns = ", ".join(COLUMNS)
+        if mode is None:
+            rows = self._query(f"SELECT {columns} FROM matches "
+                               "ORDER BY finished_at DESC LIMIT ?", (count,))
+        else:
+            rows = self._query(f"SELECT {columns} FROM matches WHERE mode = ? "
+                               "ORDER BY finished_at DESC LIMIT ?", (mode, count))
+        return [_row_to_dict(row) for row in rows]
+
+    def mode_stats(self, since=None):
+        """
+        Per-mode aggregates of the written games (optionally only those
+        finished after the `since` timestamp): games, average duration,
+        wrong codes, attempts, last game time and wins per winner.
+        All-time statistics come from the running totals; a `since`
+        query scans the date index.
+        """
+        if since is None:
+            groups = self._query(
+                "SELECT mode, winner, games, duration, wrong_codes, attempts, "
+                "(SELECT MAX(finished_at) FROM matches WHERE matches.mode = totals.mode) "
+                "FROM totals WHERE games > 0")
+        else:
+            groups = self._query(
+                "SELECT mode, COALESCE(winner, ''), COUNT(*), SUM(duration), SUM(wrong_codes), "
+                "SUM(attempts), MAX(finished_at) FROM matches WHERE finished_at >= ? "
+                "GROUP BY mode, winner", (since,))
+        stats = {}
+        for mode, winner, games, total_duration, wrong_codes, attempts, last_played in groups:
+            mode_stats = stats.get(mode)
+            if mode_stats is None:
+                mode_stats = stats[mode] = {"games": 0, "avg_duration": 0.0, "wrong_codes": 0,
+                                            "attempts": 0, "last_played": last_played, "wins": {}}
+            # One row per winner: the mode's last game is the latest of them
+            mode_stats["last_played"] = max(mode_stats["last_played"], last_played)
+            mode_stats["avg_duration"] += total_duration
+            mode_stats["games"] += games
+            mode_stats["wrong_codes"] += wrong_codes
+            mode_stats["attempts"] += attempts
+            if winner:
+                mode_stats["wins"][winner] = games
+        for mode_stats in stats.values():
+            mode_stats["avg_duration"] /= mode_stats["games"]
+        return stats
+
+
+# Global results store instance
+_results_store = None
+
+def get_results_store():
+    """Get the global results store instance"""
+    global _results_store
+    if _results_store is None:
+        _results_store = ResultsStore()
+    return _results_store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print recorded match results")
+    parser.add_argument("--last", type=int, default=10, help="number of recent games")
+    parser.add_argument("--mode", help="only games of this mode")
+    parser.add_argument("--db", help=f"database file (default {config.RESULTS_DB})")
+    args = parser.parse_args()
+
+    store = ResultsStore(args.db)
+    print(f"{'finished':19s} {'mode':12s} {'result':9s} {'winner':10s} {'duration':>8s}")
+    for game in store.last_games(args.last, args.mode):
+        finished = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(game["finished_at"]))
+        print(f"{finished:19s} {game['mode']:12s} {game['result']:9s} "
+              f"{game['winner'] or '-':10s} {game['duration']:7.1f}s")
+    print()
+    for mode, stats in sorted(store.mode_stats().items()):
+        wins = ", ".join(f"{winner} {n}" for winner, n in sorted(stats["wins"].items()))
+        print(f"{mode:12s} {stats['games']:5d} games, avg {stats['avg_duration']:.1f}s, "
+              f"{stats['wrong_codes']} wrong codes, {stats['attempts']} attempts"
+              + (f", wins: {wins}" if wins else ""))
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
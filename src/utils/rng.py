@@ -0,0 +1,41 @@
+"""
+Shared random number generator.
+Every random game decision (the generated bomb code, the Simon Says
+sequences, the hacking target zones) draws from this one generator
+instead of the random module, so a session is reproduced exactly by
+seeding it with the same value. Input recordings store the seed (see
+src/utils/replay.py).
+
+    from src.utils.rng import get_rng
+    digit = get_rng().randint(0, 9)
+"""
+import os
+import random
+
+SEED_MASK = (1 << 64) - 1
+
+_rng = random.Random()
+_seed = None
+
+
+def seed(value=None):
+    """Reseed the shared generator (with a fresh random seed if None); returns the seed"""
+    global _seed
+    if value is None:
+        value = int.from_bytes(os.urandom(8), 'little')
+    _seed = value & SEED_MASK
+    _rng.seed(_seed)
+    return _seed
+
+
+def get_seed():
+    """Seed the shared generator was last seeded with"""
+    return _seed
+
+
+def get_rng():
+    """Get the shared random.Random instance"""
+    return _rng
+
+
+seed()
@@ -0,0 +1,91 @@
+"""
+Adaptive frame scheduler for the main loop.
+Animated views (armed countdowns, moving bars) run at the full frame rate.
+Static screens block on the event queue and only wake up on input or
+after a timeout. After a period without input the display is dimmed and
+then blanked, and rendering stops until the next key press.
+"""
+import time
+import pygame
+from src import config
+
+# Scheduler states
+ACTIVE = "ACTIVE"
+DIMMED = "DIMMED"
+SUSPENDED = "SUSPENDED"
+
+
+class FrameScheduler:
+    def __init__(self, backlight=None, fps=None, idle_wait_ms=None,
+                 dim_timeout=None, blank_timeout=None):
+        self.backlight = backlight
+        self.fps = fps if fps is not None else config.FPS
+        self.idle_wait_ms = idle_wait_ms if idle_wait_ms is not None else config.IDLE_WAIT_MS
+        self.dim_timeout = dim_timeout if dim_timeout is not None else config.IDLE_DIM_TIMEOUT
+        self.blank_timeout = blank_timeout if blank_timeout is not None else config.IDLE_BLANK_TIMEOUT
+        self.clock = pygame.time.Clock()
+        self.state = ACTIVE
+        self.last_activity = time.monotonic()
+        self.last_sleep = 0.0  # Seconds spent waiting in the last call
+
+    @property
+    def suspended(self):
+        return self.state == SUSPENDED
+
+    def wait_for_events(self, animating):
+        """
+        Pace the loop and return the pending pygame events.
+        Animating views are ticked at full rate; static views sleep until
+        an event arrives or the idle timeout expires.
+        """
+        start = time.perf_counter()
+        if animating and not self.suspended:
+            self.clock.tick(self.fps)
+            self.last_sleep = time.perf_counter() - start
+            return pygame.event.get()
+
+        event = pygame.event.wait(self.idle_wait_ms)
+        self.last_sleep = time.perf_counter() - start
+        if event.type == pygame.NOEVENT:
+            return []
+        events = [event]
+        events.extend(pygame.event.get())
+        # Keep the clock's frame time meaningful after a long wait
+        self.clock.tick()
+        return events
+
+    def notify_activity(self):
+        """
+        Register user input and restore a dimmed or blank display.
+        Returns True if the display was blank, so the caller can swallow
+        the wake-up key press.
+        """
+        self.last_activity = time.monotonic()
+        was_suspended = self.suspended
+        if self.state != ACTIVE:
+            print("[SCHEDULER] Display wake")
+            if self.backlight:
+                self.backlight.restore()
+        self.state = ACTIVE
+        return was_suspended
+
+    def update_idle(self, animating):
+        """Dim or blank the display once the device has been idle long enough"""
+        if animating:
+            # Never sleep while a game is running
+            self.last_activity = time.monotonic()
+            return
+
+        idle = time.monotonic() - self.last_activity
+        if self.blank_timeout and idle >= self.blank_timeout:
+            if self.state != SUSPENDED:
+                print("[SCHEDULER] Idle, blanking display")
+                self.state = SUSPENDED
+                if self.backlight:
+                    self.backlight.blank()
+        elif self.dim_timeout and idle >= self.dim_timeout:
+            if self.state == ACTIVE:
+                print("[SCHEDULER] Idle, dimming display")
+                self.state = DIMMED
+                if self.backlight:
+                    self.backlight.dim()
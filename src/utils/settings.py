@@ -1,27 +1,149 @@
 import json
 import os
+import threading
+import time
+import weakref
+from types import MappingProxyType
+from src import config
+
+
+class Setting:
+    """
+    Declaration of one setting: type, default, allowed range and how it
+    is shown and typed on the keypad.
+
+    Numbers are edited as integers; edit_scale converts a float setting
+    to the integer the user types (0.2 with edit_scale=100 is typed as 20).
+    For str settings, minimum/maximum bound the length and only digits
+    are accepted. Secret settings (the bomb code) never leave the device.
+    """
+    def __init__(self, key, kind, default, minimum=None, maximum=None,
+                 label=None, unit="", edit_scale=1, secret=False):
+        self.key = key
+        self.kind = kind
+        self.default = default
+        self.minimum = minimum
+        self.maximum = maximum
+        self.label = label or key.upper().replace('_', ' ')
+        self.unit = unit
+        self.edit_scale = edit_scale
+        self.secret = secret
+
+    def validate(self, value):
+        """Return value converted to the setting's type; ValueError if out of range"""
+        if self.kind is bool:
+            if not isinstance(value, bool):
+                raise ValueError(f"{self.key} must be ON or OFF")
+            return value
+        if self.kind is str:
+            value = str(value)
+            if not value.isdigit():
+                raise ValueError(f"{self.key} must only contain digits")
+            size = len(value)
+        else:
+            if isinstance(value, bool):
+                raise ValueError(f"{self.key} must be a number")
+            value = self.kind(value)
+            size = value
+        if self.minimum is not None and size < self.minimum:
+            raise ValueError(f"{self.key} below minimum {self.minimum}")
+        if self.maximum is not None and size > self.maximum:
+            raise ValueError(f"{self.key} above maximum {self.maximum}")
+        return value
+
+    def parse(self, text):
+        """Validated value from what was typed on the keypad"""
+        if self.kind is str:
+            return self.validate(text)
+        number = int(text)
+        if self.edit_scale != 1:
+            return self.validate(number / self.edit_scale)
+        return self.validate(number)
+
+    def edit_text(self, value):
+        """Text shown in the input field when editing starts"""
+        if self.kind is str:
+            return value
+        return str(int(round(value * self.edit_scale)))
+
+    def format(self, value):
+        """Display string of a value, e.g. '45s', '80%', 'ON'"""
+        if self.kind is bool:
+            return "ON" if value else "OFF"
+        return f"{self.edit_text(value)}{self.unit}"
+
+
+SETTINGS_SCHEMA = {setting.key: setting for setting in (
+    Setting("bomb_code", str, "7355608", 1, 10, secret=True),
+    Setting("countdown_time", int, 45, 10, 300, unit="s"),
+    Setting("sound_enabled", bool, True, label="SOUND"),
+    Setting("brightness", int, 100, 10, 100, unit="%"),
+    Setting("beep_enabled", bool, True, label="BEEP"),
+    Setting("domination_target_time", int, 60, 30, 300, label="TARGET TIME", unit="s"),
+    Setting("hold_button_capture_speed", float, 0.2, 0.05, 0.5,
+            label="CAPTURE SPEED", unit="%/s", edit_scale=100),
+    Setting("hold_button_decay_speed", float, 0.05, 0.01, 0.2,
+            label="DECAY SPEED", unit="%/s", edit_scale=100),
+    Setting("hacking_rounds", int, 3, 1, 10, label="ROUNDS TO WIN"),
+    Setting("hacking_max_attempts", int, 5, 3, 10, label="MAX ATTEMPTS"),
+    Setting("simon_series", int, 4, 1, 10, label="SERIES COUNT"),
+    Setting("simon_digits", int, 6, 3, 10, label="DIGITS PER SERIES"),
+)}
+
+
+def _fsync_directory(directory):
+    """Make a rename durable (not supported on Windows)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 class GameSettings:
     """
     Global settings manager for the Airsoft Bomb system.
     Handles loading, saving, and accessing game configuration.
+
+    save() only queues the current settings; a background writer thread
+    writes them once no further save has been requested for save_delay
+    seconds, so repeated saves are coalesced and the UI never waits on
+    the SD card. The file is replaced atomically (temp file, fsync,
+    rename), and a write is skipped when the content did not change.
+    Call flush() (or close() at shutdown) to write pending changes now.
+
+    Every value is validated against SETTINGS_SCHEMA. Callbacks
+    registered with subscribe() are called with (key, value) whenever a
+    value actually changes, and version is incremented, so views can
+    cache what they derive from settings.
     """
     
-    def __init__(self):
-        self.settings_file = "bomb_settings.json"
-        self.defaults = {
-            "bomb_code": "7355608",
-            "countdown_time": 45,
-            "sound_enabled": True,
-            "brightness": 100,
-            "beep_enabled": True,
-            "domination_target_time": 60,
-            "hold_button_capture_speed": 0.2,
-            "hold_button_decay_speed": 0.05,
-            "hacking_rounds": 3,
-            "hacking_max_attempts": 5
-        }
+    def __init__(self, settings_file=None, save_delay=None):
+        self.settings_file = settings_file if settings_file is not None else config.SETTINGS_FILE
+        self.save_delay = save_delay if save_delay is not None else config.SETTINGS_SAVE_DELAY
+        self.schema = SETTINGS_SCHEMA
+        self.defaults = {key: setting.default for key, setting in self.schema.items()}
         self.current = self.defaults.copy()
+        self._view = MappingProxyType(self.current)
+        self._formatted = {}
+        self._subscribers = []
+        self.version = 0
+        # False while settings must not reach the disk (e.g. during a replay)
+        self.persist = True
+        
+        # Background writer state
+        self._saved_text = None    # Content of the file on disk
+        self._pending_text = None  # Content waiting to be written
+        self._due = 0.0
+        self._closing = False
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._writer = None
+        
         self.load()
     
     def load(self):
@@ -29,8 +151,16 @@ class GameSettings:
         if os.path.exists(self.settings_file):
             try:
                 with open(self.settings_file, 'r') as f:
-                    loaded = json.load(f)
-                    self.current.update(loaded)
+                    text = f.read()
+                loaded = json.loads(text)
+                for key, value in loaded.items():
+                    if key not in self.schema:
+                        continue
+                    try:
+                        self.current[key] = self.schema[key].validate(value)
+                    except (TypeError, ValueError) as e:
+                        print(f"[SETTINGS] Ignoring {key}: {e}")
+                self._saved_text = text
                 print(f"[SETTINGS] Loaded from {self.settings_file}")
             except Exception as e:
                 print(f"[SETTINGS] Error loading: {e}, using defaults")
@@ -38,10 +168,78 @@ class GameSettings:
             print("[SETTINGS] No settings file found, using defaults")
     
     def save(self):
-        """Save current settings to file"""
+        """Queue the current settings to be written by the background writer"""
+        if not self.persist:
+            return False
+        text = json.dumps(self.current, indent=2)
+        with self._condition:
+            self._pending_text = text
+            self._due = time.monotonic() + self.save_delay
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run_writer,
+                                                name="settings-writer", daemon=True)
+                self._writer.start()
+            self._condition.notify()
+        return True
+    
+    def flush(self):
+        """Write pending changes now, on the calling thread"""
+        return self._write_pending()
+    
+    def close(self):
+        """Flush pending changes and stop the writer thread"""
+        self.flush()
+        with self._condition:
+            self._closing = True
+            self._condition.notify()
+        if self._writer is not None:
+            self._writer.join(timeout=2.0)
+            self._writer = None
+        self._closing = False
+    
+    def _run_writer(self):
+        while True:
+            with self._condition:
+                # Wait for a save request, then until no new request has
+                # arrived for save_delay seconds
+                while not self._closing:
+                    if self._pending_text is None:
+                        self._condition.wait()
+                        continue
+                    delay = self._due - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._condition.wait(delay)
+                if self._closing:
+                    return
+            self._write_pending()
+    
+    def _write_pending(self):
+        # The pending text is taken with the write lock held, so a flush()
+        # and the writer thread can not write two versions out of order
+        with self._write_lock:
+            with self._condition:
+                text = self._pending_text
+                self._pending_text = None
+            if text is None:
+                return True
+            return self._write(text)
+    
+    def _write(self, text):
+        # Called with _write_lock held
+        if text == self._saved_text:
+            return True
+        temp_file = self.settings_file + ".tmp"
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.current, f, indent=2)
+            directory = os.path.dirname(os.path.abspath(self.settings_file))
+            os.makedirs(directory, exist_ok=True)
+            with open(temp_file, 'w') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.settings_file)
+            _fsync_directory(directory)
+            self._saved_text = text
             print(f"[SETTINGS] Saved to {self.settings_file}")
             return True
         except Exception as e:
@@ -50,7 +248,8 @@ class GameSettings:
     
     def reset_to_defaults(self):
         """Reset all settings to default values"""
-        self.current = self.defaults.copy()
+        for key, value in self.defaults.items():
+            self.set(key, value)
         self.save()
         print("[SETTINGS] Reset to defaults")
     
@@ -59,12 +258,61 @@ class GameSettings:
         return self.current.get(key, default)
     
     def set(self, key, value):
-        """Set a setting value"""
+        """
+        Set a setting value. Raises KeyError for an unknown key and
+        ValueError if the value does not fit the schema. Returns True if
+        the value changed.
+        """
+        value = self.schema[key].validate(value)
+        if key in self.current and self.current[key] == value:
+            return False
         self.current[key] = value
+        self._formatted.pop(key, None)
+        self.version += 1
+        self._notify(key, value)
+        return True
+    
+    def format(self, key):
+        """Display string of a setting (cached until the value changes)"""
+        text = self._formatted.get(key)
+        if text is None:
+            text = self._formatted[key] = self.schema[key].format(self.current[key])
+        return text
     
     def get_all(self):
-        """Get all current settings"""
-        return self.current.copy()
+        """Read-only live view of all current settings"""
+        return self._view
+    
+    # --- Change observers ---
+    
+    def subscribe(self, callback, keys=None):
+        """
+        Call callback(key, value) when a setting changes (only the given
+        keys, if any). Bound methods are held weakly, so a view that
+        subscribes does not outlive its screen.
+        """
+        if hasattr(callback, '__self__'):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda callback=callback: callback
+        self._subscribers.append((ref, frozenset(keys) if keys else None))
+    
+    def unsubscribe(self, callback):
+        self._subscribers = [(ref, keys) for ref, keys in self._subscribers
+                             if ref() is not None and ref() != callback]
+    
+    def _notify(self, key, value):
+        dead = False
+        for ref, keys in self._subscribers:
+            callback = ref()
+            if callback is None:
+                dead = True
+                continue
+            if keys is None or key in keys:
+                callback(key, value)
+        if dead:
+            self._subscribers = [(ref, keys) for ref, keys in self._subscribers
+                                 if ref() is not None]
 
 # Global settings instance
 _settings_instance = None
@@ -0,0 +1,212 @@
+"""
+Headless fast-forward simulation of game modes.
+Runs any view from src/modes on an offscreen surface with a virtual
+clock, driving handle_input from a scripted action stream. No display is
+opened and draw() is skipped unless render=True, so complete games run
+far faster than real time.
+
+Usage:
+    python -m src.utils.simulation
+"""
+import contextlib
+import json
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from src import config
+from src.hardware.events import release_name
+from src.ui.base import GAME_OVER_STATES
+from src.ui.manager import UIManager
+from src.utils.clock import GameClock, DEFAULT_STEP
+
+# States that end a game
+TERMINAL_STATES = GAME_OVER_STATES
+
+
+class HeadlessManager(UIManager):
+    """
+    UIManager drawing to an offscreen surface. Its clock is never ticked
+    from real time; step() advances game time by one fixed timestep.
+    """
+    def __init__(self, step=DEFAULT_STEP):
+        if not pygame.font.get_init():
+            pygame.font.init()
+        screen = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+        super().__init__(screen, GameClock(step=step))
+
+    def step(self):
+        dt = self.clock.advance()
+        if self.current_view and self.pending_view is None:
+            self.current_view.update(dt)
+        self.record_game_over()
+        self.apply_transition()
+
+
+class _NullWriter:
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def silenced(quiet=True):
+    """Context manager discarding what the app prints (a no-op if not quiet)"""
+    return contextlib.redirect_stdout(_NullWriter()) if quiet else contextlib.nullcontext()
+
+
+class Simulation:
+    """
+    One headless game.
+
+    script is a list of (time, action) pairs in game seconds; each action
+    is delivered to handle_input at the first timestep at or after its
+    time. The game ends when the view reaches a terminal state, when the
+    view is left (e.g. BACK to the menu) or after max_time seconds.
+    """
+    def __init__(self, view_factory, script=(), step=DEFAULT_STEP,
+                 max_time=600.0, render=False, quiet=True):
+        self.view_factory = view_factory
+        self.script = sorted(script, key=lambda item: item[0])
+        self.step = step
+        self.max_time = max_time
+        self.render = render
+        self.quiet = quiet
+
+    def run(self):
+        """Run the game to completion and return the result as a dict"""
+        with silenced(self.quiet):
+            return self._run()
+
+    def _run(self):
+        manager = HeadlessManager(self.step)
+        clock = manager.clock
+        manager.set_view(self.view_factory)
+        view = manager.current_view
+
+        transitions = []
+        state = getattr(view, 'state', None)
+        script_index = 0
+        actions_delivered = 0
+        steps = 0
+        exited = False
+
+        while clock.now < self.max_time:
+            # Deliver the actions due at the current time
+            actions = []
+            while (script_index < len(self.script)
+                   and self.script[script_index][0] <= clock.now + 1e-9):
+                actions.append(self.script[script_index][1])
+                script_index += 1
+            if actions:
+                manager.handle_input(actions)
+                actions_delivered += len(actions)
+
+            # Advance exactly one fixed timestep
+            manager.step()
+            steps += 1
+            if self.render:
+                manager.draw()
+
+            if manager.current_view is not view:
+                exited = True
+                break
+
+            new_state = getattr(view, 'state', None)
+            if new_state != state:
+                transitions.append({"time": round(clock.now, 6), "from": state, "to": new_state})
+                state = new_state
+            if state in TERMINAL_STATES:
+                break
+
+        # Same winner as the live game records in the results store
+        winner = view.match_result().get('winner') if state in TERMINAL_STATES else None
+        return {
+            "mode": type(view).__name__,
+            "final_state": state,
+            "completed": state in TERMINAL_STATES,
+            "exited": exited,
+            "winner": winner,
+            "duration": round(clock.now, 6),
+            "steps": steps,
+            "actions_delivered": actions_delivered,
+            "transitions": transitions,
+        }
+
+
+def run_mode(mode_class, script=(), attributes=None, **kwargs):
+    """
+    Simulate one game of mode_class. attributes are set on the view after
+    construction, like ModeConfigView does before starting a game.
+    """
+    def factory(manager):
+        view = mode_class(manager)
+        for key, value in (attributes or {}).items():
+            setattr(view, key, value)
+        return view
+    return Simulation(factory, script, **kwargs).run()
+
+
+def run_batch(mode_class, scripts, attributes=None, **kwargs):
+    """Simulate several games and return (results, games_per_second)"""
+    start = time.perf_counter()
+    results = [run_mode(mode_class, script, attributes, **kwargs) for script in scripts]
+    elapsed = time.perf_counter() - start
+    return results, (len(results) / elapsed if elapsed > 0 else 0.0)
+
+
+def hold(action, start, end):
+    """Script for a key held from start to end (press, then release)"""
+    return [(start, action), (end, release_name(action))]
+
+
+def main():
+    from src.modes.demolition import DemolitionView
+    from src.modes.hold_button import HoldButtonView
+
+    report = {}
+
+    # Demolition: the bomb must explode countdown_time after planting
+    code = "1234"
+    countdown = 45
+    plant = [(1.0, digit) for digit in code] + [(1.0, 'SELECT')]
+    result = run_mode(DemolitionView, plant,
+                      {"code": code, "countdown_time": countdown})
+    armed = next(t["time"] for t in result["transitions"] if t["to"] == "ARMED")
+    exploded = next(t["time"] for t in result["transitions"] if t["to"] == "EXPLODED")
+    report["demolition_explosion"] = {
+        "countdown_time": countdown,
+        "measured": round(exploded - armed, 6),
+        "ok": abs((exploded - armed) - countdown) <= DEFAULT_STEP,
+    }
+
+    # Hold the Button: holding continuously captures in 1 / capture_speed seconds
+    result = run_mode(HoldButtonView, hold('1', 0.0, 30.0),
+                      {"capture_speed": 0.2, "decay_speed": 0.05})
+    report["hold_button_capture"] = {
+        "expected": 1 / 0.2,
+        "measured": result["duration"],
+        "winner": result["winner"],
+    }
+
+    # Throughput
+    coarse_step = 0.1
+    scripts = [[(t, d) for t, d in plant]] * 200
+    results, rate = run_batch(DemolitionView, scripts,
+                              {"code": code, "countdown_time": countdown},
+                              step=coarse_step)
+    report["throughput"] = {
+        "games": len(results),
+        "step": coarse_step,
+        "games_per_second": round(rate, 1),
+    }
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
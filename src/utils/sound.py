@@ -1,29 +1,158 @@
 """
 Sound manager for the Airsoft Bomb system.
-Currently mocked - will play actual sounds when deployed to RPi.
+Built on pygame.mixer with a small buffer for low latency. The beep and
+alarm tones are synthesized once from sample arrays and file sounds are
+loaded once into Sound objects, so playing a sound never allocates or
+touches the disk. Each kind of sound has its own reserved channel, so a
+countdown beep never cuts off the alarm or the ambience.
+
+The mixer is set up by main.py (pygame.mixer.pre_init before
+pygame.init). When it is not initialized (headless simulations and
+benchmarks) every call is a silent no-op.
 """
+import math
+import os
+from array import array
+
+import pygame
+from src import config
+from src.utils.settings import get_settings
+
+# Reserved channels
+CHANNEL_BEEP = 0
+CHANNEL_ALARM = 1
+CHANNEL_AMBIENCE = 2
+RESERVED_CHANNELS = 3
+
+# Synthesized tones: name -> (channel, list of (frequency Hz, duration s))
+TONES = {
+    'beep': (CHANNEL_BEEP, [(1000, 0.08)]),
+    'beep_fast': (CHANNEL_BEEP, [(1400, 0.05)]),
+    'error': (CHANNEL_BEEP, [(220, 0.25)]),
+    'ten_seconds_left': (CHANNEL_ALARM, [(1200, 0.1), (0, 0.05), (1200, 0.1)]),
+    'defused': (CHANNEL_ALARM, [(660, 0.12), (880, 0.12), (1320, 0.25)]),
+    'alarm': (CHANNEL_ALARM, [(800, 0.25), (600, 0.25)] * 4),
+}
+
+# Sounds that are muted by the beep_enabled setting
+BEEP_SOUNDS = ('beep', 'beep_fast')
+
+TONE_VOLUME = 0.5
+FADE_MS = 5  # Ramp at each end of a tone, avoids clicks
+
+
+def init_mixer():
+    """Configure the mixer for low latency; call before pygame.init()"""
+    pygame.mixer.pre_init(config.SOUND_FREQUENCY, -16, 1, config.SOUND_BUFFER)
+
+
+def synthesize(segments, frequency, channels):
+    """Signed 16-bit samples of a sequence of (frequency, duration) sine tones"""
+    amplitude = int(32767 * TONE_VOLUME)
+    fade = max(1, frequency * FADE_MS // 1000)
+    samples = array('h')
+    for tone, duration in segments:
+        count = int(frequency * duration)
+        step = 2 * math.pi * tone / frequency
+        for i in range(count):
+            envelope = min(1.0, i / fade, (count - 1 - i) / fade)
+            value = int(amplitude * envelope * math.sin(step * i))
+            for _ in range(channels):
+                samples.append(value)
+    return samples
+
 
 class SoundManager:
     def __init__(self):
         self.enabled = True
         self.sounds = {}
-        
-    def load_sound(self, name, filepath):
-        """Load a sound file (mocked for now)"""
-        print(f"[SOUND] Loading {name} from {filepath}")
-        self.sounds[name] = filepath
-        
-    def play(self, name):
-        """Play a sound (mocked for now)"""
-        if self.enabled and name in self.sounds:
-            print(f"[SOUND] Playing {name}")
-            
+        self.sound_channels = {}
+        self.channels = {}
+        self.available = False
+
+        # Cached settings, kept current by the settings observer
+        settings = get_settings()
+        self.sound_enabled = settings.get('sound_enabled')
+        self.beep_enabled = settings.get('beep_enabled')
+        settings.subscribe(self._on_setting_changed, ('sound_enabled', 'beep_enabled'))
+
+        mixer = pygame.mixer.get_init()
+        if not mixer:
+            return
+        frequency, size, channels = mixer
+        if size != -16:
+            print(f"[SOUND] Unsupported mixer format {size}, sound disabled")
+            return
+
+        pygame.mixer.set_reserved(RESERVED_CHANNELS)
+        for index in (CHANNEL_BEEP, CHANNEL_ALARM, CHANNEL_AMBIENCE):
+            self.channels[index] = pygame.mixer.Channel(index)
+        self.available = True
+
+        for name, (channel, segments) in TONES.items():
+            samples = synthesize(segments, frequency, channels)
+            self.sounds[name] = pygame.mixer.Sound(buffer=samples)
+            self.sound_channels[name] = channel
+
+        for name, (filename, channel) in config.SOUND_FILES.items():
+            self.load_sound(name, os.path.join(config.SOUNDS_DIR, filename), channel)
+
+    def load_sound(self, name, filepath, channel=CHANNEL_AMBIENCE):
+        """Load a sound file once; it is played on the given channel"""
+        if not self.available:
+            return
+        try:
+            self.sounds[name] = pygame.mixer.Sound(filepath)
+            self.sound_channels[name] = channel
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"[SOUND] Could not load {name} from {filepath}: {e}")
+
+    def play(self, name, loops=0):
+        """Play a preloaded sound on its channel, replacing what it was playing"""
+        if not self.enabled or not self.available:
+            return
+        sound = self.sounds.get(name)
+        if sound is None:
+            return
+        if not self.sound_enabled:
+            return
+        if name in BEEP_SOUNDS and not self.beep_enabled:
+            return
+        self.channels[self.sound_channels[name]].play(sound, loops)
+
+    def _on_setting_changed(self, key, value):
+        if key == 'sound_enabled':
+            self.sound_enabled = value
+            if not value:
+                self.stop_all()
+        else:
+            self.beep_enabled = value
+
     def stop(self, name):
-        """Stop a sound (mocked for now)"""
-        if name in self.sounds:
-            print(f"[SOUND] Stopping {name}")
-            
+        """Stop a sound if it is playing"""
+        sound = self.sounds.get(name)
+        if sound is not None:
+            sound.stop()
+
+    def stop_all(self):
+        for channel in self.channels.values():
+            channel.stop()
+
     def set_enabled(self, enabled):
         """Enable or disable sounds"""
         self.enabled = enabled
+        if not enabled:
+            self.stop_all()
         print(f"[SOUND] Sound {'enabled' if enabled else 'disabled'}")
+
+
+# Global sound manager instance
+_sound_manager = None
+
+def get_sound_manager():
+    """Get the global sound manager instance"""
+    global _sound_manager
+    if _sound_manager is None:
+        _sound_manager = SoundManager()
+    return _sound_manager
+
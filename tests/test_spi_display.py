@@ -0,0 +1,53 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from src.hardware.spi_display import CASET, PASET, RAMWR, ILI9486Display, merge_rects
+
+
+class MergeRectsTest(unittest.TestCase):
+    def test_chain_merge(self):
+        # The third rect merges with the first, and the grown window must
+        # then absorb the second, which it now overlaps
+        rects = [pygame.Rect(0, 0, 10, 10), pygame.Rect(30, 0, 10, 10), pygame.Rect(8, 2, 25, 8)]
+        self.assertEqual(merge_rects(rects), [pygame.Rect(0, 0, 40, 10)])
+
+    def test_distant_rects_stay_apart(self):
+        rects = [pygame.Rect(0, 0, 10, 10), pygame.Rect(200, 200, 10, 10)]
+        self.assertEqual(sorted(map(tuple, merge_rects(rects))), [(0, 0, 10, 10), (200, 200, 10, 10)])
+
+
+class ILI9486DisplayTest(unittest.TestCase):
+    def setUp(self):
+        pygame.display.init()
+        self.screen = pygame.Surface((480, 320))
+        self.display = ILI9486Display(self.screen, mock=True)
+        self.spi = self.display.spi
+        self.spi.reset()
+
+    def test_window_bytes(self):
+        self.screen.fill((255, 0, 0))
+        self.display.update([pygame.Rect(10, 20, 3, 2)])
+        self.assertEqual(self.spi.commands(), [CASET, PASET, RAMWR])
+        data = [data for is_data, data in self.spi.transactions if is_data]
+        self.assertEqual(data[0], bytes((0, 10, 0, 12)))
+        self.assertEqual(data[1], bytes((0, 20, 0, 21)))
+        # Big-endian RGB565 red for each of the 6 pixels
+        self.assertEqual(data[2], b"\xf8\x00" * 6)
+
+    def test_chained_rects_sent_once(self):
+        self.display.update([pygame.Rect(0, 0, 10, 10), pygame.Rect(30, 0, 10, 10),
+                             pygame.Rect(8, 2, 25, 8)])
+        self.assertEqual(self.display.windows_sent, 1)
+        self.assertEqual(self.spi.bytes_sent, 11 + 40 * 10 * 2)
+
+    def test_full_frame(self):
+        self.display.update()
+        self.assertEqual(self.spi.bytes_sent, 11 + 480 * 320 * 2)
+        self.assertAlmostEqual(self.spi.bus_time(), self.spi.bytes_sent * 8 / self.spi.max_speed_hz)
+
+
+if __name__ == "__main__":
+    unittest.main()